@@ -0,0 +1,4 @@
+"""
+Benchmarks for the noki-bin-dumpper extraction pipeline.
+Run each module with ``python -m benchmarks.<name>`` from the project root.
+"""
@@ -0,0 +1,107 @@
+"""
+GameData discovery benchmark.
+Builds a synthetic tree of empty .bin files and times finding them with
+Path.glob, with the os.scandir scanner and with its cached listing, plus
+the delay before the first file is handed to the processing.
+
+Usage:
+    python -m benchmarks.bench_discovery [--files 100000] [--per-directory 100] [--runs 3] [--output FILE]
+"""
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+from src.platforms import GameDataScanner
+
+
+def build_tree(root: Path, files: int, per_directory: int) -> None:
+    """
+    Create a GameData-like tree of empty files.
+
+    Directories are nested two levels deep (group/directory), each one
+    holding per_directory .bin files and a few files of other types.
+    """
+    directories = max(1, -(-files // per_directory))
+    created = 0
+    for index in range(directories):
+        directory = root.joinpath(f"group{index // 32:03}", f"dir{index:05}")
+        directory.mkdir(parents=True, exist_ok=True)
+        for extension in ("txt", "meta"):
+            directory.joinpath(f"readme.{extension}").touch()
+        for _ in range(min(per_directory, files - created)):
+            directory.joinpath(f"file{created:06}.bin").touch()
+            created += 1
+
+
+def measure(iterate: Callable[[], Iterator], runs: int) -> Dict[str, float]:
+    """
+    Time a discovery function, keeping the best run.
+
+    Returns:
+        Dict: Seconds to the first file and to the whole listing, and the file count
+    """
+    best: Dict[str, float] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        first = None
+        count = 0
+        for _path in iterate():
+            if first is None:
+                first = time.perf_counter() - start
+            count += 1
+        total = time.perf_counter() - start
+        if not best or total < best["seconds"]:
+            best = {"first_file_seconds": first or 0.0, "seconds": total, "files": count}
+    return best
+
+
+def main():
+    """Build the tree, run the scenarios and print the results."""
+    parser = argparse.ArgumentParser(description='GameData discovery benchmark')
+    parser.add_argument('--files', type=int, default=100000, help='.bin files in the synthetic tree (default: 100000)')
+    parser.add_argument('--per-directory', type=int, default=100, help='.bin files per directory (default: 100)')
+    parser.add_argument('--runs', type=int, default=3, help='Runs per scenario, the best one is kept (default: 3)')
+    parser.add_argument('--output', default=None, help='Optional JSON results file')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        root = Path(temp_dir, "GameData")
+        start = time.perf_counter()
+        build_tree(root, args.files, args.per_directory)
+        print(f"Built {args.files} files in {time.perf_counter() - start:.1f} s")
+
+        cache_path = Path(temp_dir, "listing.json")
+        # Warm the listing cache, as a previous run would have
+        for _path in GameDataScanner(cache_path).scan(root):
+            pass
+
+        # The extraction stats every file found: glob needs one more call
+        # per file, the scanner carries the stat of its walk
+        scenarios = {
+            "glob": lambda: root.glob("**/*.bin"),
+            "glob_stat": lambda: (path for path in root.glob("**/*.bin") if path.stat()),
+            "scandir": lambda: GameDataScanner().scan(root),
+            "scandir_stat": lambda: (path for path in GameDataScanner().scan(root) if path.stat()),
+            "cached_listing": lambda: GameDataScanner(cache_path).scan(root),
+            "cached_listing_stat": lambda: (path for path in GameDataScanner(cache_path).scan(root) if path.stat()),
+        }
+        results = {name: measure(iterate, args.runs) for name, iterate in scenarios.items()}
+
+    baseline = results["glob"]["seconds"]
+    for name, data in results.items():
+        print(
+            f"{name:<20} {data['seconds'] * 1000:>8.1f} ms   first file {data['first_file_seconds'] * 1000:>7.2f} ms"
+            f"   {baseline / data['seconds']:>5.1f}x   ({data['files']} files)"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
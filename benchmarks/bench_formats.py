@@ -0,0 +1,92 @@
+"""
+Benchmark of the document output formats.
+Writes a synthetic items-like document as JSON and in every installed
+binary format, then reports write time, read time (load_document) and
+size against the pretty (historical) JSON output.
+
+Usage:
+    python -m benchmarks.bench_formats [--size 16M] [--repeat 3]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Tuple
+
+from src.utils.BinarySerializer import BinarySerializer
+from src.utils.Converter import Converter
+from src.utils.Loader import load_document
+from src.utils.Serializer import JsonSerializer
+
+from .corpus import make_xml, parse_size
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Get the best time of several runs of a function."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(write: Callable[[Path], None], path: Path, repeat: int) -> Tuple[float, float, int]:
+    """
+    Write and read back a document several times.
+
+    Returns:
+        Tuple: Best write time, best read time and size of the file in bytes
+    """
+    write_time = best_time(lambda: write(path), repeat)
+    read_time = best_time(lambda: load_document(path), repeat)
+    return write_time, read_time, path.stat().st_size
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description='Document format benchmark')
+    parser.add_argument('--size', default='16M', help='Size of the synthetic XML (default: 16M)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per format (default: 3)')
+    args = parser.parse_args()
+
+    xml = make_xml(parse_size(args.size))
+    source = Path("items.bin")
+    available = BinarySerializer.available_formats()
+
+    # Writers receive the destination path, like the extraction pipeline
+    writers = {}
+    for style in ("pretty", "compact"):
+        converter = Converter(JsonSerializer(style))
+        writers[f"json {style}"] = (
+            lambda path, converter=converter: converter.write_json(xml, source, path), ".json"
+        )
+
+    converter = Converter()
+    for file_format in BinarySerializer.FORMATS:
+        if not available[file_format]:
+            print(f"{file_format} is not installed, skipped")
+            continue
+        for compress in ((False, True) if available["zstd"] else (False,)):
+            serializer = BinarySerializer(file_format, compress)
+            name = file_format + (" zstd" if compress else "")
+            writers[name] = (
+                lambda path, serializer=serializer: converter.write_binary(xml, source, path, serializer),
+                serializer.extension
+            )
+
+    print(f"{'format':>13} {'write s':>8} {'read s':>8} {'size MB':>8} {'size':>6}")
+    with tempfile.TemporaryDirectory(prefix="noki-bench-") as temp:
+        baseline_size = None
+        for name, (write, extension) in writers.items():
+            path = Path(temp).joinpath(name.replace(' ', '-') + extension)
+            write_time, read_time, size = measure(write, path, args.repeat)
+            baseline_size = baseline_size or size
+            print(
+                f"{name:>13} {write_time:>8.2f} {read_time:>8.2f} "
+                f"{size / 2 ** 20:>8.2f} {size * 100 // baseline_size:>5}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark of the JSON output styles and backends.
+Converts a synthetic items-like document with every available style and
+backend and reports conversion time and output size against the
+historical path (xmltodict.parse followed by json.dump with indent=4).
+
+Usage:
+    python -m benchmarks.bench_json [--size 16M] [--repeat 3]
+"""
+import argparse
+import io
+import json
+import time
+from typing import Callable, TextIO
+
+import xmltodict
+
+from src.utils.Serializer import JsonSerializer
+from src.utils.StreamingConverter import StreamingConverter
+
+from .corpus import make_xml, parse_size
+
+
+def historical_convert(xml: bytes, output: TextIO) -> None:
+    """Convert a document the way the extraction did before the streaming converter."""
+    json.dump(xmltodict.parse(xml), output, indent=4, ensure_ascii=False)
+
+
+def measure(convert: Callable[[bytes, TextIO], None], xml: bytes, repeat: int):
+    """
+    Convert the document several times.
+
+    Returns:
+        Tuple: Best time in seconds and size of the output in bytes
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        output = io.StringIO()
+        start = time.perf_counter()
+        convert(xml, output)
+        best = min(best, time.perf_counter() - start)
+    return best, len(output.getvalue().encode('utf-8'))
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description='JSON style/backend benchmark')
+    parser.add_argument('--size', default='16M', help='Size of the synthetic XML (default: 16M)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per combination (default: 3)')
+    args = parser.parse_args()
+
+    xml = make_xml(parse_size(args.size))
+    backends = [name for name, available in JsonSerializer.available_backends().items() if available]
+
+    baseline_time, baseline_size = measure(historical_convert, xml, args.repeat)
+
+    print(f"{'style':>8} {'backend':>9} {'seconds':>8} {'speedup':>8} {'size MB':>8} {'size':>6}")
+    print(f"{'pretty':>8} {'xmltodict':>9} {baseline_time:>8.2f} {1:>7.2f}x {baseline_size / 2 ** 20:>8.2f} {100:>5}%")
+    rows = [("pretty", "json")] + [(style, backend) for style in ("compact", "ndjson") for backend in backends]
+    for style, backend in rows:
+        elapsed, size = measure(StreamingConverter(JsonSerializer(style, backend)).convert, xml, args.repeat)
+        print(
+            f"{style:>8} {backend:>9} {elapsed:>8.2f} {baseline_time / elapsed:>7.2f}x "
+            f"{size / 2 ** 20:>8.2f} {size * 100 // baseline_size:>5}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Cold-start benchmark of the command line entry point.
+Runs main.py in fresh interpreters with ``-X importtime`` and reports the
+wall time of an argument error, of --help and of importing the application
+package, plus the slowest imports.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 5] [--top 10] [--output FILE]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Commands timed, relative to the project root
+SCENARIOS = {
+    "argument_error": ["main.py", "--path", "/nonexistent-albion-path"],
+    "help": ["main.py", "--help"],
+    "import_package": ["-c", "import src"],
+}
+
+
+def run_once(arguments: List[str]) -> Tuple[float, str]:
+    """
+    Run a scenario in a fresh interpreter.
+
+    Returns:
+        Tuple: Wall time in seconds and the importtime report (stderr)
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1", NOKI_NO_UPDATE_CHECK="1")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        cwd=ROOT_DIR, env=env, capture_output=True, text=True
+    )
+    return time.perf_counter() - start, result.stderr
+
+
+def parse_importtime(report: str) -> Dict[str, int]:
+    """
+    Parse an ``-X importtime`` report.
+
+    Returns:
+        Dict: Cumulative microseconds of each top-level import
+    """
+    imports = {}
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        # Top-level imports are not indented
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def main():
+    """Run the scenarios and print the results."""
+    parser = argparse.ArgumentParser(description='CLI cold-start benchmark')
+    parser.add_argument('--runs', type=int, default=5, help='Runs per scenario, the best one is kept (default: 5)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest imports to list (default: 10)')
+    parser.add_argument('--output', default=None, help='Optional JSON results file')
+    args = parser.parse_args()
+
+    results = {}
+    for name, arguments in SCENARIOS.items():
+        runs = [run_once(arguments) for _ in range(args.runs)]
+        best_time, report = min(runs, key=lambda run: run[0])
+        imports = parse_importtime(report)
+        results[name] = {
+            "seconds": best_time,
+            "import_seconds": sum(imports.values()) / 1e6,
+            "slowest_imports": dict(sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]),
+        }
+
+    for name, data in results.items():
+        print(f"{name:<16} wall {data['seconds'] * 1000:>7.1f} ms   imports {data['import_seconds'] * 1000:>7.1f} ms")
+        for module, micros in data["slowest_imports"].items():
+            print(f"    {micros / 1000:>7.1f} ms  {module}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=4)
+        print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Synthetic corpus generation for the benchmarks.
+Builds encrypted .bin payloads with the same key, IV and gzip framing as
+the game files so every stage of the pipeline can be measured offline.
+"""
+import gzip
+import math
+import random
+from pathlib import Path
+from typing import List
+from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+
+from src.core.Config import Config
+
+# TripleDES block size in bytes
+BLOCK_SIZE = 8
+
+
+def parse_size(value: str) -> int:
+    """Parse sizes like 512, 64K or 16M into bytes."""
+    units = {"K": 1024, "M": 1024 * 1024}
+    value = value.strip().upper()
+    if value[-1] in units:
+        return int(value[:-1]) * units[value[-1]]
+    return int(value)
+
+
+def make_xml(target_size: int, seed: int = 0) -> bytes:
+    """
+    Build an items-like XML document of roughly the given size.
+
+    Args:
+        target_size: Approximate size of the document in bytes
+        seed: Random seed so runs are reproducible
+
+    Returns:
+        bytes: UTF-8 XML document with a BOM, like the game files
+    """
+    rng = random.Random(seed)
+    parts = ['\ufeff<?xml version="1.0" encoding="utf-8"?>\n<items>\n']
+    size = len(parts[0])
+    index = 0
+
+    while size < target_size:
+        tier = rng.randint(1, 8)
+        item = (
+            f'  <equipmentitem uniquename="T{tier}_ITEM_{index}" tier="{tier}" '
+            f'weight="{rng.random():.3f}" itemvalue="{rng.randint(1, 100000)}">\n'
+            f'    <craftingrequirements silver="{rng.randint(0, 5000)}">\n'
+            f'      <craftresource uniquename="T{tier}_PLANKS" count="{rng.randint(1, 32)}" />\n'
+            f'    </craftingrequirements>\n'
+            f'  </equipmentitem>\n'
+        )
+        parts.append(item)
+        size += len(item)
+        index += 1
+
+    parts.append('</items>\n')
+    return ''.join(parts).encode('utf-8')
+
+
+def encrypt(xml: bytes) -> bytes:
+    """
+    Compress and encrypt a document the way the game ships its .bin files.
+
+    Args:
+        xml: Plain XML content
+
+    Returns:
+        bytes: Encrypted .bin content
+    """
+    compressed = gzip.compress(xml)
+    compressed += b'\x00' * (-len(compressed) % BLOCK_SIZE)
+
+    encryptor = Cipher(TripleDES(Config.ENCRYPTION_KEY), modes.CBC(Config.ENCRYPTION_IV)).encryptor()
+    return encryptor.update(compressed) + encryptor.finalize()
+
+
+def make_payload(target_size: int, seed: int = 0) -> bytes:
+    """
+    Build an encrypted .bin payload whose XML is roughly the given size.
+
+    Args:
+        target_size: Approximate size of the decrypted XML in bytes
+        seed: Random seed so runs are reproducible
+
+    Returns:
+        bytes: Encrypted .bin content
+    """
+    return encrypt(make_xml(target_size, seed))
+
+
+def write_corpus(directory: Path, files: int, min_size: int, max_size: int, seed: int = 0) -> List[Path]:
+    """
+    Write a GameData-like tree of encrypted .bin files.
+
+    Sizes are spread log-uniformly between min_size and max_size, so the
+    corpus mixes many small files with a few large ones like the game does.
+
+    Args:
+        directory: Directory that receives the files
+        files: Number of files to create
+        min_size: Smallest decrypted XML size in bytes
+        max_size: Largest decrypted XML size in bytes
+        seed: Random seed so runs are reproducible
+
+    Returns:
+        List[Path]: Paths of the created .bin files
+    """
+    rng = random.Random(seed)
+    paths = []
+
+    for index in range(files):
+        size = int(math.exp(rng.uniform(math.log(min_size), math.log(max_size))))
+        path = directory.joinpath(f"group{index % 4}", f"file{index:05d}.bin")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(make_payload(size, seed + index))
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,258 @@
+"""
+Benchmark suite for the decrypt/convert/write pipeline.
+Generates a synthetic encrypted corpus and times every stage of the
+extraction separately, reporting throughput and peak memory. Results are
+saved as JSON so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.run [--files 40] [--min-size 16K] [--max-size 8M]
+                             [--repeat 3] [--output FILE] [--compare FILE]
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.core.Config import Config
+from src.utils.Converter import Converter
+from src.utils.Crypto import BinaryDecryptor
+
+from .corpus import parse_size, write_corpus
+
+# Stages in pipeline order
+STAGES = ["read", "decrypt", "convert", "write_xml", "write_json"]
+
+# Default directory of the saved results
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class PipelineBenchmark:
+    """
+    Runs each pipeline stage over the whole corpus and measures it.
+
+    Every stage gets the output of the previous one, prepared beforehand,
+    so its timing only covers its own work.
+    """
+
+    def __init__(self, bin_files: List[Path], work_dir: Path):
+        """
+        Initialize the benchmark.
+
+        Args:
+            bin_files: Encrypted .bin files of the corpus
+            work_dir: Directory receiving the XML/JSON outputs
+        """
+        self.bin_files = bin_files
+        self.work_dir = work_dir
+        self.decryptor = BinaryDecryptor()
+        self.converter = Converter()
+
+        # Inputs of each stage, filled by prepare()
+        self.encrypted: List[bytes] = []
+        self.decrypted: List[bytes] = []
+
+    def prepare(self) -> None:
+        """Compute the input of every stage once."""
+        self.encrypted = [path.read_bytes() for path in self.bin_files]
+        self.decrypted = [self.decryptor.decrypt_bin(data) for data in self.encrypted]
+
+    def output_path(self, index: int, suffix: str) -> Path:
+        """Get the output path of a corpus file."""
+        return self.work_dir.joinpath(f"{index:05d}{suffix}")
+
+    def stages(self) -> Dict[str, Callable[[int], Any]]:
+        """
+        Get the function running each stage for one file.
+
+        Returns:
+            Dict: Stage name to a function receiving the file index
+        """
+        def write_xml(index: int) -> None:
+            # Corpus documents start with the UTF-8 BOM, dropped like the pipeline does
+            with open(self.output_path(index, '.xml'), 'wb') as f:
+                f.write(memoryview(self.decrypted[index])[3:])
+
+        return {
+            "read": lambda index: self.bin_files[index].read_bytes(),
+            "decrypt": lambda index: self.decryptor.decrypt_bin(self.encrypted[index]),
+            "convert": lambda index: self.converter.convert_to_json(self.decrypted[index], self.bin_files[index]),
+            "write_xml": write_xml,
+            "write_json": lambda index: self.converter.write_json(
+                self.decrypted[index], self.bin_files[index], self.output_path(index, '.json')
+            ),
+        }
+
+    def stage_bytes(self, stage: str) -> int:
+        """
+        Get the number of bytes consumed by a stage over the corpus.
+
+        Throughput of read and decrypt is measured on the encrypted size,
+        the other stages on the decrypted XML size.
+        """
+        if stage in ("read", "decrypt"):
+            return sum(len(data) for data in self.encrypted)
+        return sum(len(data) for data in self.decrypted)
+
+    def run_stage(self, stage: str, repeat: int) -> Dict[str, Any]:
+        """
+        Measure a stage over the whole corpus.
+
+        Args:
+            stage: Stage name
+            repeat: Number of timed runs, the best one is kept
+
+        Returns:
+            Dict: Time, throughput and peak memory of the stage
+        """
+        function = self.stages()[stage]
+        files = len(self.bin_files)
+
+        # Timed runs without tracing, which would skew the timings
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for index in range(files):
+                function(index)
+            best = min(best, time.perf_counter() - start)
+
+        # Separate traced run for the peak memory of a single file
+        peak = 0
+        tracemalloc.start()
+        for index in range(files):
+            tracemalloc.reset_peak()
+            function(index)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+        size = self.stage_bytes(stage)
+        return {
+            "seconds": best,
+            "bytes": size,
+            "mb_per_s": size / 2 ** 20 / best if best else None,
+            "files_per_s": files / best if best else None,
+            "peak_bytes": peak,
+        }
+
+    def run(self, repeat: int, stages: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Measure the selected stages.
+
+        Args:
+            repeat: Number of timed runs per stage
+            stages: Stages to run (default: all)
+
+        Returns:
+            Dict: Results of each stage
+        """
+        self.prepare()
+        return {stage: self.run_stage(stage, repeat) for stage in (stages or STAGES)}
+
+
+def git_commit() -> Optional[str]:
+    """Get the current git commit, if available."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        )
+        return result.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_results(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Print the results table, with the change against a baseline if given.
+
+    Args:
+        results: Results of the current run
+        baseline: Results of a previous run
+    """
+    header = f"{'stage':<11} {'seconds':>8} {'MB/s':>9} {'files/s':>9} {'peak MB':>8}"
+    if baseline:
+        header += f" {'vs base':>8}"
+    print(header)
+
+    for stage, data in results["stages"].items():
+        line = (
+            f"{stage:<11} {data['seconds']:>8.3f} {data['mb_per_s']:>9.1f} "
+            f"{data['files_per_s']:>9.1f} {data['peak_bytes'] / 2 ** 20:>8.1f}"
+        )
+        previous = (baseline or {}).get("stages", {}).get(stage)
+        if previous:
+            change = (data["seconds"] - previous["seconds"]) / previous["seconds"] * 100
+            line += f" {change:>+7.1f}%"
+        print(line)
+
+
+def main():
+    """Generate the corpus, run the suite and save the results."""
+    parser = argparse.ArgumentParser(description='Extraction pipeline benchmark suite')
+    parser.add_argument('--files', type=int, default=40, help='Number of synthetic files (default: 40)')
+    parser.add_argument('--min-size', default='16K', help='Smallest decrypted file size (default: 16K)')
+    parser.add_argument('--max-size', default='8M', help='Largest decrypted file size (default: 8M)')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus random seed (default: 0)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per stage (default: 3)')
+    parser.add_argument('--stages', default=','.join(STAGES), help='Comma-separated stages to run (default: all)')
+    parser.add_argument('--output', default=None, help='Results file (default: benchmarks/results/<date>-<commit>.json)')
+    parser.add_argument('--compare', default=None, help='Previous results file to compare against')
+    args = parser.parse_args()
+
+    stages = [stage.strip() for stage in args.stages.split(',')]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        parser.error(f"Unknown stages: {', '.join(unknown)}. Available: {', '.join(STAGES)}")
+
+    with tempfile.TemporaryDirectory(prefix="noki-bench-") as temp:
+        corpus_dir = Path(temp) / "GameData"
+        work_dir = Path(temp) / "output"
+        work_dir.mkdir()
+
+        bin_files = write_corpus(
+            corpus_dir, args.files, parse_size(args.min_size), parse_size(args.max_size), args.seed
+        )
+        stage_results = PipelineBenchmark(bin_files, work_dir).run(args.repeat, stages)
+
+    results = {
+        "meta": {
+            "version": Config.VERSION,
+            "commit": git_commit(),
+            "date": datetime.now().isoformat(timespec='seconds'),
+            "python": sys.version.split()[0],
+            "platform": f"{platform.system()}-{platform.machine()}",
+            "corpus": {
+                "files": args.files,
+                "min_size": args.min_size,
+                "max_size": args.max_size,
+                "seed": args.seed,
+            },
+            "repeat": args.repeat,
+        },
+        "stages": stage_results,
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    print_results(results, baseline)
+
+    output = Path(args.output) if args.output else RESULTS_DIR.joinpath(
+        f"{datetime.now():%Y%m%d-%H%M%S}-{results['meta']['commit'] or 'local'}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,17 +11,20 @@ os.environ["PYTHONDONTWRITEBYTECODE"] = "1"
 
 import io
 import argparse
+import threading
 from pathlib import Path
-from rich.markdown import Markdown
 
 # Force UTF-8 for console output to handle special characters properly
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
-from src import Config, Terminal, Platform, ServerType
+# The application package (pydantic, rich, cryptography...) is only imported
+# once the arguments are valid, so --help and argument errors return instantly.
 
 def setup_environment():
     """Configure the environment and initialize paths."""
+    from src import Config
+    
     # Set root path environment variable
     root_path = os.path.dirname(os.path.abspath(__file__))
     os.environ["AONOKI-DUMPPER-PATH"] = root_path
@@ -39,14 +42,14 @@ def parse_arguments():
     parser.add_argument(
         '--path', 
         required=True, 
-        help='Albion Online installation path'
+        help='Albion Online installation path, or a zip/tar snapshot of it or of its GameData'
     )
     
     parser.add_argument(
         '--server', 
-        choices=['live', 'test'], 
+        choices=['live', 'test', 'both'], 
         default='live',
-        help='Game Server to export the files (default: live)'
+        help='Game Server to export the files, both writes live/ and test/ sharing identical files (default: live)'
     )
     
     parser.add_argument(
@@ -55,13 +58,259 @@ def parse_arguments():
         help='Output directory (optional)'
     )
     
-    return parser.parse_args()
+    parser.add_argument(
+        '--workers', 
+        type=int, 
+        default=1,
+        help='Number of worker processes (default: 1, 0 = one per CPU core)'
+    )
+    
+    parser.add_argument(
+        '--io-threads', 
+        type=int, 
+        default=2,
+        help='Writer threads overlapping reads/writes with processing when --workers is 1 (default: 2, 0 = off)'
+    )
+    
+    parser.add_argument(
+        '--force', 
+        action='store_true',
+        help='Process every file, even if unchanged since the last extraction'
+    )
+    
+    parser.add_argument(
+        '--watch', 
+        action='store_true',
+        help='Keep running and re-extract the files changed by game updates'
+    )
+    
+    parser.add_argument(
+        '--debounce', 
+        type=float, 
+        default=2.0,
+        help='Seconds without new writes before changed files are re-extracted in --watch mode (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--json-style', 
+        choices=['pretty', 'compact', 'ndjson'], 
+        default='pretty',
+        help='JSON output style: indented, single line or one line per record (default: pretty)'
+    )
+    
+    parser.add_argument(
+        '--outputs', 
+        default='xml,json',
+        help='Comma-separated files written for each document: xml, json (default: xml,json)'
+    )
+    
+    parser.add_argument(
+        '--format', 
+        choices=['json', 'msgpack', 'cbor'], 
+        default='json',
+        help='Format of the converted documents (default: json, msgpack/cbor need the [binary] extra)'
+    )
+    
+    parser.add_argument(
+        '--zstd', 
+        action='store_true',
+        help='Compress msgpack/cbor documents with zstd'
+    )
+    
+    parser.add_argument(
+        '--profile', 
+        action='store_true',
+        help='Measure time and memory of every stage and write profile.json to the output directory'
+    )
+    
+    parser.add_argument(
+        '--sqlite', 
+        action='store_true',
+        help='Also export every document to gamedata.db (SQLite) in the output directory'
+    )
+    
+    parser.add_argument(
+        '--columnar', 
+        choices=['parquet', 'arrow'], 
+        default=None,
+        help='Also write one table per element type to columnar/ as Parquet or Arrow IPC (requires pyarrow)'
+    )
+    
+    parser.add_argument(
+        '--store', 
+        default=None,
+        help='Content-addressed store: outputs are written once there and hard-linked into the output directory'
+    )
+    
+    parser.add_argument(
+        '--output-archive', 
+        default=None,
+        help='Write the output tree into a single .zip/.tar/.tar.gz/.tar.zst archive, or - for a tar stream on stdout'
+    )
+    
+    parser.add_argument(
+        '--strings', 
+        action='store_true',
+        help='Also compile localization.bin into a memory-mappable string table (localization.strings)'
+    )
+    
+    parser.add_argument(
+        '--index', 
+        action='store_true',
+        help='Also build a lookup index of the XML elements in index/ (serve it with python -m src.index)'
+    )
+    
+    parser.add_argument(
+        '--listing-cache', 
+        action='store_true',
+        help='Cache the GameData listing between runs, re-reading only the directories whose mtime changed'
+    )
+    
+    parser.add_argument(
+        '--no-update-check', 
+        action='store_true',
+        help='Skip the check for new releases (also disabled by NOKI_NO_UPDATE_CHECK=1)'
+    )
+    
+    args = parser.parse_args()
+    
+    # Validate Albion Online path
+    if not Path(args.path).exists():
+        parser.error(f"Albion Online installation path not found: {args.path}")
+    
+    args.outputs = [output.strip() for output in args.outputs.split(',') if output.strip()]
+    unknown = [output for output in args.outputs if output not in ('xml', 'json')]
+    if unknown or not args.outputs:
+        parser.error(f"--outputs must list xml and/or json, got: {', '.join(unknown) or 'nothing'}")
+    
+    if args.zstd and args.format == 'json':
+        parser.error("--zstd is only available with --format msgpack or cbor")
+    
+    if args.watch and args.server == 'both':
+        parser.error("--watch follows a single server, use --server live or test")
+    
+    if args.watch and Path(args.path).is_file():
+        parser.error("--watch follows an installation directory, not a snapshot archive")
+    
+    if args.workers < 0:
+        parser.error("--workers must be 0 or more")
+    
+    if args.io_threads < 0:
+        parser.error("--io-threads must be 0 or more")
+    
+    if args.debounce < 0:
+        parser.error("--debounce can't be negative")
+    
+    if args.index and 'xml' not in args.outputs:
+        parser.error("--index needs the xml output")
+    
+    if args.output_archive is not None:
+        conflicts = {
+            '--sqlite': args.sqlite, '--columnar': args.columnar, '--index': args.index,
+            '--store': args.store, '--strings': args.strings, '--watch': args.watch, '--server both': args.server == 'both'
+        }
+        enabled = [name for name, value in conflicts.items() if value]
+        if enabled:
+            parser.error(f"--output-archive can't be combined with {', '.join(enabled)}")
+    
+    return args
 
-def check_update():
-    """Check for updates and display notification if available."""
-    update_info = Config.check_for_updates()
+def parse_diff_arguments(argv):
+    """Parse the arguments of the diff subcommand."""
+    parser = argparse.ArgumentParser(
+        prog='main diff',
+        description='Compare two extraction outputs or two GameData directories'
+    )
+    
+    parser.add_argument('old', help='Previous build: extraction output or GameData directory')
+    parser.add_argument('new', help='Current build: extraction output or GameData directory')
+    
+    parser.add_argument(
+        '--output', 
+        default=None,
+        help='File the changeset is written to (default: standard output)'
+    )
+    
+    parser.add_argument(
+        '--workers', 
+        type=int, 
+        default=1,
+        help='Number of worker processes diffing the changed files (default: 1, 0 = one per CPU core)'
+    )
+    
+    args = parser.parse_args(argv)
+    
+    for path in (args.old, args.new):
+        if not Path(path).is_dir():
+            parser.error(f"Directory not found: {path}")
+    
+    if args.workers < 0:
+        parser.error("--workers must be 0 or more")
+    
+    return args
+
+def run_diff(argv):
+    """Entry point of the diff subcommand."""
+    args = parse_diff_arguments(argv)
+    
+    setup_environment()
+    
+    import json
+    from src import logger
+    from src.diff import BuildDiff
+    
+    try:
+        changeset = BuildDiff(Path(args.old), Path(args.new), args.workers or os.cpu_count() or 1).run()
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+    
+    if args.output is None:
+        json.dump(changeset, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(changeset, f, ensure_ascii=False, indent=2)
+        summary = changeset["summary"]
+        logger.info(
+            f"{summary['changed']} changed, {summary['added']} added, {summary['removed']} removed: {args.output}"
+        )
+
+def start_update_check(args):
+    """
+    Start the update check in a background thread.
+    
+    Returns:
+        tuple: The thread and the dict receiving its result, or None if disabled
+    """
+    if args.no_update_check or os.environ.get("NOKI_NO_UPDATE_CHECK"):
+        return None
+    
+    from src import Config
+    
+    result = {}
+    thread = threading.Thread(
+        target=lambda: result.update(info=Config.check_for_updates()),
+        name="update-check",
+        daemon=True
+    )
+    thread.start()
+    return thread, result
+
+def check_update(update_check, timeout=0.5):
+    """Display the update notification if the background check found one."""
+    if update_check is None:
+        return
+    
+    # Never hold the exit for a slow network
+    thread, result = update_check
+    thread.join(timeout)
+    update_info = result.get("info")
 
     if update_info:
+        from rich.markdown import Markdown
+        from src import Terminal
+        
         Terminal.print(f"====================================================")
         Terminal.print(f"New version available: v{update_info['latest_version']} (current: v{update_info['current_version']})")
         Terminal.print(f"Download: {update_info['release_url']}")
@@ -74,43 +323,68 @@ def check_update():
 
 def run():
     """Main entry point for the application."""
+    if len(sys.argv) > 1 and sys.argv[1] == 'diff':
+        run_diff(sys.argv[2:])
+        return
+    
+    # Parse command line arguments
+    args = parse_arguments()
+    
     # Setup environment
     setup_environment()
     
-    # Display application banner
-    Terminal.print(Config.create_banner())
+    from src import Config, Terminal, Platform, ServerType
     
-    # Check for updates
-    check_update()
+    # Standard output carries the archive, messages go to standard error
+    if args.output_archive == '-':
+        Terminal.file = sys.stderr
     
-    # Parse command line arguments
-    args = parse_arguments()
+    # Display application banner
+    Terminal.print(Config.create_banner())
     
-    # Validate Albion Online path
-    albion_path = Path(args.path)
-    if not albion_path.exists():
-        Terminal.print(f"Albion Online installation path not found: {albion_path}")
-        sys.exit(1)
+    # Check for updates without blocking the extraction
+    update_check = start_update_check(args)
     
     # Configure output directory
+    albion_path = Path(args.path)
     output_dir = args.output
     if output_dir is None:
         output_dir = Config.OUTPUT_DIR
     else:
         output_dir = Path(output_dir)
-        os.makedirs(output_dir, exist_ok=True)
+        if args.output_archive is None:
+            os.makedirs(output_dir, exist_ok=True)
     
     # Set server type
-    server_type = ServerType.LIVE if args.server == 'live' else ServerType.TEST
+    server_type = ServerType.TEST if args.server == 'test' else ServerType.LIVE
     
     # Initialize platform and run extraction
     platform = Platform()
     platform.set_albion_path(albion_path)
     platform.set_server_type(server_type)
+    platform.set_both_servers(args.server == 'both')
     platform.set_output_path(output_dir)
+    platform.set_workers(args.workers)
+    platform.set_io_threads(args.io_threads)
+    platform.set_force(args.force)
+    platform.set_watch(args.watch, args.debounce)
+    platform.set_json_style(args.json_style)
+    platform.set_output_format(args.format, args.zstd)
+    platform.set_outputs(args.outputs)
+    platform.set_profile(args.profile)
+    platform.set_sqlite(args.sqlite)
+    platform.set_columnar(args.columnar)
+    platform.set_index(args.index)
+    platform.set_strings(args.strings)
+    platform.set_store(Path(args.store) if args.store else None)
+    platform.set_listing_cache(args.listing_cache)
+    platform.set_archive_output(args.output_archive)
     
     # Run extraction process
     platform.run_extraction()
+    
+    # Display update notification, if any
+    check_update(update_check)
 
 if __name__ == "__main__":
     run()
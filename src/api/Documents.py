@@ -0,0 +1,207 @@
+"""
+In-memory document API for Noki Bin Dumpper.
+Yields the decrypted XML and the converted dict of each .bin file
+without writing anything to disk.
+"""
+import codecs
+import asyncio
+import fnmatch
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, AsyncIterator, Deque, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+from ..enums import ServerType
+from ..platforms import PlatformHandler, GameDataArchive, ArchiveMember
+from ..utils import BinaryDecryptor, Converter
+
+# A .bin file of GameData and its path relative to GameData
+_Source = Tuple[Union[Path, ArchiveMember], str]
+
+
+class Document(NamedTuple):
+    """A decrypted game document."""
+
+    path: str
+    xml: bytes
+    data: Optional[Dict[str, Any]]
+
+
+def find_game_data(path: Union[str, Path], server: ServerType = ServerType.LIVE) -> Union[Path, GameDataArchive]:
+    """
+    Find the GameData directory from an installation, a GameData directory or a snapshot.
+
+    Args:
+        path: Albion Online installation, GameData directory, or zip/tar snapshot of either
+        server: Server whose GameData is used in an installation
+
+    Returns:
+        Path: GameData directory, or the archive holding it
+
+    Raises:
+        FileNotFoundError: If the path doesn't exist
+    """
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(f"Path not found: {path}")
+
+    if GameDataArchive.is_archive(path) or path.joinpath(server.folder_name).is_dir():
+        return PlatformHandler().find_game_data_path(path, server.value)
+    return path
+
+
+def iter_documents(
+    path: Union[str, Path],
+    server: ServerType = ServerType.LIVE,
+    include: Optional[Iterable[str]] = None,
+    parse: bool = True,
+    workers: int = 1,
+    buffer: Optional[int] = None
+) -> Iterator[Document]:
+    """
+    Decrypt and convert the documents of a GameData directory lazily.
+
+    Documents are produced one at a time as the iterator is consumed,
+    sorted by path (in archive order for a snapshot, which can then be
+    read in a single pass). With workers, the files are processed ahead across a
+    process pool, holding at most `buffer` documents in memory.
+
+    Args:
+        path: Albion Online installation, GameData directory, or zip/tar snapshot of either
+        server: Server whose GameData is used in an installation
+        include: Glob patterns of the documents to load, matched against
+            their path relative to GameData with or without .bin
+            (e.g. "items", "cluster/*"); default: every document
+        parse: Whether the XML is also converted to a dict (data is None otherwise)
+        workers: Number of worker processes (1 = in the calling thread)
+        buffer: Maximum number of documents processed ahead (default: 2 per worker)
+
+    Yields:
+        Document: Path relative to GameData, XML bytes without BOM and converted dict
+    """
+    sources = _find_sources(find_game_data(path, server), include)
+
+    if workers <= 1:
+        for bin_file, key in sources:
+            yield _load_source(bin_file, key, parse)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from _iter_ahead(executor, sources, parse, buffer or 2 * workers)
+
+
+async def aiter_documents(
+    path: Union[str, Path],
+    server: ServerType = ServerType.LIVE,
+    include: Optional[Iterable[str]] = None,
+    parse: bool = True,
+    executor: Optional[Executor] = None,
+    buffer: int = 4
+) -> AsyncIterator[Document]:
+    """
+    Asynchronous variant of iter_documents.
+
+    The listing, decryption and conversion run in an executor so the event
+    loop is never blocked; at most `buffer` documents are processed ahead.
+
+    Args:
+        path: Albion Online installation, GameData directory, or zip/tar snapshot of either
+        server: Server whose GameData is used in an installation
+        include: Glob patterns of the documents to load (see iter_documents)
+        parse: Whether the XML is also converted to a dict
+        executor: Executor running the work (default: the loop's thread pool;
+            a ProcessPoolExecutor spreads it across processes)
+        buffer: Maximum number of documents processed ahead
+
+    Yields:
+        Document: Path relative to GameData, XML bytes without BOM and converted dict
+    """
+    loop = asyncio.get_running_loop()
+    game_data = await loop.run_in_executor(None, find_game_data, path, server)
+    sources = await loop.run_in_executor(None, _find_sources, game_data, include)
+
+    pending: Deque[asyncio.Future] = deque()
+    remaining = iter(sources)
+    try:
+        while True:
+            for bin_file, key in remaining:
+                pending.append(loop.run_in_executor(executor, _load_source, bin_file, key, parse))
+                if len(pending) >= max(buffer, 1):
+                    break
+
+            if not pending:
+                return
+            yield await pending.popleft()
+    finally:
+        # The consumer stopped early, drop the documents processed ahead
+        for future in pending:
+            future.cancel()
+
+
+def _load_source(bin_file: Union[Path, ArchiveMember], key: str, parse: bool = True) -> Document:
+    """
+    Decrypt and convert a single .bin file.
+
+    Args:
+        bin_file: Source .bin file (or archive member)
+        key: Path of the file relative to GameData
+        parse: Whether the XML is also converted to a dict
+
+    Returns:
+        Document: The decrypted document
+    """
+    content = _tools.decryptor.decrypt_bin(bin_file.read_bytes())
+    if content.startswith(codecs.BOM_UTF8):
+        content = content[len(codecs.BOM_UTF8):]
+
+    data = _tools.converter.convert_to_json(content, Path(bin_file.name)) if parse else None
+    return Document(key, content, data)
+
+
+def _find_sources(game_data: Union[Path, GameDataArchive], include: Optional[Iterable[str]]) -> List[_Source]:
+    """List the .bin files of GameData selected by the include patterns."""
+    patterns = list(include) if include is not None else None
+    sources = []
+
+    for bin_file in PlatformHandler().find_files(game_data, "*.bin"):
+        key = bin_file.relative_to(game_data).as_posix()  # type: ignore
+        if patterns is None or any(
+            fnmatch.fnmatch(key, pattern) or fnmatch.fnmatch(key[:-len(".bin")], pattern) for pattern in patterns
+        ):
+            sources.append((bin_file, key))
+
+    if not isinstance(game_data, GameDataArchive):
+        sources.sort(key=lambda source: source[1])
+    return sources
+
+
+def _iter_ahead(executor: Executor, sources: List[_Source], parse: bool, buffer: int) -> Iterator[Document]:
+    """Yield the documents in order, keeping a bounded number of them in progress."""
+    pending: Deque[Future] = deque()
+    remaining = iter(sources)
+    try:
+        while True:
+            for bin_file, key in remaining:
+                pending.append(executor.submit(_load_source, bin_file, key, parse))
+                if len(pending) >= max(buffer, 1):
+                    break
+
+            if not pending:
+                return
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class _Tools(threading.local):
+    """Decryptor and converter of the current thread (the decryptor reuses its buffer)."""
+
+    def __init__(self):
+        self.decryptor = BinaryDecryptor()
+        self.converter = Converter()
+
+
+# Created again in each thread on first use
+_tools = _Tools()
@@ -0,0 +1,8 @@
+"""
+Library API for Noki Bin Dumpper.
+Decrypts and converts the game documents in memory, for services that
+embed the extractor instead of reading its output files.
+"""
+from .Documents import Document, iter_documents, aiter_documents, find_game_data
+
+__all__ = ["Document", "iter_documents", "aiter_documents", "find_game_data"]
@@ -4,17 +4,16 @@ Provides global settings, paths, and utility functions.
 """
 import sys
 import os
+import json
+import time
 import logging
-import requests
 
 from datetime import datetime
 from pathlib import Path
-from packaging import version
 from pydantic import BaseModel
 from typing import Optional, Any
 from rich.theme import Theme
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 class Settings(BaseModel):
     """
@@ -40,6 +39,12 @@ class Settings(BaseModel):
     GITHUB_REPO_OWNER: str = "AO-Noki"
     GITHUB_REPO_NAME: str = "noki-bin-dumpper"
     
+    # Update check: (connect, read) timeout in seconds and cache lifetime
+    UPDATE_CHECK_TIMEOUT: tuple = (1.5, 3.0)
+    UPDATE_CHECK_TTL: int = 24 * 60 * 60
+    UPDATE_CHECK_FAILURE_TTL: int = 60 * 60
+    UPDATE_CACHE_FILE: str = "update-check.json"
+    
     # Logging configuration
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "%(asctime)s - %(levelname)s - %(message)s"
@@ -115,34 +120,103 @@ class Settings(BaseModel):
         # Type is checked after initialize_paths, which always sets _logs_dir
         return self._logs_dir  # type: ignore
     
-    def check_for_updates(self):
+    @property
+    def CACHE_DIR(self) -> Path:
+        """Get the per-user cache directory, kept between runs and builds."""
+        if sys.platform == "win32":
+            base = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        elif sys.platform == "darwin":
+            base = Path.home() / "Library" / "Caches"
+        else:
+            base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return base / self.NAME
+    
+    def check_for_updates(self, use_cache: bool = True):
         """
         Check for updates by comparing current version with latest GitHub release.
         
+        The answer is cached on disk for UPDATE_CHECK_TTL seconds (failures
+        for UPDATE_CHECK_FAILURE_TTL), so most runs never touch the network
+        and offline runs only pay the short connect timeout once in a while.
+        
+        Args:
+            use_cache: If False, ignore the cached answer
+        
         Returns:
             dict: Update information or None if no update is available
         """
+        cache_file = self.CACHE_DIR / self.UPDATE_CACHE_FILE
+        
+        if use_cache:
+            cached = self._read_update_cache(cache_file)
+            if cached is not None:
+                return cached.get("update")
+        
         try:
+            # Imported here so startup doesn't pay for the HTTP stack
+            import requests
+            from packaging import version
+            
             url = f"https://api.github.com/repos/{self.GITHUB_REPO_OWNER}/{self.GITHUB_REPO_NAME}/releases/latest"
-            response = requests.get(url, timeout=5)
+            response = requests.get(url, timeout=self.UPDATE_CHECK_TIMEOUT)
             
+            update = None
             if response.status_code == 200:
                 latest_release = response.json()
                 latest_version = latest_release.get("tag_name", "").lstrip("v")
                 
                 # Compare versions using packaging.version
                 if version.parse(latest_version) > version.parse(self.VERSION):
-                    return {
+                    update = {
                         "current_version": self.VERSION,
                         "latest_version": latest_version,
                         "release_url": latest_release.get("html_url"),
                         "release_date": latest_release.get("published_at"),
                         "release_notes": latest_release.get("body")
                     }
-            return None
+            
+            self._write_update_cache(cache_file, {"ok": response.status_code == 200, "update": update})
+            return update
         except Exception as e:
             logging.warning(f"Failed to check for updates: {str(e)}")
+            self._write_update_cache(cache_file, {"ok": False, "update": None})
+            return None
+    
+    def _read_update_cache(self, cache_file: Path) -> Optional[dict]:
+        """
+        Read the cached update check if it is still fresh.
+        
+        Args:
+            cache_file: Path of the cache file
+            
+        Returns:
+            dict: Cached answer or None if missing, stale or for another version
+        """
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        ttl = self.UPDATE_CHECK_TTL if cached.get("ok") else self.UPDATE_CHECK_FAILURE_TTL
+        if cached.get("version") != self.VERSION or time.time() - cached.get("checked_at", 0) > ttl:
             return None
+        return cached
+    
+    def _write_update_cache(self, cache_file: Path, data: dict) -> None:
+        """
+        Store the answer of an update check.
+        
+        Args:
+            cache_file: Path of the cache file
+            data: Answer to cache
+        """
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.VERSION, "checked_at": time.time(), **data}, f)
+        except OSError as e:
+            logging.debug(f"Can't write update check cache: {e}")
 
     def setup_logging(self):
         """
@@ -205,6 +279,8 @@ class Settings(BaseModel):
         Returns:
             Progress: Rich progress bar
         """
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+        
         return Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
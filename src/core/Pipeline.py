@@ -0,0 +1,232 @@
+"""
+Pipelined execution for Noki Bin Dumpper.
+Overlaps the disk reads, the decrypt/convert work and the output writes
+of the serial extraction with bounded memory.
+"""
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, Optional, Union
+
+from .Processor import FileProcessor, FileTask, FileResult
+from ..utils import Manifest, ContentStore
+
+
+class ByteBudget:
+    """
+    Limits the number of bytes held in memory by a pipeline stage.
+
+    Producers block in acquire() until enough bytes are released. A single
+    item larger than the limit is still accepted once the budget is empty,
+    so huge files can't stall the pipeline.
+    """
+
+    def __init__(self, limit: int):
+        """
+        Initialize the budget.
+
+        Args:
+            limit: Maximum number of bytes held at once
+        """
+        self.limit = limit
+        self.used = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, size: int) -> None:
+        """Reserve bytes, waiting while the budget is exhausted."""
+        with self._condition:
+            while self.used and self.used + size > self.limit:
+                self._condition.wait()
+            self.used += size
+
+    def release(self, size: int) -> None:
+        """Give back bytes reserved with acquire()."""
+        with self._condition:
+            self.used -= size
+            self._condition.notify_all()
+
+
+class OutputWriter:
+    """
+    Thread pool writing output buffers to disk.
+
+    Each write returns a future of the SHA-256 of the written data, so the
+    manifest never has to read the file back.
+    """
+
+    def __init__(self, threads: int, budget: ByteBudget, store: Optional[ContentStore] = None):
+        """
+        Initialize the writer.
+
+        Args:
+            threads: Number of writer threads
+            budget: Budget of the bytes waiting to be written
+            store: Content-addressed store the files are linked to (optional)
+        """
+        self._budget = budget
+        self._store = store
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="writer")
+
+    def write(self, path: Path, data: Union[bytes, memoryview]) -> 'Future[str]':
+        """
+        Queue a buffer to be written, waiting while too many bytes are queued.
+
+        Args:
+            path: Destination file
+            data: Content of the file
+
+        Returns:
+            Future[str]: Hex SHA-256 of the content, once written
+        """
+        size = memoryview(data).nbytes
+        self._budget.acquire(size)
+        write = self._store.put if self._store is not None else self._write
+        future = self._executor.submit(write, path, data)
+        future.add_done_callback(lambda _: self._budget.release(size))
+        return future
+
+    @staticmethod
+    def _write(path: Path, data: Union[bytes, memoryview]) -> str:
+        with open(path, 'wb') as f:
+            f.write(data)
+        return Manifest.hash_bytes(data)  # type: ignore
+
+    def close(self) -> None:
+        """Wait for the queued writes and stop the threads."""
+        self._executor.shutdown(wait=True)
+
+
+class PipelinedExecutor:
+    """
+    Runs the tasks of a FileProcessor as a three-stage pipeline.
+
+    A reader thread reads the next .bin files ahead of time into a bounded
+    queue, the calling thread decrypts and converts them, and a pool of
+    writer threads flushes the XML/JSON outputs. The read-ahead queue and
+    the pending writes each hold at most max_buffered_bytes, so a slow
+    disk or a slow CPU stage throttles the others instead of growing
+    memory.
+    """
+
+    # Number of files read ahead of the one being processed
+    READ_AHEAD = 4
+
+    # Bytes held by the read-ahead queue and by the pending writes
+    MAX_BUFFERED_BYTES = 256 * 1024 * 1024
+
+    def __init__(self, processor: FileProcessor, io_threads: int = 2,
+                 read_ahead: int = READ_AHEAD, max_buffered_bytes: int = MAX_BUFFERED_BYTES):
+        """
+        Initialize the executor.
+
+        Args:
+            processor: Processor doing the decrypt/convert work
+            io_threads: Number of writer threads
+            read_ahead: Number of files read ahead
+            max_buffered_bytes: Byte limit of the read-ahead queue and of the pending writes
+        """
+        self.processor = processor
+        self.io_threads = io_threads
+        self.read_ahead = read_ahead
+        self.max_buffered_bytes = max_buffered_bytes
+
+    def run(self, tasks: Iterable[FileTask]) -> Iterator[FileResult]:
+        """
+        Process the tasks, yielding each result once its outputs are written.
+
+        The tasks are consumed by the reader thread, so they can come from
+        a generator that is still discovering the files.
+
+        Args:
+            tasks: Iterable of (bin file, xml output, json output, key)
+
+        Yields:
+            FileResult: Result of each processed file, in task order
+        """
+        reads: queue.Queue = queue.Queue(maxsize=self.read_ahead)
+        read_budget = ByteBudget(self.max_buffered_bytes)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._read_ahead, args=(tasks, reads, read_budget, stop), name="reader", daemon=True
+        )
+        writer = OutputWriter(self.io_threads, ByteBudget(self.max_buffered_bytes), self.processor.store)
+        pending: Deque[FileResult] = deque()
+
+        reader.start()
+        try:
+            while True:
+                task, content, size = reads.get()
+                if task is None:
+                    # End of the tasks, or the error raised while producing them
+                    if content is not None:
+                        raise content
+                    break
+                if isinstance(content, BaseException):
+                    result = (task[0], None, str(content), None)
+                else:
+                    result = self.processor.run_task(task, content, writer)
+                read_budget.release(size)
+                pending.append(result)
+
+                # Hand back the results whose outputs are already on disk
+                while pending and self._is_written(pending[0]):
+                    yield self._resolve(pending.popleft())
+
+            while pending:
+                yield self._resolve(pending.popleft())
+        finally:
+            # Unblock the reader if the consumer stopped early
+            stop.set()
+            while not reads.empty():
+                read_budget.release(reads.get_nowait()[2])
+            writer.close()
+
+    def _read_ahead(self, tasks: Iterable[FileTask], reads: queue.Queue, budget: ByteBudget, stop: threading.Event) -> None:
+        """Read the .bin files in order, blocking while the queue is full."""
+        try:
+            for task in tasks:
+                if stop.is_set():
+                    return
+
+                try:
+                    size = task[0].stat().st_size
+                except OSError as e:
+                    reads.put((task, e, 0))
+                    continue
+
+                budget.acquire(size)
+                try:
+                    content: Union[bytes, BaseException] = task[0].read_bytes()
+                except OSError as e:
+                    content = e
+                reads.put((task, content, size))
+        except BaseException as e:
+            reads.put((None, e, 0))
+            return
+        reads.put((None, None, 0))
+
+    @staticmethod
+    def _is_written(result: FileResult) -> bool:
+        """Check whether all the writes of a result are finished."""
+        record = result[1]
+        if record is None:
+            return True
+        return all(not isinstance(value, Future) or value.done() for value in record["outputs"].values())
+
+    @staticmethod
+    def _resolve(result: FileResult) -> FileResult:
+        """Replace the pending write futures of a result with their hashes."""
+        bin_file, record, error, stages = result
+        if record is None:
+            return result
+
+        try:
+            record["outputs"] = {
+                name: value.result() if isinstance(value, Future) else value
+                for name, value in record["outputs"].items()
+            }
+        except Exception as e:
+            return bin_file, None, str(e), stages
+        return bin_file, record, error, stages
@@ -2,17 +2,37 @@
 Core platform module for Noki Bin Dumpper.
 Handles platform detection, file operations, and data extraction.
 """
+import os
+import queue
+import shutil
+import hashlib
+import itertools
 import platform
-import xmltodict
-import json
-from typing import Optional, List
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Optional, List, Iterator, Iterable, Dict, Any, Union, NamedTuple
 from pathlib import Path
 from tqdm import tqdm
 
 from .Config import Config, Terminal, logger
-from ..platforms import PlatformHandler
+from .Processor import FileProcessor, FileTask, FileResult, init_worker, process_task
+from .Pipeline import PipelinedExecutor
+from .Watcher import GameDataWatcher
+from ..platforms import PlatformHandler, GameDataArchive
 from ..enums import ServerType
-from ..utils import BinaryDecryptor, Converter
+from ..utils import Manifest, JsonSerializer, ProfileReport, SqliteExporter, ContentStore, ArchiveWriter, StringTable
+from ..index import Indexer
+
+
+class PlannedFile(NamedTuple):
+    """What an extraction does with a .bin file found in GameData."""
+    bin_file: Path
+    key: str
+    # unchanged, linked (from the other server) or process
+    action: str
+    # Work unit of the files to process
+    task: Optional[FileTask] = None
+    # Manifest record of the unchanged and linked files
+    record: Optional[Dict[str, Any]] = None
 
 
 class Platform:
@@ -47,10 +67,29 @@ class Platform:
         self._output_path = Config.OUTPUT_DIR
         self._albion_path = None
         self._game_data_path = None
+        self._workers = 1
+        self._io_threads = 2
+        self._force = False
+        self._json_style = "pretty"
+        self._profile = False
+        self._profile_report: Optional[ProfileReport] = None
+        self._sqlite = False
+        self._columnar: Optional[str] = None
+        self._index = False
+        self._watch = False
+        self._both_servers = False
+        self._shared_output: Optional[Path] = None
+        self._store_path: Optional[Path] = None
+        self._archive_output: Optional[str] = None
+        self._strings = False
+        self._listing_cache = False
+        self._debounce = GameDataWatcher.DEBOUNCE
+        self._outputs = FileProcessor.OUTPUTS
+        self._output_format = "json"
+        self._compress = False
         
         # Initialize processing tools
-        self._decryptor = BinaryDecryptor()
-        self._converter = Converter()
+        self._processor = FileProcessor(**self._processor_options())
         
     @property
     def system(self) -> str:
@@ -97,6 +136,21 @@ class Platform:
         # Reset GameData path when server type changes
         self._game_data_path = None
         logger.info(f"Server: {server_type.name}")
+
+    def set_both_servers(self, both: bool) -> None:
+        """
+        Set whether the Live and Test servers are extracted in the same run.
+        
+        Each server gets its own output tree (live/ and test/ in the output
+        directory). Test files whose ciphertext is identical to the Live one
+        are not decrypted again: the Live outputs are hard-linked (or copied
+        where links aren't supported) into the Test tree.
+        
+        Args:
+            both: If True, extract both servers
+        """
+        self._both_servers = both
+        logger.info(f"Both servers: {both}")
     
     def set_output_path(self, output_path: Path) -> None:
         """
@@ -108,6 +162,333 @@ class Platform:
         self._output_path = output_path
         logger.info(f"Output path set: {output_path}")
 
+    def set_workers(self, workers: int) -> None:
+        """
+        Set the number of worker processes used for extraction.
+        
+        Args:
+            workers: Number of processes (1 = serial, 0 = one per CPU core)
+        """
+        if workers < 0:
+            raise ValueError("Number of workers can't be negative.")
+        
+        self._workers = workers or os.cpu_count() or 1
+        logger.info(f"Workers: {self._workers}")
+
+    def set_io_threads(self, io_threads: int) -> None:
+        """
+        Set the number of writer threads of the serial extraction.
+        
+        With one or more threads, the next files are read ahead and the
+        outputs are written in the background while the current file is
+        decrypted and converted, with bounded memory.
+        
+        Args:
+            io_threads: Number of writer threads (0 = read and write inline)
+        """
+        if io_threads < 0:
+            raise ValueError("Number of I/O threads can't be negative.")
+        
+        self._io_threads = io_threads
+        logger.info(f"I/O threads: {io_threads}")
+
+    def set_force(self, force: bool) -> None:
+        """
+        Set whether unchanged files should be processed again.
+        
+        Args:
+            force: If True, ignore the manifest and process every file
+        """
+        self._force = force
+        logger.info(f"Force: {force}")
+
+    def set_watch(self, watch: bool, debounce: float = GameDataWatcher.DEBOUNCE) -> None:
+        """
+        Set whether the extraction keeps watching GameData for updates.
+        
+        After the first pass, run_extraction waits for the .bin files
+        written by the launcher and re-processes only those, once no new
+        write arrived for the debounce delay.
+        
+        Args:
+            watch: If True, keep running until interrupted
+            debounce: Quiet time in seconds before a batch of changes is processed
+        """
+        if debounce < 0:
+            raise ValueError("Debounce delay can't be negative.")
+        
+        self._watch = watch
+        self._debounce = debounce
+        logger.info(f"Watch: {watch}")
+
+    def set_json_style(self, json_style: str) -> None:
+        """
+        Set the style of the JSON output.
+        
+        Args:
+            json_style: pretty (indented), compact (single line) or ndjson (one line per record)
+            
+        Raises:
+            ValueError: If the style is unknown
+        """
+        if json_style not in JsonSerializer.STYLES:
+            raise ValueError(f"Unknown JSON style '{json_style}'. Available: {', '.join(JsonSerializer.STYLES)}")
+        
+        self._json_style = json_style
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"JSON style: {json_style}")
+
+    def set_outputs(self, outputs: List[str]) -> None:
+        """
+        Set which files are written for each document.
+        
+        Skipping an output skips all the work only it needs: an XML-only
+        run never converts the documents and a JSON-only run never decodes
+        them to text.
+        
+        Args:
+            outputs: xml and/or json (the converted document, in the selected format)
+            
+        Raises:
+            ValueError: If an output is unknown or none is given
+        """
+        unknown = [output for output in outputs if output not in FileProcessor.OUTPUTS]
+        if unknown:
+            raise ValueError(f"Unknown outputs: {', '.join(unknown)}. Available: {', '.join(FileProcessor.OUTPUTS)}")
+        if not outputs:
+            raise ValueError("At least one output is required.")
+        if self._index and "xml" not in outputs:
+            raise ValueError("The lookup index points into the XML files, keep the xml output.")
+        
+        # Keep the pipeline order whatever the order given
+        self._outputs = tuple(output for output in FileProcessor.OUTPUTS if output in outputs)
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Outputs: {', '.join(self._outputs)}")
+
+    def set_output_format(self, output_format: str, compress: bool = False) -> None:
+        """
+        Set the format of the converted documents.
+        
+        Binary documents hold the same structure as the JSON output and are
+        written to a folder named after the format (msgpack/ or cbor/).
+        They can be read back with utils.Loader.load_document.
+        
+        Args:
+            output_format: json, msgpack or cbor
+            compress: If True, compress binary documents with zstd
+            
+        Raises:
+            ValueError: If the format is unknown, its library is not installed
+                or compression is requested for JSON
+        """
+        if output_format == "json":
+            if compress:
+                raise ValueError("zstd compression is only available for the msgpack and cbor formats")
+        else:
+            # Validates the format and its optional dependencies
+            from ..utils.BinarySerializer import BinarySerializer
+            BinarySerializer(output_format, compress)
+        
+        self._output_format = output_format
+        self._compress = compress
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Output format: {output_format}{' (zstd)' if compress else ''}")
+
+    def set_profile(self, profile: bool) -> None:
+        """
+        Set whether per-stage time and memory are measured.
+        
+        When enabled, a summary of the slowest stages and files is printed
+        at the end of the extraction and the full measurements are written
+        to profile.json in the output directory.
+        
+        The memory peaks come from tracemalloc, which traces the whole
+        process: profiled runs therefore don't use the I/O threads, whose
+        reads and writes would count in the peak of every stage.
+        
+        Args:
+            profile: If True, instrument every processed file
+        """
+        self._profile = profile
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Profile: {profile}")
+
+    def set_sqlite(self, sqlite: bool) -> None:
+        """
+        Set whether documents are also exported to an SQLite database.
+        
+        The database is written to the output directory with one row per
+        XML element and per attribute, indexed on uniquename and id.
+        
+        Args:
+            sqlite: If True, load every processed document into the database
+        """
+        self._sqlite = sqlite
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"SQLite export: {sqlite}")
+
+    @property
+    def sqlite_path(self) -> Path:
+        """Get the path of the SQLite export."""
+        return self._output_path.joinpath(SqliteExporter.FILE_NAME)
+
+    def set_columnar(self, file_format: Optional[str]) -> None:
+        """
+        Set the format of the columnar export.
+        
+        Each document gets a folder under columnar/ in the output directory
+        with one table per element type (items, mobs, spells...).
+        
+        Args:
+            file_format: parquet, arrow (Arrow IPC) or None to disable the export
+            
+        Raises:
+            ValueError: If the format is unknown or pyarrow is not installed
+        """
+        if file_format is not None:
+            from ..utils.ColumnarExporter import ColumnarExporter
+            if file_format not in ColumnarExporter.FORMATS:
+                raise ValueError(f"Unknown columnar format '{file_format}'. Available: {', '.join(ColumnarExporter.FORMATS)}")
+            if not ColumnarExporter.is_available():
+                raise ValueError("Columnar export requires pyarrow (pip install noki-bin-dumpper[columnar])")
+        
+        self._columnar = file_format
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Columnar export: {file_format or 'disabled'}")
+
+    @property
+    def columnar_path(self) -> Path:
+        """Get the directory of the columnar export."""
+        return self._output_path.joinpath("columnar")
+
+    def set_index(self, index: bool) -> None:
+        """
+        Set whether the lookup index is built during the extraction.
+        
+        The index records the byte range of every element of the XML files
+        under index/ in the output directory, so src.index.GameIndex can
+        load a single element by uniquename or id without parsing the
+        whole document.
+        
+        Args:
+            index: If True, index every processed document
+            
+        Raises:
+            ValueError: If the xml output is disabled
+        """
+        if index and "xml" not in self._outputs:
+            raise ValueError("The lookup index points into the XML files, enable the xml output.")
+        
+        self._index = index
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Lookup index: {index}")
+
+    @property
+    def index_path(self) -> Path:
+        """Get the directory of the lookup index."""
+        return self._output_path.joinpath(Indexer.DIR_NAME)
+
+    def set_strings(self, strings: bool) -> None:
+        """
+        Set whether the localization string table is compiled.
+        
+        localization.bin is also written as a sorted binary table to the
+        output directory, which src.utils.StringTable maps in memory to
+        look up a tag in a language without parsing the XML.
+        
+        Args:
+            strings: If True, compile the string table
+        """
+        self._strings = strings
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"String table: {strings}")
+
+    @property
+    def strings_path(self) -> Path:
+        """Get the path of the localization string table."""
+        return self._output_path.joinpath(StringTable.FILE_NAME)
+
+    def set_listing_cache(self, listing_cache: bool) -> None:
+        """
+        Set whether the GameData listing is cached between runs.
+        
+        The listing of each directory is saved in the user cache directory
+        with its modification time, and reused while the directory has no
+        file added, removed or renamed. Files are still stat'ed every run,
+        so changed contents are always detected.
+        
+        Args:
+            listing_cache: If True, reuse the listing of the unchanged directories
+        """
+        self._listing_cache = listing_cache
+        logger.info(f"Listing cache: {listing_cache}")
+
+    def set_store(self, store_path: Optional[Path]) -> None:
+        """
+        Set the content-addressed store shared by the extractions.
+        
+        Every distinct XML/JSON output is written once to the store and the
+        output trees hold hard links to it, so repeated dumps into new
+        output directories only write and use space for what changed.
+        
+        Args:
+            store_path: Store directory, on the same file system as the
+                outputs, or None to write plain files
+        """
+        self._store_path = Path(store_path) if store_path is not None else None
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Content store: {store_path or 'disabled'}")
+
+    def set_archive_output(self, target: Optional[str]) -> None:
+        """
+        Set the archive the output tree is written to instead of the output directory.
+        
+        Each output file becomes a member of a single zip or tar archive
+        (or of a tar stream on the standard output), with the same layout
+        as the output directory and the manifest as last member. Every
+        file is processed, as there is no previous tree to compare with.
+        
+        Args:
+            target: .zip, .tar, .tar.gz or .tar.zst file, "-" for the
+                standard output, or None to write the output directory
+                
+        Raises:
+            ValueError: If the archive format is not supported
+        """
+        if target is not None:
+            ArchiveWriter.format_of(target)
+        
+        self._archive_output = str(target) if target is not None else None
+        self._processor = FileProcessor(**self._processor_options())
+        logger.info(f"Archive output: {target or 'disabled'}")
+
+    @property
+    def profile_report(self) -> Optional[ProfileReport]:
+        """Get the measurements of the last profiled extraction."""
+        return self._profile_report
+
+    def _processor_options(self) -> Dict[str, Any]:
+        """
+        Get the options used to create file processors.
+        
+        Returns:
+            Dict[str, Any]: Keyword arguments of FileProcessor
+        """
+        return {
+            "json_style": self._json_style,
+            "profile": self._profile,
+            "sqlite_path": str(self.sqlite_path) if self._sqlite else None,
+            "columnar_path": str(self.columnar_path) if self._columnar else None,
+            "columnar_format": self._columnar or "parquet",
+            "output_format": self._output_format,
+            "compress": self._compress,
+            "outputs": self._outputs,
+            "index_path": str(self.index_path) if self._index else None,
+            "store_path": str(self._store_path) if self._store_path else None,
+            "keep_outputs": self._archive_output is not None,
+            "strings_path": str(self.strings_path) if self._strings else None
+        }
+
     def ensure_output_file_exists(self, file_path: Path) -> Path:
         """
         Ensure a file exists, creating it if necessary.
@@ -136,13 +517,14 @@ class Platform:
             directory.mkdir(parents=True, exist_ok=True)
         return directory
     
-    def get_game_data_path(self) -> Path:
+    def get_game_data_path(self) -> Union[Path, GameDataArchive]:
         """
         Get the path to the GameData directory for the selected server.
         Uses caching to avoid repeated lookups.
         
         Returns:
-            Path: Path to the GameData directory
+            Path: Path to the GameData directory, or the snapshot archive
+            holding it when the Albion path is an archive
             
         Raises:
             ValueError: If Albion path is not defined
@@ -179,7 +561,39 @@ class Platform:
         # Use the handler to find .bin files
         return self._handler.find_files(game_data_path, "*.bin")
     
-    def process_bin_files(self) -> None:
+    def iter_bin_files(self) -> Iterator[Path]:
+        """
+        Iterate over the .bin files in the game data path as they are found.
+        
+        Yields:
+            Path: Each .bin file found
+        """
+        game_data_path = self.get_game_data_path()
+
+        if not game_data_path.exists():
+            logger.error(f"GameData directory not found: {game_data_path}")
+            return
+        
+        yield from self._handler.iter_files(game_data_path, "*.bin", self._listing_cache_path(game_data_path))
+    
+    def _listing_cache_path(self, game_data_path: Union[Path, GameDataArchive]) -> Optional[Path]:
+        """
+        Get the listing cache file of a GameData directory.
+        
+        Args:
+            game_data_path: GameData directory
+            
+        Returns:
+            Path: Cache file named after the GameData path, or None when the
+            cache is disabled or GameData is an archive
+        """
+        if not self._listing_cache or isinstance(game_data_path, GameDataArchive):
+            return None
+        
+        digest = hashlib.sha256(str(Path(game_data_path).resolve()).encode('utf-8')).hexdigest()[:16]
+        return Config.CACHE_DIR.joinpath("listings", f"{digest}.json")
+    
+    def process_bin_files(self, changed: Optional[Iterable[Path]] = None) -> None:
         """
         Process .bin files found in the game data.
         
@@ -189,61 +603,558 @@ class Platform:
         3. Saves the content as XML
         4. Converts XML to JSON
         5. Saves both formats maintaining the original directory structure
+        
+        Files unchanged since the last run are skipped using the manifest
+        stored in the output directory, unless force is set. Files are
+        spread across a process pool when more than one worker is set.
+        
+        Args:
+            changed: Only process these .bin files instead of the whole
+                GameData tree; the ones that no longer exist are removed
+                from the manifest and exports (used by the watch mode)
         """
         # Get the GameData path
         game_data_path = self.get_game_data_path()
         
-        # Find .bin files
-        bin_files = self.find_bin_files()
+        # Find .bin files, streamed from the walk of GameData
+        removed = set()
+        bin_files: Iterable[Path]
+        if changed is None:
+            bin_files = self.iter_bin_files()
+            first = next(bin_files, None)
+            if first is None:
+                # Display warning if no .bin files found
+                logger.info(f"[yellow]====================================================[/yellow]")
+                logger.warning("No .bin files found to process")
+                logger.info(f"[yellow]====================================================[/yellow]")
+                return
+            bin_files = itertools.chain([first], bin_files)
+        else:
+            changed = [path for path in changed if path.suffix == '.bin']
+            bin_files = [path for path in changed if path.is_file()]
+            removed = {self._manifest_key(path, game_data_path) for path in changed if not path.is_file()}
+            if not bin_files and not removed:
+                return
         
-        if not bin_files:
-            # Display warning if no .bin files found
-            logger.info(f"[yellow]====================================================[/yellow]")
-            logger.warning("No .bin files found to process")
-            logger.info(f"[yellow]====================================================[/yellow]")
-            return
+        # The archive output replaces the whole output tree
+        archive = None
+        if self._archive_output is not None:
+            archive = self._create_archive_output()
+        
+        # Outputs are hard links to the store
+        if self._store_path is not None:
+            ContentStore(self._store_path).check(self._output_path)
         
         # Create output directories
+        if "xml" in self._outputs and archive is None:
+            self.ensure_directory_exists(self._output_path.joinpath("xml"))
+        if "json" in self._outputs and archive is None:
+            self.ensure_directory_exists(self._output_path.joinpath(self._output_format))
+
+        # Load the manifest of the previous extraction. The planning reads
+        # its own copy, only this thread changes the one that is saved.
+        manifest = Manifest(self._output_path, self._manifest_settings())
+        previous = Manifest(self._output_path, self._manifest_settings())
+        if archive is None:
+            manifest.load()
+            previous.load()
+
+        # Create the SQLite schema before the workers start writing
+        exporter = SqliteExporter(self.sqlite_path) if self._sqlite else None
+        force = self._force or archive is not None
+        if exporter is not None:
+            # A missing database must be filled with every document
+            force = force or not self.sqlite_path.exists()
+            exporter.initialize()
+
+        # Exports follow the current output directory
+        self._processor = FileProcessor(**self._processor_options())
+
+        # Files already extracted for the other server can be linked instead.
+        # The SQLite export needs every document, so nothing is shared then.
+        shared = {}
+        if self._shared_output is not None and exporter is None:
+            shared = Manifest(self._shared_output, self._manifest_settings()).load().entries
+
+        # Index shards are checked by the manifest like the other outputs
+        indexer = Indexer(self.index_path) if self._index else None
+
+        # Plan the work while the files are found. The serial path starts on
+        # the first files while GameData is still walked (on the reader
+        # thread of the pipeline); the pool sorts them all by size first.
+        planned: 'queue.SimpleQueue[PlannedFile]' = queue.SimpleQueue()
+        plan = self._plan_files(bin_files, game_data_path, previous, force, shared, indexer)
+        tasks: Iterable[FileTask] = self._queue_plan(plan, planned)
+        if self._workers > 1:
+            tasks = list(tasks)
+        if isinstance(tasks, list) and len(tasks) > 1:
+            results = self._process_parallel(tasks)
+        else:
+            results = self._process_serial(tasks)
+
+        report = ProfileReport() if self._profile else None
+        keys: Dict[Path, str] = {}
+        counts = {"unchanged": 0, "linked": 0, "process": 0}
+        
+        try:
+            if archive is not None:
+                archive.open()
+            
+            for result in results:
+                # The task of a result is always planned before it
+                self._apply_plan(planned, manifest, keys, counts)
+                self._record_result(result, keys[result[0]], manifest, archive, report)
+            self._apply_plan(planned, manifest, keys, counts)
+            
+            # Documents of the previous extraction kept by a partial run
+            if changed is None:
+                existing = set(keys.values())
+            else:
+                existing = (set(manifest.entries) | set(keys.values())) - removed
+            manifest.prune(existing)
+            
+            if archive is not None:
+                archive.add(Manifest.FILE_NAME, manifest.dumps().encode('utf-8'))
+                archive.close()
+        finally:
+            if archive is None:
+                manifest.save()
+            else:
+                # Only removes an archive left unfinished by an error
+                archive.discard()
+            self._processor.close()
+            if isinstance(game_data_path, GameDataArchive):
+                game_data_path.close()
+        
+        if counts["linked"]:
+            logger.info(f"{counts['linked']} files identical to {self._shared_output.name}, linked instead of processed")
+        logger.info(f"{counts['process']} files processed, {counts['unchanged']} unchanged")
+        
+        if exporter is not None:
+            # Drop the documents whose .bin file was removed
+            exporter.prune(existing)
+            exporter.close()
+            logger.info(f"SQLite export saved to: {self.sqlite_path}")
+        
+        if indexer is not None:
+            # Drop the shards of the documents whose .bin file was removed
+            indexer.prune(existing)
+            logger.info(f"Lookup index saved to: {self.index_path}")
+        
+        if report is not None:
+            self._write_profile_report(report)
+
+    def _plan_files(self, bin_files: Iterable[Path], game_data_path: Union[Path, GameDataArchive],
+                    previous: Manifest, force: bool, shared: Dict[str, Dict[str, Any]],
+                    indexer: Optional[Indexer]) -> Iterator[PlannedFile]:
+        """
+        Decide what to do with each .bin file, preserving the directory structure.
+        
+        May run on the reader thread of the pipeline: it only reads the
+        manifest of the previous extraction and leaves the changes of the
+        saved manifest to the caller, through the planned records.
+        
+        Args:
+            bin_files: .bin files to plan, possibly still being found
+            game_data_path: GameData directory or archive the files belong to
+            previous: Manifest of the previous extraction, owned by the planning
+            force: If True, process every file
+            shared: Manifest entries of the other server, whose outputs can be linked
+            indexer: Index builder, when the lookup index is enabled
+            
+        Yields:
+            PlannedFile: Action, task and manifest record of each file
+        """
         xml_output_path = self._output_path.joinpath("xml")
-        json_output_path = self._output_path.joinpath("json")
-        self.ensure_directory_exists(xml_output_path)
-        self.ensure_directory_exists(json_output_path)
+        json_output_path = self._output_path.joinpath(self._output_format)
+        json_extension = self._document_extension()
+        
+        for bin_file in bin_files:
+            key = self._manifest_key(bin_file, game_data_path)
+            xml_relative_path = self._handler.get_relative_path(xml_output_path, bin_file, game_data_path)
+            json_relative_path = self._handler.get_relative_path(json_output_path, bin_file, game_data_path)
+            xml_relative_path = xml_relative_path.with_suffix('.xml')
+            json_relative_path = json_relative_path.with_suffix(json_extension)
 
-        # Process all .bin files
-        for bin_file in tqdm(bin_files, desc="Processing files"):
+            # Skip files unchanged since the last extraction
+            paths = {"xml": xml_relative_path, "json": json_relative_path}
+            outputs = [paths[output] for output in self._outputs]
+            if self._columnar:
+                outputs.append(self.columnar_path.joinpath(Path(key).with_suffix('')))
+            if indexer is not None:
+                outputs.append(indexer.shard_path(key))
+            if self._strings and bin_file.name == StringTable.SOURCE_NAME:
+                outputs.append(self.strings_path)
+            if not force and previous.is_up_to_date(key, bin_file, outputs):
+                # The check may have refreshed the mtime of the entry
+                yield PlannedFile(bin_file, key, "unchanged", record=previous.entries[key])
+                continue
+
+            record = self._link_shared_outputs(shared.get(key), bin_file, outputs)
+            if record is not None:
+                yield PlannedFile(bin_file, key, "linked", record=record)
+                continue
+
+            # Outputs linked from another tree must not be overwritten in place
+            self._unlink_shared_outputs(outputs)
+            yield PlannedFile(bin_file, key, "process", task=(bin_file, xml_relative_path, json_relative_path, key))
+
+    @staticmethod
+    def _queue_plan(plan: Iterable[PlannedFile], planned: 'queue.SimpleQueue[PlannedFile]') -> Iterator[FileTask]:
+        """Yield the tasks of a plan, handing every planned file over to the consuming thread."""
+        for item in plan:
+            planned.put(item)
+            if item.task is not None:
+                yield item.task
+
+    @staticmethod
+    def _apply_plan(planned: 'queue.SimpleQueue[PlannedFile]', manifest: Manifest,
+                    keys: Dict[Path, str], counts: Dict[str, int]) -> None:
+        """
+        Record the files planned so far in the manifest being written.
+        
+        Args:
+            planned: Files handed over by the planning
+            manifest: Manifest saved at the end of the extraction
+            keys: Manifest key of each planned file, filled in place
+            counts: Number of files per action, updated in place
+        """
+        while True:
             try:
-                # Get relative paths preserving directory structure
-                xml_relative_path = self._handler.get_relative_path(xml_output_path, bin_file, game_data_path)
-                json_relative_path = self._handler.get_relative_path(json_output_path, bin_file, game_data_path)
+                item = planned.get_nowait()
+            except queue.Empty:
+                return
+            keys[item.bin_file] = item.key
+            counts[item.action] += 1
+            if item.record is not None:
+                manifest.update(item.key, item.record)
 
-                # Change extensions
-                xml_relative_path = xml_relative_path.with_suffix('.xml')
-                json_relative_path = json_relative_path.with_suffix('.json')
+    def _record_result(self, result: FileResult, key: str, manifest: Manifest,
+                       archive: Optional[ArchiveWriter], report: Optional[ProfileReport]) -> None:
+        """
+        Store the outcome of a processed file.
+        
+        Args:
+            result: Result of the processor
+            key: Manifest key of the file
+            manifest: Manifest saved at the end of the extraction
+            archive: Open archive receiving the outputs, if any
+            report: Profile report, when profiling
+        """
+        bin_file, record, error, stages = result
+        if error:
+            logger.error(f"Can't process {bin_file}: {error}")
+            manifest.entries.pop(key, None)
+        elif record:
+            if archive is not None:
+                self._add_to_archive(archive, record.pop("contents"))
+            manifest.update(key, record)
+        
+        if report is not None and stages is not None:
+            report.add(key, stages)
 
-                # Ensure output directories exist
-                self.ensure_directory_exists(xml_relative_path.parent)
-                self.ensure_directory_exists(json_relative_path.parent)
-                
-                # Decrypt .bin file content
-                content = self._decryptor.decrypt_bin(bin_file.read_bytes())
-                
-                # Convert bytes to string with UTF-8 BOM handling
-                content_str = content.decode('utf-8-sig')
-                
-                # Save decrypted content as XML
-                with open(xml_relative_path, 'w', encoding='utf-8') as f:
-                    f.write(content_str)
+    def _create_archive_output(self) -> ArchiveWriter:
+        """
+        Create the writer of the archive receiving the output tree.
+        
+        Returns:
+            ArchiveWriter: Writer, opened once the processing starts
+            
+        Raises:
+            ValueError: If an enabled option writes files outside of the output tree
+        """
+        conflicts = {
+            "sqlite": self._sqlite,
+            "columnar": self._columnar is not None,
+            "index": self._index,
+            "store": self._store_path is not None,
+            "strings": self._strings,
+            "both servers": self._both_servers,
+            "watch": self._watch
+        }
+        enabled = [name for name, value in conflicts.items() if value]
+        if enabled:
+            raise ValueError(f"The archive output can't be combined with: {', '.join(enabled)}")
+        
+        return ArchiveWriter(self._archive_output)  # type: ignore
 
-                # Convert to JSON using the converter (handles special cases)
-                json_content = self._converter.convert_to_json(content_str, bin_file)
+    def _add_to_archive(self, archive: ArchiveWriter, contents: List[Any]) -> None:
+        """
+        Add the outputs of a processed file to the archive.
+        
+        Args:
+            archive: Open archive
+            contents: (output path, content) pairs kept by the processor
+        """
+        for path, data in contents:
+            archive.add(Path(path).relative_to(self._output_path).as_posix(), data)
 
-                # Save JSON content
-                with open(json_relative_path, 'w', encoding='utf-8') as f:
-                    json.dump(json_content, f, indent=4, ensure_ascii=False)
-                
-            except Exception as e:
-                logger.error(f"Can't process {bin_file}: {e}")
+    def _manifest_settings(self) -> Dict[str, Any]:
+        """
+        Get the settings recorded in the manifest.
+        
+        Returns:
+            Dict[str, Any]: Settings that invalidate the previous outputs when changed
+        """
+        return {
+            "version": Config.VERSION,
+            "json_style": self._json_style,
+            "sqlite": self._sqlite,
+            "columnar": self._columnar,
+            "output_format": self._output_format,
+            "compress": self._compress,
+            "outputs": list(self._outputs),
+            "index": self._index,
+            "strings": self._strings
+        }
+
+    def _link_shared_outputs(self, entry: Optional[Dict[str, Any]], bin_file: Path,
+                             outputs: List[Path]) -> Optional[Dict[str, Any]]:
+        """
+        Reuse the outputs of the other server for an identical .bin file.
+        
+        Args:
+            entry: Manifest entry of the same file in the shared output tree
+            bin_file: Source .bin file
+            outputs: Output files and directories of the file in this tree
+            
+        Returns:
+            Dict: Manifest record of the linked file, or None if it must be processed
+        """
+        if entry is None:
+            return None
+        
+        stat = bin_file.stat()
+        if stat.st_size != entry.get("size") or Manifest.hash_file(bin_file) != entry.get("sha256"):
+            return None
+        
+        sources = [self._shared_output.joinpath(output.relative_to(self._output_path)) for output in outputs]
+        if not all(source.exists() for source in sources):
+            return None
+        
+        for source, output in zip(sources, outputs):
+            if source.is_dir():
+                if output.exists():
+                    shutil.rmtree(output)
+                for file in source.rglob("*"):
+                    if file.is_file():
+                        self._link_file(file, output.joinpath(file.relative_to(source)))
+            else:
+                self._link_file(source, output)
+        
+        return {
+            "size": stat.st_size,
+            "mtime": stat.st_mtime_ns,
+            "sha256": entry["sha256"],
+            "outputs": dict(entry.get("outputs", {}))
+        }
+
+    @staticmethod
+    def _link_file(source: Path, target: Path) -> None:
+        """Hard-link a file, copying it where links aren't supported."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if target.exists():
+            target.unlink()
+        try:
+            os.link(source, target)
+        except OSError:
+            shutil.copyfile(source, target)
+
+    @staticmethod
+    def _unlink_shared_outputs(outputs: List[Path]) -> None:
+        """Remove the output files that are hard links before they are rewritten."""
+        for output in outputs:
+            try:
+                if output.is_file() and output.stat().st_nlink > 1:
+                    output.unlink()
+            except OSError:
+                pass
+
+    def _document_extension(self) -> str:
+        """
+        Get the extension of the converted documents.
+        
+        Returns:
+            str: .json/.ndjson for JSON, else the binary format extension
+        """
+        if self._output_format == "json":
+            return JsonSerializer(self._json_style).extension
+        from ..utils.BinarySerializer import BinarySerializer
+        return BinarySerializer(self._output_format, self._compress).extension
+
+    def _write_profile_report(self, report: ProfileReport) -> None:
+        """
+        Print the profile summary and save the full report.
+        
+        Args:
+            report: Measurements of the extraction
+        """
+        report.finish()
+        self._profile_report = report
+        
+        for table in report.summary_tables():
+            Terminal.print(table)
+        
+        report_path = report.write(self._output_path)
+        logger.info(f"Profile report saved to: {report_path}")
+
+    def _process_serial(self, tasks: Iterable[FileTask]) -> Iterator[FileResult]:
+        """
+        Process the tasks one by one in the current process.
+        
+        When I/O threads are set, reads and writes overlap the processing
+        through a PipelinedExecutor, except in profiled runs.
+        
+        Args:
+            tasks: Iterable of (bin file, xml output, json output, key),
+                possibly still being planned while the first ones run
+            
+        Yields:
+            FileResult: Result of each processed file
+        """
+        progress = tqdm(total=len(tasks) if isinstance(tasks, list) else 0, desc="Processing files")
+        if not isinstance(tasks, list):
+            tasks = self._count_tasks(tasks, progress)
+        
+        try:
+            # Stage memory peaks are process-wide, concurrent I/O would inflate them
+            if self._io_threads and not self._profile:
+                results = PipelinedExecutor(self._processor, self._io_threads).run(tasks)
+            else:
+                results = (self._processor.run_task(task) for task in tasks)
+            
+            for result in results:
+                progress.update()
+                yield result
+        finally:
+            progress.close()
+
+    @staticmethod
+    def _count_tasks(tasks: Iterable[FileTask], progress: tqdm) -> Iterator[FileTask]:
+        """Grow the progress bar total as the tasks are planned."""
+        for task in tasks:
+            progress.total += 1
+            progress.refresh()
+            yield task
+
+    def _process_parallel(self, tasks: List[FileTask]) -> Iterator[FileResult]:
+        """
+        Process the tasks across a pool of worker processes.
+        
+        Largest files are submitted first so a slow file doesn't hold up
+        the end of the run. Results are yielded back to the parent as
+        soon as each file completes. Members of a compressed tar archive
+        keep the archive order, so each worker only reads it forward.
+        
+        Args:
+            tasks: List of (bin file, xml output, json output, key)
+            
+        Yields:
+            FileResult: Result of each processed file
+        """
+        game_data_path = self.get_game_data_path()
+        if not isinstance(game_data_path, GameDataArchive) or game_data_path.random_access:
+            tasks = sorted(tasks, key=lambda task: self._file_size(task[0]), reverse=True)
+        workers = min(self._workers, len(tasks))
+        
+        options = self._processor_options()
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(options,)) as executor:
+            futures = [executor.submit(process_task, task) for task in tasks]
+            
+            for future in tqdm(as_completed(futures), total=len(futures), desc=f"Processing files ({workers} workers)"):
+                yield future.result()
+
+    def _manifest_key(self, bin_file: Path, game_data_path: Path) -> str:
+        """
+        Get the manifest key of a .bin file.
+        
+        Args:
+            bin_file: Source .bin file
+            game_data_path: GameData directory the file belongs to
+            
+        Returns:
+            str: Path relative to GameData using forward slashes
+        """
+        try:
+            return bin_file.relative_to(game_data_path).as_posix()
+        except ValueError:
+            return bin_file.name
+
+    def _file_size(self, file_path: Path) -> int:
+        """
+        Get the size of a file, returning 0 if it can't be read.
+        
+        Args:
+            file_path: Path to the file
+            
+        Returns:
+            int: File size in bytes
+        """
+        try:
+            return file_path.stat().st_size
+        except OSError:
+            return 0
     
+    def _process_both_servers(self) -> None:
+        """
+        Extract the Live server, then the Test server reusing the Live outputs.
+        
+        Each server is written to its own folder of the output directory.
+        """
+        output_path = self._output_path
+        server_type = self._server_type
+        
+        try:
+            for server in (ServerType.LIVE, ServerType.TEST):
+                self.set_server_type(server)
+                self._output_path = output_path.joinpath(server.name.lower())
+                self.process_bin_files()
+                
+                # Test files identical to Live are linked from the Live tree
+                self._shared_output = self._output_path
+        finally:
+            self._output_path = output_path
+            self._server_type = server_type
+            self._game_data_path = None
+            self._shared_output = None
+
+    def watch_bin_files(self, watcher: Optional[GameDataWatcher] = None) -> None:
+        """
+        Re-process the .bin files changed in GameData until interrupted.
+        
+        Args:
+            watcher: Watcher to read the changes from (default: one on the
+                GameData directory of the selected server)
+        """
+        if watcher is None:
+            if isinstance(self.get_game_data_path(), GameDataArchive):
+                raise ValueError("Watch mode needs a GameData directory, not an archive.")
+            watcher = GameDataWatcher(self.get_game_data_path(), self._debounce,
+                                      known_files=self._extracted_bin_files)
+        
+        logger.info(f"Watching {watcher.game_data_path} for changes ({watcher.backend}), press Ctrl+C to stop")
+        
+        try:
+            for changed in watcher.batches():
+                logger.info(f"{len(changed)} changed files detected")
+                self.process_bin_files(changed)
+        except KeyboardInterrupt:
+            logger.info("Watch stopped")
+        finally:
+            watcher.close()
+
+    def _extracted_bin_files(self) -> List[Path]:
+        """
+        Get the .bin files recorded in the manifest of the output directory.
+        
+        Returns:
+            List[Path]: Source files of the last extraction, existing or not
+        """
+        game_data_path = self.get_game_data_path()
+        manifest = Manifest(self._output_path, self._manifest_settings()).load()
+        return [game_data_path.joinpath(key) for key in manifest.entries]
+
     def run_extraction(self) -> None:
         """
         Run the complete extraction process.
@@ -268,10 +1179,16 @@ class Platform:
                 raise ValueError("Server type not defined. Use set_server_type() first.")
             
             # Process files
-            self.process_bin_files()
+            if self._both_servers:
+                self._process_both_servers()
+            else:
+                self.process_bin_files()
 
             logger.info("Extraction process completed successfully!")
             
+            if self._watch:
+                self.watch_bin_files()
+            
         except Exception as e:
             logger.error(f"Error during extraction process: {e}")
             raise
\ No newline at end of file
@@ -0,0 +1,330 @@
+"""
+File processing module for Noki Bin Dumpper.
+Handles the per-file decrypt, convert and write work shared by the
+serial and the multi-process extraction paths.
+"""
+import io
+import os
+import codecs
+import logging
+from pathlib import Path
+from typing import Optional, Tuple, Dict, Any, List, Union, TYPE_CHECKING
+
+from ..utils import BinaryDecryptor, Converter, Manifest, JsonSerializer, StageProfiler, SqliteExporter, ContentStore, StringTable
+from ..index import Indexer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+    from .Pipeline import OutputWriter
+    from ..utils.BinarySerializer import BinarySerializer
+    from ..utils.ColumnarExporter import ColumnarExporter
+
+# Work unit sent to the processors: (bin file, xml output, json output, key relative to GameData)
+FileTask = Tuple[Path, Path, Path, str]
+
+# Result sent back to the parent:
+# (bin file, manifest record or None, error message or None, stage measurements or None)
+FileResult = Tuple[Path, Optional[Dict[str, Any]], Optional[str], Optional[List[Dict[str, Any]]]]
+
+
+class FileProcessor:
+    """
+    Processes a single .bin file into its XML and JSON outputs.
+
+    Keeps its own decryptor and converter so that each worker process
+    can hold one instance for its whole lifetime.
+    """
+
+    # Files that can be written for each document
+    OUTPUTS = ("xml", "json")
+
+    def __init__(
+        self,
+        json_style: str = "pretty",
+        profile: bool = False,
+        sqlite_path: Optional[str] = None,
+        columnar_path: Optional[str] = None,
+        columnar_format: str = "parquet",
+        output_format: str = "json",
+        compress: bool = False,
+        outputs: Tuple[str, ...] = ("xml", "json"),
+        index_path: Optional[str] = None,
+        store_path: Optional[str] = None,
+        keep_outputs: bool = False,
+        strings_path: Optional[str] = None
+    ):
+        """
+        Initialize the processor with its decryptor and converter.
+
+        Args:
+            json_style: Style of the JSON output (pretty, compact or ndjson)
+            profile: Whether per-stage time and memory are measured
+            sqlite_path: SQLite database the documents are also exported to (optional)
+            columnar_path: Directory of the columnar tables of each document (optional)
+            columnar_format: Format of the columnar tables (parquet or arrow)
+            output_format: Format of the converted document (json, msgpack or cbor)
+            compress: Whether binary documents are compressed with zstd
+            outputs: Files written for each document (xml and/or json); the work
+                only needed by a skipped output is not done at all
+            index_path: Directory of the lookup index shards (optional, needs the xml output)
+            store_path: Content-addressed store the XML/JSON outputs are linked to (optional)
+            keep_outputs: Return the XML/JSON outputs in the record ("contents")
+                instead of writing them, for the archive output
+            strings_path: String table compiled from localization.bin (optional)
+        """
+        self.logger = logging.getLogger(__name__)
+        self._decryptor = BinaryDecryptor()
+        self._converter = Converter(JsonSerializer(json_style))
+        self._profiler = StageProfiler(profile)
+        self._outputs = outputs
+        self._output_format = output_format
+        self._exporter = SqliteExporter(Path(sqlite_path)) if sqlite_path else None
+        self._indexer = Indexer(Path(index_path)) if index_path else None
+        self.store = ContentStore(Path(store_path)) if store_path else None
+        self._keep_outputs = keep_outputs
+        self._strings_path = Path(strings_path) if strings_path else None
+
+        # msgpack/cbor2/zstandard and pyarrow are only loaded when enabled
+        self._binary: Optional['BinarySerializer'] = None
+        if output_format != "json":
+            from ..utils.BinarySerializer import BinarySerializer
+            self._binary = BinarySerializer(output_format, compress)
+        self._columnar: Optional['ColumnarExporter'] = None
+        if columnar_path:
+            from ..utils.ColumnarExporter import ColumnarExporter
+            self._columnar = ColumnarExporter(Path(columnar_path), columnar_format)
+
+    def process(
+        self,
+        bin_file: Path,
+        xml_path: Path,
+        json_path: Path,
+        key: Optional[str] = None,
+        bin_content: Optional[bytes] = None,
+        writer: Optional['OutputWriter'] = None
+    ) -> Dict[str, Any]:
+        """
+        Decrypt a .bin file and write its XML and JSON representations.
+
+        Args:
+            bin_file: Source .bin file
+            xml_path: Destination of the decrypted XML
+            json_path: Destination of the converted document (JSON or binary)
+            key: Document path used by the SQLite and columnar exports (default: file name)
+            bin_content: Content of the .bin file when it was already read
+            writer: Writer the outputs are queued to instead of written here;
+                their hashes in the record are then futures
+
+        Returns:
+            Dict: Manifest record with the source stats and output hashes
+            (and the outputs themselves under "contents" when they are kept)
+        """
+        outputs = self._outputs
+        profiler = self._profiler
+
+        # Ensure output directories exist
+        if "xml" in outputs and not self._keep_outputs:
+            xml_path.parent.mkdir(parents=True, exist_ok=True)
+        if "json" in outputs and not self._keep_outputs:
+            json_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Read .bin file content
+        stat = bin_file.stat()
+        if bin_content is None:
+            with profiler.stage("read", stat.st_size) as stage:
+                bin_content = bin_file.read_bytes()
+                stage.bytes_out = len(bin_content)
+
+        # Decrypt .bin file content
+        with profiler.stage("decrypt", len(bin_content)) as stage:
+            content = self._decryptor.decrypt_bin(bin_content)
+            stage.bytes_out = len(content)
+
+        # Hashes of the outputs written by the writer, and the kept outputs
+        written: Dict[str, Any] = {}
+        contents: List[Tuple[str, bytes]] = []
+
+        if "xml" in outputs:
+            # Save the decrypted bytes as XML, without the UTF-8 BOM
+            with profiler.stage("write_xml", len(content)) as stage:
+                xml_content = memoryview(content)[self._bom_length(content):]
+                saved = self._save(xml_path, xml_content, writer, contents)
+                if saved is not None:
+                    written["xml"] = saved
+                stage.bytes_out = len(xml_content)
+
+            # Locate the elements of the XML file for the lookup index
+            if self._indexer is not None:
+                with profiler.stage("index", len(xml_content)):
+                    xml_file = os.path.relpath(xml_path, self._indexer.index_path.parent)
+                    self._indexer.write(key or bin_file.name, Path(xml_file).as_posix(), xml_content)
+
+        if "json" in outputs:
+            # Convert to JSON using the converter (handles special cases),
+            # parsing the raw bytes straight to the JSON file
+            with profiler.stage(f"convert_{self._output_format}", len(content)) as stage:
+                if writer is not None or self.store is not None or self._keep_outputs:
+                    # The store needs the content to know whether it must be written
+                    json_content = self._convert_in_memory(content, bin_file)
+                    written["json"] = self._save(json_path, json_content, writer, contents)
+                    stage.bytes_out = len(json_content)
+                else:
+                    if self._binary is not None:
+                        self._converter.write_binary(content, bin_file, json_path, self._binary)
+                    else:
+                        self._converter.write_json(content, bin_file, json_path)
+                    stage.bytes_out = json_path.stat().st_size if profiler.enabled else 0
+
+        # Load the document into the SQLite export
+        if self._exporter is not None:
+            with profiler.stage("sqlite", len(content)):
+                self._exporter.export(key or bin_file.name, content)
+
+        # Write the columnar tables of the document
+        if self._columnar is not None:
+            with profiler.stage("columnar", len(content)):
+                self._columnar.export(key or bin_file.name, content)
+
+        # Compile the localization strings into their lookup table
+        if self._strings_path is not None and bin_file.name == StringTable.SOURCE_NAME:
+            with profiler.stage("strings", len(content)):
+                StringTable.compile(memoryview(content)[self._bom_length(content):], self._strings_path)
+
+        # Hash source and outputs for the manifest
+        with profiler.stage("hash", len(bin_content)):
+            paths = {"xml": xml_path, "json": json_path}
+            record = {
+                "size": stat.st_size,
+                "mtime": stat.st_mtime_ns,
+                "sha256": Manifest.hash_bytes(bin_content),
+                "outputs": {
+                    output: written[output] if output in written else Manifest.hash_file(paths[output])
+                    for output in outputs
+                }
+            }
+
+        if self._keep_outputs:
+            record["contents"] = contents
+
+        return record
+
+    def _save(
+        self,
+        path: Path,
+        data: memoryview,
+        writer: Optional['OutputWriter'],
+        contents: List[Tuple[str, bytes]]
+    ) -> Union[str, 'Future[str]', None]:
+        """
+        Write an output buffer to its destination.
+
+        Args:
+            path: Output file
+            data: Content of the output
+            writer: Writer the output is queued to (optional)
+            contents: Outputs kept in memory, appended to when they are kept
+
+        Returns:
+            The SHA-256 of the content (or its future), or None when the
+            file was written here and is hashed afterwards
+        """
+        if self._keep_outputs:
+            # Copied, the decrypted buffer is reused by the next file
+            contents.append((str(path), bytes(data)))
+            return Manifest.hash_bytes(data)  # type: ignore
+        if writer is not None:
+            return writer.write(path, data)
+        if self.store is not None:
+            return self.store.put(path, data)
+
+        with open(path, 'wb') as f:
+            f.write(data)
+        return None
+
+    def _convert_in_memory(self, content: bytes, bin_file: Path) -> memoryview:
+        """
+        Convert the document into an in-memory buffer.
+
+        Args:
+            content: Decrypted XML bytes
+            bin_file: Source .bin file (used to detect special file types)
+
+        Returns:
+            memoryview: Encoded document, ready to be written
+        """
+        if self._binary is not None:
+            return memoryview(self._converter.convert_binary(content, bin_file, self._binary))
+
+        buffer = io.BytesIO()
+        text = io.TextIOWrapper(buffer, encoding='utf-8')
+        self._converter.stream_json(content, bin_file, text)
+        text.flush()
+        text.detach()
+        return buffer.getbuffer()
+
+    @staticmethod
+    def _bom_length(content: bytes) -> int:
+        """Get the length of the UTF-8 BOM at the start of the content, if any."""
+        return len(codecs.BOM_UTF8) if content.startswith(codecs.BOM_UTF8) else 0
+
+    def close(self) -> None:
+        """Release the resources held for profiling and exporting."""
+        self._profiler.stop()
+        if self._exporter is not None:
+            self._exporter.close()
+
+    def run_task(
+        self,
+        task: FileTask,
+        bin_content: Optional[bytes] = None,
+        writer: Optional['OutputWriter'] = None
+    ) -> FileResult:
+        """
+        Process a task, capturing any error instead of raising it.
+
+        Args:
+            task: Tuple of (bin file, xml output, json output, key)
+            bin_content: Content of the .bin file when it was already read
+            writer: Writer the outputs are queued to (see process)
+
+        Returns:
+            FileResult: The bin file, its manifest record, the error message
+            and the stage measurements, if any
+        """
+        bin_file, xml_path, json_path, key = task
+        try:
+            record, error = self.process(bin_file, xml_path, json_path, key, bin_content, writer), None
+        except Exception as e:
+            record, error = None, str(e)
+        return bin_file, record, error, self._profiler.collect()
+
+
+# Processor owned by the current worker process
+_worker_processor: Optional[FileProcessor] = None
+
+
+def init_worker(options: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Create the processor used by a worker process.
+
+    Args:
+        options: Keyword arguments of the FileProcessor
+    """
+    global _worker_processor
+    _worker_processor = FileProcessor(**(options or {}))
+
+
+def process_task(task: FileTask) -> FileResult:
+    """
+    Process a task inside a worker process.
+
+    Args:
+        task: Tuple of (bin file, xml output, json output, key)
+
+    Returns:
+        FileResult: The bin file, its manifest record, the error message
+        and the stage measurements, if any
+    """
+    if _worker_processor is None:
+        init_worker()
+    return _worker_processor.run_task(task)  # type: ignore
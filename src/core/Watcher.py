@@ -0,0 +1,327 @@
+"""
+GameData watcher for Noki Bin Dumpper.
+Reports the .bin files changed by a game update, grouped in batches once
+the writes settle.
+"""
+import os
+import time
+import ctypes
+import ctypes.util
+import select
+import struct
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+
+class _InotifyBackend:
+    """
+    Linux change notifications through the inotify system calls.
+
+    Every directory of the tree gets a watch; directories created later
+    (or moved in) are watched as soon as they appear. The .bin files of
+    the tree are tracked so that deleting a directory, or moving it out,
+    reports the files it held.
+    """
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_Q_OVERFLOW = 0x00004000
+    IN_ISDIR = 0x40000000
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    # struct inotify_event: wd, mask, cookie, len, then the padded name
+    EVENT = struct.Struct("iIII")
+    READ_SIZE = 64 * 1024
+
+    name = "inotify"
+
+    def __init__(self, root: Path):
+        """
+        Start watching a directory tree.
+
+        Args:
+            root: Directory to watch
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        self.root = root
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._watches: Dict[int, Path] = {}
+        self._files: Set[Path] = set()
+        self._add_tree(root)
+
+    def _add_tree(self, directory: Path) -> Set[Path]:
+        """Watch a directory and its subdirectories, returning the .bin files already inside."""
+        found: Set[Path] = set()
+        for dirpath, _, filenames in os.walk(directory):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dirpath), self.MASK)
+            if wd >= 0:
+                self._watches[wd] = Path(dirpath)
+            found.update(Path(dirpath, name) for name in filenames if name.endswith(".bin"))
+        self._files.update(found)
+        return found
+
+    def _remove_tree(self, directory: Path) -> Set[Path]:
+        """Stop watching a directory gone from the tree, returning the .bin files it held."""
+        for wd, path in list(self._watches.items()):
+            if path == directory or directory in path.parents:
+                # Watches of deleted directories are already gone, the call just fails
+                self._libc.inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+        removed = {path for path in self._files if directory in path.parents}
+        self._files -= removed
+        return removed
+
+    def _rewatch(self) -> None:
+        """Watch the whole tree again, after events (and directories created meanwhile) were lost."""
+        for wd in self._watches:
+            self._libc.inotify_rm_watch(self._fd, wd)
+        self._watches.clear()
+        self._files.clear()
+        self._add_tree(self.root)
+
+    def read(self, timeout: float) -> Optional[Set[Path]]:
+        """
+        Wait for changes.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Set[Path]: Changed .bin files, or None if events were lost
+            and the whole tree must be checked
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        try:
+            data = os.read(self._fd, self.READ_SIZE)
+        except BlockingIOError:
+            return set()
+
+        return self._parse(data)
+
+    def _parse(self, data: bytes) -> Optional[Set[Path]]:
+        """
+        Turn a buffer of inotify events into the changed .bin files.
+
+        Args:
+            data: Events read from the inotify descriptor
+
+        Returns:
+            Set[Path]: Changed .bin files, or None if the event queue overflowed
+        """
+        changed: Set[Path] = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                # The rest of the buffer is covered by the full check that follows
+                self._rewatch()
+                return None
+
+            directory = self._watches.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory.joinpath(os.fsdecode(name))
+
+            if mask & self.IN_ISDIR:
+                # Files can land in a new directory before its watch exists
+                if mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                    changed.update(self._add_tree(path))
+                elif mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    changed.update(self._remove_tree(path))
+            elif path.suffix == ".bin" and not mask & self.IN_CREATE:
+                # Creation is followed by IN_CLOSE_WRITE once the file is complete
+                changed.add(path)
+                if mask & (self.IN_DELETE | self.IN_MOVED_FROM):
+                    self._files.discard(path)
+                else:
+                    self._files.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Stop watching."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class _PollingBackend:
+    """
+    Portable change detection comparing the size and modification time
+    of every .bin file between two scans.
+    """
+
+    name = "polling"
+
+    def __init__(self, root: Path, interval: float, stop: threading.Event):
+        """
+        Take the first snapshot of a directory tree.
+
+        Args:
+            root: Directory to watch
+            interval: Time between two scans in seconds
+            stop: Event interrupting the wait between scans
+        """
+        self.root = root
+        self.interval = interval
+        self._stop = stop
+        self._snapshot = self._scan()
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        """Get the size and modification time of every .bin file."""
+        snapshot = {}
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith(".bin"):
+                    path = Path(dirpath, name)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def read(self, timeout: float) -> Optional[Set[Path]]:
+        """
+        Wait for the next scan and compare it with the previous one.
+
+        Args:
+            timeout: Maximum wait in seconds
+
+        Returns:
+            Set[Path]: Added, modified and removed .bin files
+        """
+        self._stop.wait(min(timeout, self.interval))
+        snapshot = self._scan()
+        previous, self._snapshot = self._snapshot, snapshot
+        return {path for path in previous.keys() | snapshot.keys() if previous.get(path) != snapshot.get(path)}
+
+    def close(self) -> None:
+        """Stop watching."""
+
+
+class GameDataWatcher:
+    """
+    Watches a GameData directory for .bin files changed by an update.
+
+    Uses inotify on Linux and falls back to polling elsewhere. Launcher
+    patches write many files in bursts, so changes are collected until
+    no new one arrives for the debounce delay and then handed over as a
+    single batch.
+
+    Example:
+        watcher = GameDataWatcher(game_data_path)
+        for changed in watcher.batches():
+            platform.process_bin_files(changed)
+    """
+
+    # Quiet time after the last change before a batch is released
+    DEBOUNCE = 2.0
+
+    # Time between two scans of the polling backend
+    POLL_INTERVAL = 2.0
+
+    # Longest wait before the stop flag is checked again
+    WAKE_INTERVAL = 1.0
+
+    def __init__(self, game_data_path: Path, debounce: float = DEBOUNCE,
+                 poll_interval: float = POLL_INTERVAL, use_inotify: bool = True,
+                 known_files: Optional[Callable[[], Iterable[Path]]] = None):
+        """
+        Start watching a GameData directory.
+
+        Args:
+            game_data_path: Directory to watch
+            debounce: Quiet time in seconds before a batch is released
+            poll_interval: Time between two scans when polling
+            use_inotify: If False, always poll
+            known_files: Returns the .bin files extracted so far, reported
+                along with the files on disk when events are lost so that
+                the ones deleted meanwhile are removed too
+        """
+        self.logger = logging.getLogger(__name__)
+        self.game_data_path = Path(game_data_path)
+        self.debounce = debounce
+        self.known_files = known_files
+        self._stop = threading.Event()
+        self._backend = None
+
+        if use_inotify:
+            try:
+                self._backend = _InotifyBackend(self.game_data_path)
+            except (OSError, AttributeError) as e:
+                self.logger.debug(f"inotify not available, polling instead: {e}")
+
+        if self._backend is None:
+            self._backend = _PollingBackend(self.game_data_path, poll_interval, self._stop)
+
+    @property
+    def backend(self) -> str:
+        """Get the name of the change detection backend (inotify or polling)."""
+        return self._backend.name
+
+    def batches(self) -> Iterator[Set[Path]]:
+        """
+        Yield the changed .bin files, one batch per burst of writes.
+
+        Removed files are included, so the caller can tell them apart by
+        checking whether they still exist.
+
+        Yields:
+            Set[Path]: .bin files changed since the previous batch
+        """
+        pending: Set[Path] = set()
+        last_change = 0.0
+
+        while not self._stop.is_set():
+            if pending:
+                timeout = max(0.0, last_change + self.debounce - time.monotonic())
+            else:
+                timeout = self.WAKE_INTERVAL
+
+            changed = self._backend.read(min(timeout, self.WAKE_INTERVAL))
+            if changed is None:
+                # Events were lost, let the manifest sort out the whole tree
+                self.logger.warning("Too many changes at once, checking every file")
+                changed = set(self.game_data_path.rglob("*.bin"))
+                if self.known_files is not None:
+                    changed.update(self.known_files())
+
+            if changed:
+                pending.update(changed)
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= self.debounce:
+                yield pending
+                pending = set()
+
+    def stop(self) -> None:
+        """Make batches() return, from any thread."""
+        self._stop.set()
+
+    def close(self) -> None:
+        """Stop watching and release the backend."""
+        self.stop()
+        self._backend.close()
@@ -0,0 +1,219 @@
+"""
+Cross-version diff for Noki Bin Dumpper.
+Compares two game builds, either two extraction outputs or two GameData
+directories, and reports the keyed changes of every modified document.
+"""
+import json
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from .DocumentDiff import Change, diff_documents, summarize
+from ..utils import BinaryDecryptor, Converter, Manifest, JsonSerializer
+
+
+class BuildSource:
+    """
+    One side of a diff: an extraction output or a GameData directory.
+
+    Extraction outputs are recognized by their manifest, which already
+    holds the size and hash of every source file, so comparing two
+    outputs reads no document at all until a difference is found.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open a build.
+
+        Args:
+            path: Extraction output directory (with manifest.json) or GameData directory
+
+        Raises:
+            ValueError: If the directory holds neither a manifest nor .bin files
+        """
+        self.path = Path(path)
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._settings: Dict[str, Any] = {}
+        self._files: Dict[str, Path] = {}
+
+        manifest_path = self.path.joinpath(Manifest.FILE_NAME)
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._settings = data.get("settings", {})
+            self._entries = data.get("files", {})
+        else:
+            self._files = {
+                bin_file.relative_to(self.path).as_posix(): bin_file
+                for bin_file in self.path.rglob("*.bin")
+            }
+            if not self._files:
+                raise ValueError(f"{self.path} is neither an extraction output nor a GameData directory")
+
+    @property
+    def is_output(self) -> bool:
+        """Check whether the build is an extraction output."""
+        return not self._files
+
+    def sizes(self) -> Dict[str, int]:
+        """
+        Get the size of the source file of every document.
+
+        Returns:
+            Dict[str, int]: Source size by document key
+        """
+        if self.is_output:
+            return {key: entry["size"] for key, entry in self._entries.items()}
+        return {key: bin_file.stat().st_size for key, bin_file in self._files.items()}
+
+    def digest(self, key: str) -> str:
+        """
+        Get the hash of the source file of a document.
+
+        Args:
+            key: Document path relative to GameData
+
+        Returns:
+            str: Hex SHA-256 of the .bin file
+        """
+        if self.is_output:
+            return self._entries[key]["sha256"]
+        return Manifest.hash_file(self._files[key])
+
+    def load(self, key: str) -> Any:
+        """
+        Load a document as built by the converter.
+
+        Outputs are read from their converted document when it was written,
+        else from their XML file; GameData files are decrypted and converted.
+
+        Args:
+            key: Document path relative to GameData
+
+        Returns:
+            Any: The document
+        """
+        if not self.is_output:
+            content = BinaryDecryptor().decrypt_bin(self._files[key].read_bytes())
+            return Converter().convert_to_json(content, Path(key))
+
+        outputs = self._settings.get("outputs", ["xml", "json"])
+        if "json" in outputs:
+            output_format = self._settings.get("output_format", "json")
+            if output_format == "json":
+                extension = JsonSerializer(self._settings.get("json_style", "pretty")).extension
+            else:
+                from ..utils.BinarySerializer import BinarySerializer
+                extension = BinarySerializer(output_format, self._settings.get("compress", False)).extension
+            # msgpack/cbor2/zstandard are only loaded to read binary outputs
+            from ..utils.Loader import load_document
+            return load_document(self.path.joinpath(output_format, key).with_suffix(extension))
+
+        xml_file = self.path.joinpath("xml", key).with_suffix('.xml')
+        return Converter().convert_to_json(xml_file.read_bytes(), Path(key))
+
+
+class BuildDiff:
+    """
+    Compares two builds of the game data.
+
+    Documents are compared by source size, then by hash, so identical
+    files are skipped without being read (outputs) or decrypted (GameData).
+    Only the changed documents are loaded and diffed structurally, across
+    a process pool when more than one worker is set.
+
+    Example:
+        changeset = BuildDiff(Path("output-old"), Path("output-new")).run()
+        changeset["changed"]["items.bin"]["items/weapon[T4_MAIN_SWORD]/@tier"]
+    """
+
+    def __init__(self, old_path: Path, new_path: Path, workers: int = 1):
+        """
+        Initialize the diff.
+
+        Args:
+            old_path: Previous build (extraction output or GameData directory)
+            new_path: Current build (extraction output or GameData directory)
+            workers: Number of processes diffing the changed documents
+        """
+        self.logger = logging.getLogger(__name__)
+        self.old = BuildSource(old_path)
+        self.new = BuildSource(new_path)
+        self.workers = max(1, workers)
+
+    def changed_keys(self) -> Tuple[List[str], List[str], List[str], int]:
+        """
+        Find the documents that differ between the builds.
+
+        Returns:
+            Tuple: Added keys, removed keys, changed keys and number of identical documents
+        """
+        old_sizes = self.old.sizes()
+        new_sizes = self.new.sizes()
+
+        added = sorted(key for key in new_sizes if key not in old_sizes)
+        removed = sorted(key for key in old_sizes if key not in new_sizes)
+        changed = []
+        identical = 0
+
+        for key in sorted(key for key in new_sizes if key in old_sizes):
+            # Different sizes need no hashing
+            if old_sizes[key] != new_sizes[key] or self.old.digest(key) != self.new.digest(key):
+                changed.append(key)
+            else:
+                identical += 1
+
+        return added, removed, changed, identical
+
+    def diff(self, key: str) -> Dict[str, Change]:
+        """
+        Diff a document present in both builds.
+
+        Args:
+            key: Document path relative to GameData
+
+        Returns:
+            Dict[str, Change]: [old, new] value of each changed path
+        """
+        return diff_documents(self.old.load(key), self.new.load(key))
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Compare the builds.
+
+        Returns:
+            Dict: Changeset with the added and removed document keys, the
+            changes of every modified document and a summary
+        """
+        added, removed, changed, identical = self.changed_keys()
+        self.logger.info(f"{len(changed)} changed, {len(added)} added, {len(removed)} removed, {identical} identical")
+
+        if self.workers > 1 and len(changed) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(changed))) as executor:
+                diffs = list(executor.map(self.diff, changed))
+        else:
+            diffs = [self.diff(key) for key in changed]
+
+        # Files changed only in ways the documents don't show (e.g. formatting)
+        documents = {key: changes for key, changes in zip(changed, diffs) if changes}
+        counts = [summarize(changes) for changes in documents.values()]
+
+        return {
+            "old": str(self.old.path),
+            "new": str(self.new.path),
+            "summary": {
+                "identical": identical + len(changed) - len(documents),
+                "added": len(added),
+                "removed": len(removed),
+                "changed": len(documents),
+                "values": {
+                    "added": sum(count[0] for count in counts),
+                    "removed": sum(count[1] for count in counts),
+                    "modified": sum(count[2] for count in counts)
+                }
+            },
+            "added": added,
+            "removed": removed,
+            "changed": documents
+        }
@@ -0,0 +1,132 @@
+"""
+Structural diff of converted documents for Noki Bin Dumpper.
+Compares two documents element by element, matching repeated elements
+by their key attribute instead of their position.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+# Attributes identifying an element among its siblings, by priority
+KEY_ATTRIBUTES = ("@uniquename", "@id", "@tuid")
+
+# Change of a value: [old value, new value], None when added or removed
+Change = List[Any]
+
+
+def diff_documents(old: Any, new: Any) -> Dict[str, Change]:
+    """
+    Compare two documents as built by the converter.
+
+    Repeated elements are matched by @uniquename, then @id (and @tuid for
+    localization units), so inserting an item doesn't report every item
+    after it as changed. Elements without a key are matched by position.
+
+    Args:
+        old: Previous document
+        new: Current document
+
+    Returns:
+        Dict[str, Change]: [old, new] value of each changed path, e.g.
+        ``items/weapon[T4_MAIN_SWORD]/@tier``. Added and removed elements
+        are reported whole, with None on the missing side.
+    """
+    changes: Dict[str, Change] = {}
+    _diff(old, new, "", changes)
+    return changes
+
+
+def _diff(old: Any, new: Any, path: str, changes: Dict[str, Change]) -> None:
+    """Record the differences between two values under a path."""
+    if old == new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for name in _merged_keys(old, new):
+            _diff(old.get(name), new.get(name), _join(path, name), changes)
+        return
+
+    if _is_element(old) and _is_element(new) and (isinstance(old, list) or isinstance(new, list)):
+        # xmltodict gives a single element as a dict and several as a list
+        _diff_siblings(_as_list(old), _as_list(new), path, changes)
+        return
+
+    changes[path] = [old, new]
+
+
+def _diff_siblings(old: List[Any], new: List[Any], path: str, changes: Dict[str, Change]) -> None:
+    """Match repeated elements by key and record the differences of each pair."""
+    old_keyed = _keyed(old)
+    new_keyed = _keyed(new)
+
+    for key in _merged_keys(old_keyed, new_keyed):
+        _diff(old_keyed.get(key), new_keyed.get(key), f"{path}[{key}]", changes)
+
+
+def _keyed(elements: List[Any]) -> Dict[str, Any]:
+    """
+    Index sibling elements by key.
+
+    Elements without a key attribute are indexed by position; a repeated
+    key gets its occurrence number so no element is lost.
+    """
+    keyed: Dict[str, Any] = {}
+    seen: Dict[str, int] = {}
+
+    for position, element in enumerate(elements):
+        key = _element_key(element)
+        if key is None:
+            key = f"#{position}"
+        elif key in seen:
+            seen[key] += 1
+            key = f"{key}#{seen[key]}"
+        else:
+            seen[key] = 0
+        keyed[key] = element
+
+    return keyed
+
+
+def _element_key(element: Any) -> Optional[str]:
+    """Get the key attribute value of an element, if any."""
+    if isinstance(element, dict):
+        for name in KEY_ATTRIBUTES:
+            value = element.get(name)
+            if isinstance(value, str):
+                return value
+    return None
+
+
+def _merged_keys(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    """Get the keys of both dicts, old order first, then the new keys."""
+    return list(old) + [key for key in new if key not in old]
+
+
+def _is_element(value: Any) -> bool:
+    """Check whether a value is an element or a list of elements."""
+    return value is None or isinstance(value, (dict, list))
+
+
+def _as_list(value: Any) -> List[Any]:
+    """Get a value as a list of siblings."""
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _join(path: str, name: str) -> str:
+    """Append a name to a path."""
+    return f"{path}/{name}" if path else name
+
+
+def summarize(changes: Dict[str, Change]) -> Tuple[int, int, int]:
+    """
+    Count the added, removed and modified values of a document diff.
+
+    Args:
+        changes: Result of diff_documents
+
+    Returns:
+        Tuple[int, int, int]: Added, removed and modified counts
+    """
+    added = sum(1 for old, _ in changes.values() if old is None)
+    removed = sum(1 for old, new in changes.values() if old is not None and new is None)
+    return added, removed, len(changes) - added - removed
@@ -0,0 +1,9 @@
+"""
+Cross-version diff for Noki Bin Dumpper.
+Finds the documents changed between two game builds and reports their
+changes element by element.
+"""
+from .DocumentDiff import diff_documents
+from .BuildDiff import BuildDiff, BuildSource
+
+__all__ = ["diff_documents", "BuildDiff", "BuildSource"]
@@ -0,0 +1,156 @@
+"""
+Query API of the lookup index for Noki Bin Dumpper.
+Answers point lookups and attribute queries from the index shards and
+only reads the bytes of the matching elements.
+"""
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from .Indexer import Indexer
+
+
+class IndexEntry(NamedTuple):
+    """Location of an element in an extracted XML file."""
+
+    document: str
+    xml_file: Path
+    offset: int
+    length: int
+    tag: str
+    attributes: Dict[str, str]
+
+
+class GameIndex:
+    """
+    In-memory view of the index of an extraction output.
+
+    Shards are loaded once; lookups by uniquename or id are dict accesses
+    and loading an element only reads and parses its own bytes.
+
+    Example:
+        index = GameIndex(Path("output"))
+        index.get("T4_BAG")
+        index.query(tag="mob", tier="6")
+    """
+
+    # Attributes used as lookup keys
+    KEY_ATTRIBUTES = ("uniquename", "id")
+
+    def __init__(self, output_path: Path):
+        """
+        Initialize the index of an extraction output.
+
+        Args:
+            output_path: Extraction output directory (holding index/ and xml/)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.output_path = Path(output_path)
+        self._indexer = Indexer(self.output_path.joinpath(Indexer.DIR_NAME))
+        self._entries: Optional[List[IndexEntry]] = None
+        self._keys: Dict[str, List[IndexEntry]] = {}
+
+    def load(self) -> 'GameIndex':
+        """
+        Load all the shards in memory.
+
+        Returns:
+            GameIndex: The same index instance
+        """
+        entries: List[IndexEntry] = []
+        keys: Dict[str, List[IndexEntry]] = {}
+
+        for shard_path in self._indexer.shards():
+            shard = self._indexer.read_shard(shard_path)
+            xml_file = self.output_path.joinpath(shard["xml"])
+            for tag, offset, length, attributes in shard["entries"]:
+                entry = IndexEntry(shard["document"], xml_file, offset, length, tag, attributes)
+                entries.append(entry)
+                for name in self.KEY_ATTRIBUTES:
+                    if name in attributes:
+                        keys.setdefault(attributes[name], []).append(entry)
+
+        self._entries, self._keys = entries, keys
+        self.logger.debug(f"Index loaded: {len(entries)} elements, {len(keys)} keys")
+        return self
+
+    @property
+    def entries(self) -> List[IndexEntry]:
+        """Get every indexed element, loading the index on first use."""
+        if self._entries is None:
+            self.load()
+        return self._entries  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def locate(self, key: str) -> List[IndexEntry]:
+        """
+        Find the elements whose uniquename or id is the given key.
+
+        Args:
+            key: uniquename or id
+
+        Returns:
+            List[IndexEntry]: Matching elements, possibly from several documents
+        """
+        if self._entries is None:
+            self.load()
+        return self._keys.get(key, [])
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the first element whose uniquename or id is the given key.
+
+        Args:
+            key: uniquename or id
+
+        Returns:
+            Dict: Element as built by xmltodict ({tag: value}), or None if not found
+        """
+        entries = self.locate(key)
+        return self.read(entries[0]) if entries else None
+
+    def query(self, tag: Optional[str] = None, document: Optional[str] = None,
+              limit: Optional[int] = None, **attributes: str) -> List[IndexEntry]:
+        """
+        Find the elements matching a tag, a document and attribute values.
+
+        Args:
+            tag: Element tag (e.g. mob, equipmentitem)
+            document: Document path relative to GameData (e.g. mobs.bin)
+            limit: Maximum number of elements returned
+            **attributes: Attribute values the elements must have (compared as text)
+
+        Returns:
+            List[IndexEntry]: Matching elements in index order
+        """
+        matches = []
+        for entry in self.entries:
+            if tag is not None and entry.tag != tag:
+                continue
+            if document is not None and entry.document != document:
+                continue
+            if any(entry.attributes.get(name) != str(value) for name, value in attributes.items()):
+                continue
+            matches.append(entry)
+            if limit is not None and len(matches) >= limit:
+                break
+        return matches
+
+    def read(self, entry: IndexEntry) -> Dict[str, Any]:
+        """
+        Read and parse a single element.
+
+        Args:
+            entry: Location of the element
+
+        Returns:
+            Dict: Element as built by xmltodict ({tag: value})
+        """
+        # Same parser as Converter.convert_to_json, only loaded when needed
+        import xmltodict
+
+        with open(entry.xml_file, 'rb') as f:
+            f.seek(entry.offset)
+            return xmltodict.parse(f.read(entry.length))
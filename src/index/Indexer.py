@@ -0,0 +1,173 @@
+"""
+Index builder for Noki Bin Dumpper.
+Records where each child of the root element lives in the extracted XML
+file, one index shard per document.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+from xml.parsers import expat
+
+from ..utils.StreamingConverter import StreamingConverter
+
+
+class Indexer:
+    """
+    Builds the index shards of the extracted documents.
+
+    Each shard lists the children of the document root with their tag,
+    attributes, and byte offset and length in the XML file, so a single
+    element can later be read and parsed on its own. Shards live under
+    the index directory, mirroring the GameData tree.
+    """
+
+    DIR_NAME = "index"
+    SUFFIX = ".json"
+    FORMAT_VERSION = 1
+
+    def __init__(self, index_path: Path):
+        """
+        Initialize the indexer.
+
+        Args:
+            index_path: Directory holding the index shards
+        """
+        self.logger = logging.getLogger(__name__)
+        self.index_path = Path(index_path)
+
+    def shard_path(self, key: str) -> Path:
+        """
+        Get the shard path of a document.
+
+        Args:
+            key: Document path relative to GameData
+
+        Returns:
+            Path: Shard file of the document
+        """
+        return self.index_path.joinpath(key + self.SUFFIX)
+
+    def build(self, content: Union[bytes, memoryview]) -> List[List[Any]]:
+        """
+        Locate the children of the root element of an XML document.
+
+        Args:
+            content: XML bytes exactly as written to the XML file
+
+        Returns:
+            List: [tag, offset, length, attributes] of each root child
+
+        Raises:
+            expat.ExpatError: If the XML is malformed
+            ValueError: If the XML declares entities
+        """
+        entries: List[List[Any]] = []
+        state = {"depth": 0, "open": None}
+
+        # The element ends where the next event starts, which is exact
+        # without text buffering (self-closing tags report their end)
+        def close_pending():
+            if state["open"] is not None:
+                entry = state["open"]
+                entry[2] = parser.CurrentByteIndex - entry[1]
+                entries.append(entry)
+                state["open"] = None
+
+        def start(tag, attrs):
+            close_pending()
+            state["depth"] += 1
+            if state["depth"] == 2:
+                state["current"] = [tag, parser.CurrentByteIndex, 0, dict(zip(attrs[0::2], attrs[1::2]))]
+
+        def end(tag):
+            close_pending()
+            if state["depth"] == 2:
+                state["open"] = state["current"]
+            state["depth"] -= 1
+
+        def characters(data):
+            close_pending()
+
+        parser = StreamingConverter().create_parser()
+        parser.buffer_text = False
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+        parser.Parse(content, True)
+
+        return entries
+
+    def write(self, key: str, xml_file: str, content: Union[bytes, memoryview]) -> int:
+        """
+        Build and save the shard of a document.
+
+        Documents that are not valid XML (like profanity lists) get a shard
+        without entries.
+
+        Args:
+            key: Document path relative to GameData
+            xml_file: XML file of the document, relative to the output directory
+            content: XML bytes exactly as written to the XML file
+
+        Returns:
+            int: Number of indexed elements
+        """
+        try:
+            entries = self.build(content)
+        except (expat.ExpatError, ValueError) as e:
+            self.logger.debug(f"{key} is not XML, nothing to index: {e}")
+            entries = []
+
+        shard_path = self.shard_path(key)
+        shard_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(shard_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                "version": self.FORMAT_VERSION,
+                "document": key,
+                "xml": xml_file,
+                "entries": entries
+            }, f, ensure_ascii=False, separators=(',', ':'))
+
+        return len(entries)
+
+    def shards(self) -> Iterable[Path]:
+        """
+        List the shard files of the index.
+
+        Returns:
+            Iterable[Path]: Shard files, in no particular order
+        """
+        if not self.index_path.exists():
+            return []
+        return self.index_path.rglob("*" + self.SUFFIX)
+
+    def prune(self, keys: Iterable[str]) -> int:
+        """
+        Delete the shards of documents whose source no longer exists.
+
+        Args:
+            keys: Paths of the documents that still exist
+
+        Returns:
+            int: Number of shards deleted
+        """
+        existing = {self.shard_path(key) for key in keys}
+        stale = [path for path in self.shards() if path not in existing]
+        for path in stale:
+            path.unlink()
+        return len(stale)
+
+    @classmethod
+    def read_shard(cls, shard_path: Path) -> Dict[str, Any]:
+        """
+        Read a shard file.
+
+        Args:
+            shard_path: Shard file
+
+        Returns:
+            Dict: Document key, XML file and entries
+        """
+        with open(shard_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
@@ -0,0 +1,132 @@
+"""
+Local HTTP endpoint of the lookup index for Noki Bin Dumpper.
+Serves the GameIndex query API as JSON.
+
+Endpoints:
+    GET /get/<key>               Element whose uniquename or id is <key>
+    GET /locate/<key>            Locations of the elements with that key
+    GET /query?tag=mob&tier=6    Locations of matching elements
+                                 (limit=N, load=1 to include the elements)
+"""
+import json
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import parse_qsl, unquote, urlsplit
+from xml.parsers.expat import ExpatError
+
+from .GameIndex import GameIndex, IndexEntry
+
+
+def _describe(entry: IndexEntry) -> Dict[str, Any]:
+    """Get the JSON representation of an index entry."""
+    return {
+        "document": entry.document,
+        "tag": entry.tag,
+        "offset": entry.offset,
+        "length": entry.length,
+        "attributes": entry.attributes,
+    }
+
+
+class _IndexRequestHandler(BaseHTTPRequestHandler):
+    """Request handler answering from the index of the server."""
+
+    server: Any
+
+    # Raised when the XML output behind an entry is missing or has changed
+    READ_ERRORS = (OSError, ValueError, ExpatError)
+
+    def do_GET(self) -> None:
+        index: GameIndex = self.server.index
+        url = urlsplit(self.path)
+        parts = [unquote(part) for part in url.path.strip('/').split('/', 1)]
+
+        if parts[0] == "get" and len(parts) == 2:
+            try:
+                element = index.get(parts[1])
+            except self.READ_ERRORS as e:
+                self._send(500, {"error": f"Can't read the element {parts[1]}: {e}"})
+                return
+            if element is None:
+                self._send(404, {"error": f"Key not found: {parts[1]}"})
+            else:
+                self._send(200, element)
+        elif parts[0] == "locate" and len(parts) == 2:
+            self._send(200, [_describe(entry) for entry in index.locate(parts[1])])
+        elif parts[0] == "query" and len(parts) == 1:
+            self._query(index, dict(parse_qsl(url.query)))
+        else:
+            self._send(404, {"error": "Unknown endpoint. Use /get/<key>, /locate/<key> or /query?tag=..."})
+
+    def _query(self, index: GameIndex, params: Dict[str, str]) -> None:
+        """Answer an attribute query."""
+        load = params.pop("load", "0") == "1"
+        try:
+            limit = int(params.pop("limit")) if "limit" in params else None
+        except ValueError:
+            self._send(400, {"error": "limit must be an integer"})
+            return
+
+        entries = index.query(
+            tag=params.pop("tag", None), document=params.pop("document", None), limit=limit, **params
+        )
+        results: List[Dict[str, Any]] = []
+        for entry in entries:
+            result = _describe(entry)
+            if load:
+                try:
+                    result["element"] = index.read(entry)
+                except self.READ_ERRORS as e:
+                    self._send(500, {"error": f"Can't read the element at {entry.document}:{entry.offset}: {e}"})
+                    return
+            results.append(result)
+        self._send(200, results)
+
+    def _send(self, status: int, body: Any) -> None:
+        """Send a JSON response."""
+        data = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logging.getLogger(__name__).debug(format % args)
+
+
+def create_server(index: GameIndex, host: str = "127.0.0.1", port: int = 8765) -> ThreadingHTTPServer:
+    """
+    Create the HTTP server of an index without starting it.
+
+    Args:
+        index: Index to serve
+        host: Listening address (local only by default)
+        port: Listening port (0 picks a free one)
+
+    Returns:
+        ThreadingHTTPServer: Server, started with serve_forever()
+    """
+    server = ThreadingHTTPServer((host, port), _IndexRequestHandler)
+    server.index = index.load()  # type: ignore
+    return server
+
+
+def serve(index: GameIndex, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """
+    Serve an index until interrupted.
+
+    Args:
+        index: Index to serve
+        host: Listening address (local only by default)
+        port: Listening port
+    """
+    server = create_server(index, host, port)
+    logging.getLogger(__name__).info(f"Serving {len(index)} indexed elements on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
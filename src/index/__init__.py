@@ -0,0 +1,10 @@
+"""
+Lookup index for Noki Bin Dumpper.
+Locates the elements of the extracted XML documents by uniquename/id
+and attributes without loading whole documents.
+"""
+from .Indexer import Indexer
+from .GameIndex import GameIndex, IndexEntry
+from .Server import serve
+
+__all__ = ["Indexer", "GameIndex", "IndexEntry", "serve"]
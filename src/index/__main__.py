@@ -0,0 +1,31 @@
+"""
+Serve the lookup index of an extraction output over HTTP.
+
+Usage:
+    python -m src.index [--output ./output] [--host 127.0.0.1] [--port 8765]
+"""
+import argparse
+import logging
+from pathlib import Path
+
+from . import GameIndex, serve
+
+
+def main():
+    """Parse the arguments and serve the index."""
+    parser = argparse.ArgumentParser(description='Noki Bin Dumpper index server')
+    parser.add_argument('--output', default='output', help='Extraction output directory (default: output)')
+    parser.add_argument('--host', default='127.0.0.1', help='Listening address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Listening port (default: 8765)')
+    args = parser.parse_args()
+
+    output_path = Path(args.output)
+    if not output_path.joinpath("index").exists():
+        parser.error(f"No index found in {output_path}, run the extraction with --index first")
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    serve(GameIndex(output_path), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
 from .base import PlatformHandler
+from .archive import GameDataArchive, ArchiveMember
+from .scanner import GameDataScanner, ScannedPath
 
-__all__ = ["PlatformHandler"]
+__all__ = ["PlatformHandler", "GameDataArchive", "ArchiveMember", "GameDataScanner", "ScannedPath"]
@@ -0,0 +1,467 @@
+"""
+Archive input for Noki Bin Dumpper.
+Reads the .bin files of a GameData snapshot straight out of a zip or tar
+archive, without extracting it to disk.
+"""
+import io
+import bz2
+import gzip
+import lzma
+import time
+import fnmatch
+import logging
+import tarfile
+import zipfile
+import threading
+import importlib.util
+from pathlib import Path, PurePosixPath
+from typing import BinaryIO, Dict, List, NamedTuple, Optional
+
+
+class ArchiveStat(NamedTuple):
+    """Subset of os.stat_result used by the extraction."""
+    st_size: int
+    st_mtime_ns: int
+
+
+class ArchiveMember:
+    """
+    A .bin file inside a GameData archive.
+
+    Stands in for the Path of a .bin file in the extraction: it has the
+    name, stat(), read_bytes() and relative_to() of a file, and only holds
+    plain values so it can be sent to the worker processes.
+    """
+
+    def __init__(self, archive_path: Path, member: str, relative: str, size: int, mtime_ns: int,
+                 offset: Optional[int] = None):
+        """
+        Initialize the member.
+
+        Args:
+            archive_path: Archive file holding the member
+            member: Name of the member in the archive
+            relative: Path of the member relative to GameData
+            size: Uncompressed size in bytes
+            mtime_ns: Modification time recorded in the archive
+            offset: Offset of the data in the uncompressed tar stream (tar only)
+        """
+        self.archive_path = archive_path
+        self.member = member
+        self.relative = PurePosixPath(relative)
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offset = offset
+
+    @property
+    def name(self) -> str:
+        """Get the file name of the member."""
+        return self.relative.name
+
+    @property
+    def stem(self) -> str:
+        """Get the file name of the member without its suffix."""
+        return self.relative.stem
+
+    @property
+    def suffix(self) -> str:
+        """Get the suffix of the member."""
+        return self.relative.suffix
+
+    def stat(self) -> ArchiveStat:
+        """Get the size and modification time of the member."""
+        return ArchiveStat(self.size, self.mtime_ns)
+
+    def exists(self) -> bool:
+        """Members exist as long as their archive does."""
+        return self.archive_path.is_file()
+
+    def is_file(self) -> bool:
+        """Only regular files are listed as members."""
+        return self.exists()
+
+    def read_bytes(self) -> bytes:
+        """
+        Read the content of the member.
+
+        Returns:
+            bytes: Uncompressed content
+        """
+        return _reader(self.archive_path).read(self)
+
+    def open(self, mode: str = 'rb') -> BinaryIO:
+        """
+        Open the member for reading.
+
+        Args:
+            mode: Only 'rb' is supported
+
+        Returns:
+            BinaryIO: In-memory file with the content of the member
+        """
+        if mode != 'rb':
+            raise ValueError(f"Archive members can only be opened with 'rb', not '{mode}'")
+        return io.BytesIO(self.read_bytes())
+
+    def relative_to(self, game_data: 'GameDataArchive') -> PurePosixPath:
+        """
+        Get the path of the member relative to its GameData directory.
+
+        Args:
+            game_data: GameData archive the member was listed from
+
+        Returns:
+            PurePosixPath: Relative path of the member
+
+        Raises:
+            ValueError: If the member doesn't belong to that archive
+        """
+        if not isinstance(game_data, GameDataArchive) or game_data.path != self.archive_path:
+            raise ValueError(f"{self} is not in {game_data}")
+        return self.relative
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArchiveMember):
+            return NotImplemented
+        return (self.archive_path, self.member) == (other.archive_path, other.member)
+
+    def __hash__(self) -> int:
+        return hash((self.archive_path, self.member))
+
+    def __str__(self) -> str:
+        return f"{self.archive_path}:{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember('{self}')"
+
+
+class GameDataArchive:
+    """
+    GameData directory stored in a zip or tar archive.
+
+    The archive can hold the GameData directory itself, its content, or a
+    whole installation (in which case the GameData of the selected server
+    is used). Members are listed in archive order: compressed tar archives
+    can only be read forward, so reading them in that order decompresses
+    the archive once.
+
+    Formats: .zip, .tar, .tar.gz/.tgz, .tar.bz2, .tar.xz and
+    .tar.zst/.tzst (requires zstandard).
+    """
+
+    # Compression of each supported suffix
+    SUFFIXES = {
+        ".zip": "zip",
+        ".tar": None,
+        ".tar.gz": "gzip",
+        ".tgz": "gzip",
+        ".tar.bz2": "bz2",
+        ".tar.xz": "xz",
+        ".tar.zst": "zstd",
+        ".tzst": "zstd"
+    }
+
+    def __init__(self, path: Path, folder_name: str = "game"):
+        """
+        Initialize the archive and list its .bin files.
+
+        Args:
+            path: Archive file
+            folder_name: Installation folder of the server, used when the
+                archive holds more than one GameData directory
+
+        Raises:
+            ValueError: If the archive format is not supported
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+        self.compression = self.compression_of(self.path)
+        self.random_access = self.compression in ("zip", None)
+
+        members = self._list_members()
+        names = [member.relative.as_posix() for member in members]
+        self.prefix = self._game_data_prefix(names, folder_name)
+        self._members = [
+            ArchiveMember(self.path, member.member, name[len(self.prefix):], member.size,
+                          member.mtime_ns, member.offset)
+            for member, name in zip(members, names)
+            if name.startswith(self.prefix)
+        ]
+
+    @classmethod
+    def is_archive(cls, path: Path) -> bool:
+        """
+        Check whether a path is a supported archive file.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            bool: True for an existing file with a supported suffix
+        """
+        return Path(path).is_file() and cls._suffix(Path(path)) is not None
+
+    @classmethod
+    def compression_of(cls, path: Path) -> Optional[str]:
+        """
+        Get the compression of an archive from its suffix.
+
+        Args:
+            path: Archive file
+
+        Returns:
+            str: zip, gzip, bz2, xz, zstd, or None for a plain tar
+
+        Raises:
+            ValueError: If the suffix is not supported or zstandard is missing
+        """
+        suffix = cls._suffix(path)
+        if suffix is None:
+            raise ValueError(f"Unsupported archive {path}. Available: {', '.join(cls.SUFFIXES)}")
+
+        compression = cls.SUFFIXES[suffix]
+        # Optional zstd decompressor for .tar.zst snapshots, imported when one is read
+        if compression == "zstd" and importlib.util.find_spec("zstandard") is None:
+            raise ValueError("zstd archives require zstandard (pip install noki-bin-dumpper[binary])")
+        return compression
+
+    @classmethod
+    def _suffix(cls, path: Path) -> Optional[str]:
+        """Get the supported suffix of an archive file name, if any."""
+        name = path.name.lower()
+        # Longest first so that .tar.gz isn't taken for .tar
+        for suffix in sorted(cls.SUFFIXES, key=len, reverse=True):
+            if name.endswith(suffix):
+                return suffix
+        return None
+
+    def exists(self) -> bool:
+        """Check whether the archive file still exists."""
+        return self.path.is_file()
+
+    def find_files(self, pattern: str = "*.bin") -> List[ArchiveMember]:
+        """
+        Find the members whose file name matches a pattern.
+
+        Args:
+            pattern: Glob pattern matched against the file names (default: *.bin)
+
+        Returns:
+            List[ArchiveMember]: Matching members, in archive order
+        """
+        return [member for member in self._members if fnmatch.fnmatch(member.name, pattern)]
+
+    def close(self) -> None:
+        """Close the archive handle kept open by this process."""
+        with _readers_lock:
+            reader = _readers.pop(self.path, None)
+        if reader is not None:
+            reader.close()
+
+    def _list_members(self) -> List[ArchiveMember]:
+        """
+        List the regular files of the archive without reading their content.
+
+        Members whose name would resolve outside of the archive root
+        (absolute paths, drive letters or ".." components) are skipped, as
+        their outputs would be written outside of the output directory.
+        """
+        members = []
+
+        if self.compression == "zip":
+            with zipfile.ZipFile(self.path) as archive:
+                for info in archive.infolist():
+                    name = self._safe_name(info.filename)
+                    if info.is_dir() or name is None:
+                        continue
+                    mtime = time.mktime(info.date_time + (0, 0, -1))
+                    members.append(ArchiveMember(self.path, info.filename, name, info.file_size,
+                                                 int(mtime) * 1_000_000_000))
+            return members
+
+        # Stream mode only reads forward, which every decompressor supports
+        with _open_stream(self.path, self.compression) as stream:
+            with tarfile.open(fileobj=stream, mode='r|') as archive:
+                for info in archive:
+                    name = self._safe_name(info.name)
+                    if info.isreg() and name is not None:
+                        members.append(ArchiveMember(self.path, info.name, name, info.size,
+                                                     int(info.mtime) * 1_000_000_000, info.offset_data))
+        return members
+
+    def _safe_name(self, name: str) -> Optional[str]:
+        """
+        Normalize a member name into a path relative to the archive root.
+
+        Args:
+            name: Name of the member in the archive
+
+        Returns:
+            str: Normalized name with forward slashes, or None if the member
+            is absolute or escapes the archive root
+        """
+        path = PurePosixPath(name.replace("\\", "/"))
+        if (path.is_absolute() or not path.parts or ".." in path.parts
+                or ":" in path.parts[0]):
+            self.logger.warning(f"Skipping unsafe archive member {name!r} in {self.path}")
+            return None
+        return path.as_posix()
+
+    @staticmethod
+    def _game_data_prefix(names: List[str], folder_name: str) -> str:
+        """
+        Find the GameData directory among the member names.
+
+        Args:
+            names: Names of the archive members
+            folder_name: Installation folder of the selected server
+
+        Returns:
+            str: Prefix of the GameData members ("" when the archive root is GameData)
+        """
+        prefixes = set()
+        for name in names:
+            index = f"/{name}".rfind("/GameData/")
+            if index >= 0:
+                prefixes.add(name[:index + len("GameData/")])
+
+        if not prefixes:
+            return ""
+
+        # Snapshots of a whole installation hold one GameData per server
+        server = [prefix for prefix in prefixes if folder_name in prefix.split("/")]
+        return sorted(server or prefixes)[0]
+
+    def __str__(self) -> str:
+        return f"{self.path}:{self.prefix}" if self.prefix else str(self.path)
+
+
+def _open_stream(path: Path, compression: Optional[str]) -> BinaryIO:
+    """
+    Open the uncompressed stream of a tar archive.
+
+    Args:
+        path: Archive file
+        compression: Compression of the archive (see GameDataArchive.SUFFIXES)
+
+    Returns:
+        BinaryIO: Readable stream of the tar data
+    """
+    if compression == "gzip":
+        return gzip.open(path, 'rb')  # type: ignore
+    if compression == "bz2":
+        return bz2.open(path, 'rb')  # type: ignore
+    if compression == "xz":
+        return lzma.open(path, 'rb')  # type: ignore
+    if compression == "zstd":
+        import zstandard
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+
+class _ArchiveReader:
+    """
+    Archive handle kept open to read the members one after the other.
+
+    A compressed tar stream is only read forward: reading a member located
+    before the current position reopens the stream.
+    """
+
+    # Read size used to skip the members that aren't needed
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, path: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Archive file
+        """
+        self.path = path
+        self.compression = GameDataArchive.compression_of(path)
+        self._lock = threading.Lock()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._stream: Optional[BinaryIO] = None
+        self._position = 0
+
+    def read(self, member: ArchiveMember) -> bytes:
+        """
+        Read the content of a member.
+
+        Args:
+            member: Member of this archive
+
+        Returns:
+            bytes: Uncompressed content
+        """
+        with self._lock:
+            if self.compression == "zip":
+                if self._zip is None:
+                    self._zip = zipfile.ZipFile(self.path)
+                return self._zip.read(member.member)
+
+            offset = member.offset or 0
+            if self._stream is None or (self.compression is not None and offset < self._position):
+                self._reopen()
+
+            if self.compression is None:
+                self._stream.seek(offset)  # type: ignore
+            else:
+                self._skip(offset - self._position)
+
+            data = self._read_exact(member.size)
+            self._position = offset + len(data)
+            if len(data) != member.size:
+                raise EOFError(f"Archive {self.path} is truncated: {member.member}")
+            return data
+
+    def _reopen(self) -> None:
+        """Open the stream again from the start of the archive."""
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = _open_stream(self.path, self.compression)
+        self._position = 0
+
+    def _skip(self, size: int) -> None:
+        """Read and discard bytes of the stream."""
+        while size > 0:
+            chunk = self._stream.read(min(size, self.CHUNK_SIZE))  # type: ignore
+            if not chunk:
+                break
+            size -= len(chunk)
+            self._position += len(chunk)
+
+    def _read_exact(self, size: int) -> bytes:
+        """Read a number of bytes, the decompressors may return less per call."""
+        chunks = []
+        while size > 0:
+            chunk = self._stream.read(size)  # type: ignore
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        """Close the archive handles."""
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+
+
+# Readers opened by the current process, shared by the members of an archive
+_readers: Dict[Path, _ArchiveReader] = {}
+_readers_lock = threading.Lock()
+
+
+def _reader(path: Path) -> _ArchiveReader:
+    """Get the reader of an archive, opening it on first use in this process."""
+    with _readers_lock:
+        reader = _readers.get(path)
+        if reader is None:
+            reader = _readers[path] = _ArchiveReader(path)
+        return reader
@@ -5,10 +5,12 @@ Provides file system operations abstracted from the underlying OS.
 import os
 import platform
 import logging
-from typing import List, Optional, Dict, Any
+from typing import Iterator, List, Optional, Dict, Any, Union
 from pathlib import Path
 
 from ..enums import ServerType
+from .archive import GameDataArchive, ArchiveMember
+from .scanner import GameDataScanner
 
 class PlatformHandler:
     """
@@ -40,16 +42,20 @@ class PlatformHandler:
         system = platform.system()
         return self._default_paths.get(system)
     
-    def find_game_data_path(self, albion_path: Path, server_type: int) -> Path:
+    def find_game_data_path(self, albion_path: Path, server_type: int) -> Union[Path, GameDataArchive]:
         """
         Find the GameData directory path based on Albion installation path.
         
+        The installation path can also be a zip/tar snapshot of the
+        installation or of its GameData directory, which is then read
+        without being extracted.
+        
         Args:
-            albion_path: Base installation path for Albion Online
+            albion_path: Base installation path for Albion Online, or a snapshot archive
             server_type: Server type (1 = Live, 2 = Test)
             
         Returns:
-            Path: Path to the GameData directory
+            Path: Path to the GameData directory, or the archive holding it
             
         Raises:
             ValueError: If paths are not defined
@@ -62,6 +68,10 @@ class PlatformHandler:
         if not server_type:
             raise ValueError("Server type not defined. Use set_server_type() first.")
 
+        # Snapshot archives are read in place
+        if GameDataArchive.is_archive(albion_path):
+            return GameDataArchive(albion_path, ServerType(server_type).folder_name)
+
         # Construct GameData path
         game_data_path = os.path.join(
             albion_path, 
@@ -77,23 +87,44 @@ class PlatformHandler:
         
         return Path(game_data_path)
     
-    def find_files(self, directory: Path, pattern: str = "*.bin") -> List[Path]:
+    def iter_files(self, directory: Union[Path, GameDataArchive], pattern: str = "*.bin",
+                   cache_path: Optional[Path] = None) -> Iterator[Union[Path, ArchiveMember]]:
         """
-        Find files matching a pattern in a directory (recursively).
+        Iterate over the files matching a pattern in a directory (recursively).
+        
+        Files are yielded as the walk finds them, so they can be processed
+        before it finishes. Files of a directory carry the stat read by the
+        walk (see GameDataScanner).
         
         Args:
-            directory: Directory to search in
-            pattern: Glob pattern to match files (default: *.bin)
+            directory: Directory (or GameData archive) to search in
+            pattern: Glob pattern to match file names (default: *.bin)
+            cache_path: Listing cache reused for the unchanged directories (optional)
             
-        Returns:
-            List[Path]: List of matching file paths
+        Yields:
+            Each matching file path (archive members for an archive)
         """
         if not directory.exists():
             self.logger.warning(f"Directory not found: {directory}")
-            return []
+            return
         
-        # Find all files matching the pattern recursively
-        files = list(directory.glob(f"**/{pattern}"))
+        if isinstance(directory, GameDataArchive):
+            yield from directory.find_files(pattern)
+        else:
+            yield from GameDataScanner(cache_path).scan(directory, pattern)
+    
+    def find_files(self, directory: Union[Path, GameDataArchive], pattern: str = "*.bin") -> List[Union[Path, ArchiveMember]]:
+        """
+        Find files matching a pattern in a directory (recursively).
+        
+        Args:
+            directory: Directory (or GameData archive) to search in
+            pattern: Glob pattern to match file names (default: *.bin)
+            
+        Returns:
+            List: List of matching file paths (archive members for an archive)
+        """
+        files = list(self.iter_files(directory, pattern))
 
         # Log results
         self.logger.info(f"Found {len(files)} files matching pattern '{pattern}' in {directory}")
@@ -0,0 +1,173 @@
+"""
+GameData discovery for Noki Bin Dumpper.
+Walks GameData with os.scandir, yielding the files as they are found
+with the stat of the walk, and optionally reuses a cached listing of the
+directories that didn't change.
+"""
+import os
+import re
+import json
+import fnmatch
+import logging
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class ScannedPath(type(Path())):  # type: ignore
+    """
+    Path of a file found by the scanner.
+
+    Keeps the stat read during the walk so the size and modification time
+    checks that follow don't ask the file system again. Paths derived from
+    it or sent to another process stat the file normally.
+    """
+
+    _scan_stat: Optional[os.stat_result] = None
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        """Get the stat of the walk, or of the file system when there is none."""
+        if self._scan_stat is not None and follow_symlinks:
+            return self._scan_stat
+        return super().stat(follow_symlinks=follow_symlinks)
+
+
+class GameDataScanner:
+    """
+    Recursive file discovery built on os.scandir.
+
+    Files are yielded while the walk goes on, directories and files in
+    name order. With a cache file, the listing of each directory is saved
+    with its modification time: a directory whose mtime didn't change
+    (no file added, removed or renamed in it) isn't read again. Cached
+    files carry no stat, their size and mtime are always read from disk.
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        """
+        Initialize the scanner.
+
+        Args:
+            cache_path: File of the cached listing (optional)
+        """
+        self.logger = logging.getLogger(__name__)
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+
+    def scan(self, directory: Path, pattern: str = "*.bin") -> Iterator[ScannedPath]:
+        """
+        Find the files matching a pattern in a directory (recursively).
+
+        Args:
+            directory: Directory to walk
+            pattern: Glob pattern matched against the file names (default: *.bin)
+
+        Yields:
+            ScannedPath: Each matching file, as soon as it is found
+        """
+        root = Path(directory)
+        match = re.compile(fnmatch.translate(pattern)).match
+        cached = self._load_cache(root, pattern)
+        listing: Dict[str, Dict[str, Any]] = {}
+        reused = 0
+
+        stack = [""]
+        while stack:
+            relative = stack.pop()
+            path = root.joinpath(relative) if relative else root
+
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError as e:
+                self.logger.warning(f"Can't read directory {path}: {e}")
+                continue
+
+            entry = cached.get(relative)
+            if entry is not None and entry["mtime"] == mtime:
+                files, subdirectories, stats = entry["files"], entry["dirs"], None
+                reused += 1
+            else:
+                files, subdirectories, stats = self._read_directory(path, match)
+            listing[relative] = {"mtime": mtime, "files": files, "dirs": subdirectories}
+
+            # Built from one joined string, which pathlib only parses on demand (3.12+)
+            parent = os.fspath(path)
+            for name in files:
+                found = ScannedPath(os.path.join(parent, name))
+                if stats is not None:
+                    found._scan_stat = stats.get(name)
+                yield found
+
+            # Reversed so that the stack pops them in name order
+            for name in reversed(subdirectories):
+                stack.append(f"{relative}/{name}" if relative else name)
+
+        if self.cache_path is not None and listing != cached:
+            self._save_cache(root, pattern, listing)
+        if reused:
+            self.logger.debug(f"{reused} unchanged directories listed from {self.cache_path}")
+
+    @staticmethod
+    def _read_directory(path: Path, match: Callable) -> Tuple[List[str], List[str], Dict[str, os.stat_result]]:
+        """
+        Read a directory.
+
+        Args:
+            path: Directory to read
+            match: Compiled pattern the file names must match
+
+        Returns:
+            Tuple: Matching file names, subdirectory names and the stat of each matching file
+        """
+        files = []
+        subdirectories = []
+        stats = {}
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.name)
+                    elif match(entry.name) and entry.is_file():
+                        files.append(entry.name)
+                        # Free on Windows, elsewhere the stat the manifest check needs anyway
+                        stats[entry.name] = entry.stat()
+                except OSError:
+                    continue
+
+        files.sort()
+        subdirectories.sort()
+        return files, subdirectories, stats
+
+    def _load_cache(self, root: Path, pattern: str) -> Dict[str, Dict[str, Any]]:
+        """Load the cached listing of a directory, ignoring missing or stale caches."""
+        if self.cache_path is None or not self.cache_path.exists():
+            return {}
+
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Can't read listing cache {self.cache_path}: {e}")
+            return {}
+
+        if (data.get("version") != self.CACHE_VERSION or data.get("root") != str(root)
+                or data.get("pattern") != pattern):
+            return {}
+        return data.get("directories", {})
+
+    def _save_cache(self, root: Path, pattern: str, listing: Dict[str, Dict[str, Any]]) -> None:
+        """Write the listing cache atomically."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)  # type: ignore
+            temp_path = self.cache_path.with_suffix('.tmp')  # type: ignore
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": self.CACHE_VERSION,
+                    "root": str(root),
+                    "pattern": pattern,
+                    "directories": listing
+                }, f)
+            os.replace(temp_path, self.cache_path)  # type: ignore
+        except OSError as e:
+            self.logger.warning(f"Can't write listing cache {self.cache_path}: {e}")
@@ -0,0 +1,186 @@
+"""
+Archive output for Noki Bin Dumpper.
+Writes the output tree of an extraction into a single zip or tar archive,
+or as a tar stream to the standard output.
+"""
+import io
+import os
+import sys
+import gzip
+import time
+import logging
+import tarfile
+import zipfile
+import importlib.util
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+
+class ArchiveWriter:
+    """
+    Single archive receiving every output file of an extraction.
+
+    Members keep the layout of the output directory (xml/..., json/...,
+    manifest.json), so unpacking the archive gives the same tree as a
+    regular extraction. Nothing is written to the output directory: a file
+    archive is written next to its target and renamed once complete.
+
+    Formats:
+        .zip: deflate-compressed zip
+        .tar, .tar.gz/.tgz: tar, optionally gzip-compressed
+        .tar.zst/.tzst: zstd-compressed tar (requires zstandard)
+        -: uncompressed tar stream on the standard output
+    """
+
+    # Format of each supported suffix
+    FORMATS = {
+        ".zip": "zip",
+        ".tar": "tar",
+        ".tar.gz": "tar.gz",
+        ".tgz": "tar.gz",
+        ".tar.zst": "tar.zst",
+        ".tzst": "tar.zst"
+    }
+
+    # Target writing a tar stream to the standard output
+    STDOUT = "-"
+
+    # zstd level, a good size/speed trade-off for repeated tag names
+    ZSTD_LEVEL = 3
+
+    def __init__(self, target: Union[str, Path]):
+        """
+        Initialize the writer.
+
+        Args:
+            target: Archive file, or "-" for the standard output
+
+        Raises:
+            ValueError: If the format is not supported or zstandard is missing
+        """
+        self.logger = logging.getLogger(__name__)
+        self.target = str(target)
+        self.file_format = self.format_of(self.target)
+        self._mtime = time.time()
+        self._temp_path: Optional[Path] = None
+        self._file: Optional[BinaryIO] = None
+        self._stream: Optional[BinaryIO] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._tar: Optional[tarfile.TarFile] = None
+
+    @classmethod
+    def format_of(cls, target: Union[str, Path]) -> str:
+        """
+        Get the archive format of a target from its suffix.
+
+        Args:
+            target: Archive file, or "-" for the standard output
+
+        Returns:
+            str: zip, tar, tar.gz or tar.zst
+
+        Raises:
+            ValueError: If the format is not supported or zstandard is missing
+        """
+        if str(target) == cls.STDOUT:
+            return "tar"
+
+        name = Path(target).name.lower()
+        # Longest first so that .tar.gz isn't taken for .tar
+        for suffix in sorted(cls.FORMATS, key=len, reverse=True):
+            if name.endswith(suffix):
+                file_format = cls.FORMATS[suffix]
+                # Optional zstd compressor for .tar.zst archives, imported when one is written
+                if file_format == "tar.zst" and importlib.util.find_spec("zstandard") is None:
+                    raise ValueError("zstd archives require zstandard (pip install noki-bin-dumpper[binary])")
+                return file_format
+
+        raise ValueError(f"Unsupported archive {target}. Available: {', '.join(cls.FORMATS)} or {cls.STDOUT}")
+
+    def open(self) -> 'ArchiveWriter':
+        """
+        Create the archive.
+
+        Returns:
+            ArchiveWriter: The same writer instance
+        """
+        self._mtime = time.time()
+
+        if self.target == self.STDOUT:
+            self._tar = tarfile.open(fileobj=sys.stdout.buffer, mode='w|')
+            return self
+
+        target = Path(self.target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        self._temp_path = target.with_name(f"{target.name}.tmp")
+
+        if self.file_format == "zip":
+            self._zip = zipfile.ZipFile(self._temp_path, 'w', zipfile.ZIP_DEFLATED)
+            return self
+
+        self._file = open(self._temp_path, 'wb')
+        if self.file_format == "tar.gz":
+            self._stream = gzip.GzipFile(fileobj=self._file, mode='wb', mtime=int(self._mtime))  # type: ignore
+        elif self.file_format == "tar.zst":
+            import zstandard
+            self._stream = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL).stream_writer(self._file, closefd=False)
+        self._tar = tarfile.open(fileobj=self._stream or self._file, mode='w|')
+        return self
+
+    def add(self, name: str, data: bytes) -> None:
+        """
+        Append a file to the archive.
+
+        Args:
+            name: Path of the file relative to the output directory, with forward slashes
+            data: Content of the file
+        """
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=time.localtime(self._mtime)[:6])
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.external_attr = 0o644 << 16
+            self._zip.writestr(info, data)
+            return
+
+        if self._tar is None:
+            raise ValueError("The archive is not open. Use open() first.")
+
+        info = tarfile.TarInfo(name)
+        info.size = len(data)
+        info.mtime = int(self._mtime)
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        """Finish the archive and move it to its target."""
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._stream is not None:
+            self._stream.close()
+        if self._file is not None:
+            self._file.close()
+        if self.target == self.STDOUT:
+            sys.stdout.buffer.flush()
+        elif self._temp_path is not None:
+            os.replace(self._temp_path, self.target)
+            self.logger.info(f"Archive saved to: {self.target}")
+
+        self._zip = self._tar = self._stream = self._file = None
+        self._temp_path = None
+
+    def discard(self) -> None:
+        """Delete an unfinished archive. Does nothing once the archive is closed."""
+        for handle in (self._zip, self._tar, self._stream, self._file):
+            try:
+                if handle is not None:
+                    handle.close()
+            except Exception:
+                pass
+
+        if self._temp_path is not None and self._temp_path.exists():
+            self._temp_path.unlink()
+
+        self._zip = self._tar = self._stream = self._file = None
+        self._temp_path = None
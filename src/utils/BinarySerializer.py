@@ -0,0 +1,170 @@
+"""
+Binary serialization formats for Noki Bin Dumpper.
+Writes the converted documents as MessagePack or CBOR, optionally
+compressed with zstd.
+"""
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Optional binary backends
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - depends on the environment
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:  # pragma: no cover - depends on the environment
+    cbor2 = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None
+
+
+class BinarySerializer:
+    """
+    Binary serializer for a given document format.
+
+    Formats:
+        msgpack: MessagePack (requires msgpack)
+        cbor: CBOR (requires cbor2)
+
+    Documents hold the same structure as the JSON output (xmltodict's
+    ``@attr`` and ``#text`` keys), so both can be loaded interchangeably.
+    """
+
+    FORMATS = ("msgpack", "cbor")
+
+    # Suffix added to compressed documents
+    ZSTD_SUFFIX = ".zst"
+
+    # zstd level, a good size/speed trade-off for repeated tag names
+    ZSTD_LEVEL = 3
+
+    def __init__(self, file_format: str = "msgpack", compress: bool = False):
+        """
+        Initialize the serializer.
+
+        Args:
+            file_format: Document format (msgpack or cbor)
+            compress: Whether documents are compressed with zstd
+
+        Raises:
+            ValueError: If the format is unknown or its library is not installed
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unknown format '{file_format}'. Available: {', '.join(self.FORMATS)}")
+
+        available = self.available_formats()
+        if not available[file_format]:
+            raise ValueError(f"Format '{file_format}' requires {self._package(file_format)} (pip install noki-bin-dumpper[binary])")
+        if compress and not available["zstd"]:
+            raise ValueError("zstd compression requires zstandard (pip install noki-bin-dumpper[binary])")
+
+        self.logger = logging.getLogger(__name__)
+        self.file_format = file_format
+        self.compress = compress
+
+    @classmethod
+    def available_formats(cls) -> Dict[str, bool]:
+        """
+        Get which formats and compressors are installed.
+
+        Returns:
+            Dict[str, bool]: Availability of msgpack, cbor and zstd
+        """
+        return {"msgpack": msgpack is not None, "cbor": cbor2 is not None, "zstd": zstandard is not None}
+
+    @classmethod
+    def for_path(cls, file_path: Path) -> Optional['BinarySerializer']:
+        """
+        Get the serializer of a document from its extension.
+
+        Args:
+            file_path: Path of a document written by a BinarySerializer
+
+        Returns:
+            BinarySerializer: Matching serializer, or None for other files
+        """
+        suffixes = file_path.suffixes
+        compress = bool(suffixes) and suffixes[-1] == cls.ZSTD_SUFFIX
+        if compress:
+            suffixes = suffixes[:-1]
+
+        file_format = suffixes[-1][1:] if suffixes else None
+        if file_format not in cls.FORMATS:
+            return None
+        return cls(file_format, compress)
+
+    @staticmethod
+    def _package(file_format: str) -> str:
+        """Get the package providing a format."""
+        return {"msgpack": "msgpack", "cbor": "cbor2"}[file_format]
+
+    @property
+    def extension(self) -> str:
+        """File extension of the documents written in this format."""
+        return f".{self.file_format}" + (self.ZSTD_SUFFIX if self.compress else "")
+
+    def dumps(self, value: Any) -> bytes:
+        """
+        Serialize a value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            bytes: Encoded value, compressed if enabled
+        """
+        if self.file_format == "msgpack":
+            data = msgpack.packb(value, use_bin_type=True)
+        else:
+            data = cbor2.dumps(value)
+
+        if self.compress:
+            data = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL).compress(data)
+        return data
+
+    def loads(self, data: bytes) -> Any:
+        """
+        Deserialize a value.
+
+        Args:
+            data: Encoded value, compressed if enabled
+
+        Returns:
+            Any: Decoded value
+        """
+        if self.compress:
+            data = zstandard.ZstdDecompressor().decompress(data)
+
+        if self.file_format == "msgpack":
+            return msgpack.unpackb(data, raw=False)
+        return cbor2.loads(data)
+
+    def dump(self, value: Any, file_path: Path) -> None:
+        """
+        Write a whole document to a file.
+
+        Args:
+            value: Document to write
+            file_path: Destination file
+        """
+        with open(file_path, 'wb') as f:
+            f.write(self.dumps(value))
+
+    def load(self, file_path: Path) -> Any:
+        """
+        Read a whole document from a file.
+
+        Args:
+            file_path: Source file
+
+        Returns:
+            Any: Decoded document
+        """
+        with open(file_path, 'rb') as f:
+            return self.loads(f.read())
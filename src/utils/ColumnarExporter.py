@@ -0,0 +1,228 @@
+"""
+Columnar export backend for Noki Bin Dumpper.
+Flattens the repeated elements of each document into typed tables and
+writes them as Parquet or Arrow IPC files, one table per element type.
+"""
+import re
+import json
+import logging
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from xml.parsers import expat
+
+from .StreamingConverter import StreamingConverter, XmlSource
+
+# Optional columnar backend
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - depends on the environment
+    pyarrow = None
+
+
+class ColumnarExporter:
+    """
+    Writes the children of each document root as columnar tables.
+
+    Every child name of the root (``equipmentitem``, ``mob``, ``spell``...)
+    becomes a table with one row per element. Attributes and text become
+    columns typed as integer, float or string from their values; nested
+    children are kept as compact JSON in a column named after them.
+    Attributes keep their name: the text moves to "#text" when an
+    attribute is named "text", and a child named like an attribute or the
+    text column gets the "_children" suffix. Values are only typed as
+    numbers when every value of the column is a plain decimal number, so
+    IDs like "007" stay strings.
+    """
+
+    FORMATS = ("parquet", "arrow")
+
+    # Name of the column holding the element text
+    TEXT_COLUMN = "text"
+
+    # Appended to the column of a child element named like an attribute or the text
+    CHILD_SUFFIX = "_children"
+
+    # Values promoted to numbers: only those written back identically
+    # (no leading zeros, signs, underscores, spaces, inf or nan)
+    INTEGER = re.compile(r"0|-?[1-9][0-9]*")
+    FLOAT = re.compile(r"-?(0|[1-9][0-9]*)(\.[0-9]+)?([eE][-+]?[0-9]+)?")
+
+    def __init__(self, output_path: Path, file_format: str = "parquet"):
+        """
+        Initialize the exporter.
+
+        Args:
+            output_path: Directory receiving one folder of tables per document
+            file_format: parquet or arrow (Arrow IPC, memory-mappable)
+
+        Raises:
+            ValueError: If the format is unknown or pyarrow is not installed
+        """
+        if file_format not in self.FORMATS:
+            raise ValueError(f"Unknown columnar format '{file_format}'. Available: {', '.join(self.FORMATS)}")
+        if not self.is_available():
+            raise ValueError("Columnar export requires pyarrow (pip install noki-bin-dumpper[columnar])")
+
+        self.logger = logging.getLogger(__name__)
+        self.output_path = Path(output_path)
+        self.file_format = file_format
+        self._converter = StreamingConverter()
+
+    @staticmethod
+    def is_available() -> bool:
+        """Check whether pyarrow is installed."""
+        return pyarrow is not None
+
+    @property
+    def extension(self) -> str:
+        """File extension of the written tables."""
+        return '.parquet' if self.file_format == "parquet" else '.arrow'
+
+    def table_dir(self, key: str) -> Path:
+        """
+        Get the folder holding the tables of a document.
+
+        Args:
+            key: Document path relative to GameData
+
+        Returns:
+            Path: Output folder, named after the document without its extension
+        """
+        return self.output_path.joinpath(Path(key).with_suffix(''))
+
+    def export(self, key: str, source: XmlSource) -> Dict[str, int]:
+        """
+        Write the tables of a document, replacing the previous ones.
+
+        Documents that are not valid XML (like profanity lists) get an
+        empty folder.
+
+        Args:
+            key: Document path relative to GameData
+            source: XML text, raw XML bytes or path to an XML file
+
+        Returns:
+            Dict[str, int]: Number of rows of each written table
+        """
+        table_dir = self.table_dir(key)
+        if table_dir.exists():
+            shutil.rmtree(table_dir)
+        table_dir.mkdir(parents=True, exist_ok=True)
+
+        try:
+            records = self._converter.records(source)
+        except (expat.ExpatError, ValueError) as e:
+            self.logger.debug(f"{key} is not XML, no tables written: {e}")
+            return {}
+
+        rows = {}
+        for name, values in records.items():
+            table = self.build_table(values)
+            self.write_table(table, table_dir.joinpath(name + self.extension))
+            rows[name] = table.num_rows
+        return rows
+
+    def build_table(self, values: List[Any]) -> Any:
+        """
+        Flatten the values of an element type into a typed table.
+
+        Args:
+            values: Elements as built by xmltodict
+
+        Returns:
+            pyarrow.Table: One row per element
+        """
+        # Names taken by the attributes of any element of the table, so that
+        # a column holds the same kind of value in every row
+        attributes = {
+            key[len(StreamingConverter.ATTR_PREFIX):]
+            for value in values if isinstance(value, dict)
+            for key in value if key.startswith(StreamingConverter.ATTR_PREFIX)
+        }
+        rows = [self.flatten(value, attributes) for value in values]
+
+        # Columns in first-occurrence order
+        names: Dict[str, None] = {}
+        for row in rows:
+            names.update(dict.fromkeys(row))
+
+        return pyarrow.table({
+            name: self.build_column([row.get(name) for row in rows])
+            for name in names
+        })
+
+    def flatten(self, value: Any, attributes: Iterable[str] = ()) -> Dict[str, Optional[str]]:
+        """
+        Flatten an element into a row.
+
+        Args:
+            value: Element as built by xmltodict
+            attributes: Attribute names used by the other elements of the table
+
+        Returns:
+            Dict: Attribute and text columns, nested children as JSON
+        """
+        prefix = StreamingConverter.ATTR_PREFIX
+        taken = set(attributes)
+        if isinstance(value, dict):
+            taken.update(key[len(prefix):] for key in value if key.startswith(prefix))
+        text_column = StreamingConverter.CDATA_KEY if self.TEXT_COLUMN in taken else self.TEXT_COLUMN
+
+        if not isinstance(value, dict):
+            return {text_column: value}
+
+        row = {}
+        for key, item in value.items():
+            if key.startswith(prefix):
+                row[key[len(prefix):]] = item
+            elif key == StreamingConverter.CDATA_KEY:
+                row[text_column] = item
+            else:
+                column = key + self.CHILD_SUFFIX if key in taken or key == text_column else key
+                row[column] = json.dumps(item, ensure_ascii=False, separators=(',', ':'))
+        return row
+
+    @classmethod
+    def build_column(cls, values: List[Optional[str]]) -> Any:
+        """
+        Build a column with the narrowest type holding all its values.
+
+        Args:
+            values: Text values of the column, None where missing
+
+        Returns:
+            pyarrow.Array: int64, float64 or string column
+        """
+        present = [value for value in values if value is not None]
+
+        # Columns without values stay as strings
+        if present and all(cls.INTEGER.fullmatch(value) for value in present):
+            try:
+                return pyarrow.array([None if value is None else int(value) for value in values], type=pyarrow.int64())
+            except (OverflowError, pyarrow.ArrowInvalid):
+                # Beyond int64: a float would lose digits
+                return pyarrow.array(values, type=pyarrow.string())
+
+        if present and all(cls.FLOAT.fullmatch(value) for value in present):
+            return pyarrow.array([None if value is None else float(value) for value in values], type=pyarrow.float64())
+
+        return pyarrow.array(values, type=pyarrow.string())
+
+    def write_table(self, table: Any, path: Path) -> None:
+        """
+        Write a table in the configured format.
+
+        Args:
+            table: Table to write
+            path: Destination file
+        """
+        if self.file_format == "parquet":
+            pyarrow.parquet.write_table(table, path)
+            return
+
+        with pyarrow.OSFile(str(path), 'wb') as sink:
+            with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
@@ -0,0 +1,140 @@
+"""
+Content-addressed output store for Noki Bin Dumpper.
+Keeps a single copy of every distinct output file, shared by hard links
+across the extraction trees that contain it.
+"""
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Union
+
+from .Manifest import Manifest
+
+
+class ContentStore:
+    """
+    Directory of output blobs named after their SHA-256.
+
+    Output files are hard links to the blobs, so an unchanged document
+    extracted into a new output directory costs no write and no space.
+    The store and the output trees must be on the same file system.
+
+    Layout: objects/ab/cdef... for the blob whose hash is abcdef...
+    """
+
+    DIR_NAME = "objects"
+
+    def __init__(self, store_path: Path):
+        """
+        Initialize the store.
+
+        Args:
+            store_path: Root directory of the store
+        """
+        self.logger = logging.getLogger(__name__)
+        self.store_path = Path(store_path)
+        self.objects_path = self.store_path.joinpath(self.DIR_NAME)
+
+    def object_path(self, digest: str) -> Path:
+        """
+        Get the blob path of a hash.
+
+        Args:
+            digest: Hex SHA-256 of the content
+
+        Returns:
+            Path: Blob file
+        """
+        return self.objects_path.joinpath(digest[:2], digest[2:])
+
+    def check(self, output_path: Path) -> None:
+        """
+        Check that output files can be hard-linked to the store.
+
+        Args:
+            output_path: Output directory that will link to the store
+
+        Raises:
+            ValueError: If hard links between both directories are not supported
+        """
+        self.objects_path.mkdir(parents=True, exist_ok=True)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        probe = self.objects_path.joinpath(f".probe-{os.getpid()}")
+        link = output_path.joinpath(probe.name)
+        try:
+            probe.write_bytes(b"")
+            os.link(probe, link)
+        except OSError as e:
+            raise ValueError(f"The store {self.store_path} and the output {output_path} must be on "
+                             f"a file system supporting hard links between them: {e}")
+        finally:
+            for path in (probe, link):
+                if path.exists():
+                    path.unlink()
+
+    def put(self, target: Path, data: Union[bytes, memoryview]) -> str:
+        """
+        Store a content and link it to an output file.
+
+        The content is only written when the store doesn't hold it yet.
+
+        Args:
+            target: Output file to create or replace
+            data: Content of the output file
+
+        Returns:
+            str: Hex SHA-256 of the content
+        """
+        digest = Manifest.hash_bytes(data)  # type: ignore
+        blob = self.object_path(digest)
+
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            # Concurrent writers of the same blob each use their own file
+            temp_path = blob.with_name(f"{blob.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, blob)
+
+        self._link(blob, target)
+        return digest
+
+    @staticmethod
+    def _link(blob: Path, target: Path) -> None:
+        """Replace a file with a hard link to a blob."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f"{target.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        os.link(blob, temp_path)
+        # Replacing keeps the file readable and never writes into a shared inode
+        os.replace(temp_path, target)
+
+    def prune(self) -> int:
+        """
+        Delete the blobs no output tree links to anymore.
+
+        Returns:
+            int: Number of blobs deleted
+        """
+        deleted = 0
+        if not self.objects_path.exists():
+            return deleted
+
+        for blob in self.objects_path.glob("*/*"):
+            if blob.is_file() and blob.stat().st_nlink == 1:
+                blob.unlink()
+                deleted += 1
+
+        self.logger.info(f"{deleted} unused blobs deleted from {self.store_path}")
+        return deleted
+
+    def size(self) -> int:
+        """
+        Get the disk space used by the blobs.
+
+        Returns:
+            int: Total size in bytes
+        """
+        return sum(blob.stat().st_size for blob in self.objects_path.glob("*/*") if blob.is_file())
+
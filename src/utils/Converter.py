@@ -5,9 +5,14 @@ Handles special cases like profanity files that aren't actually valid XML.
 import os
 import json
 import logging
-import xmltodict
 from pathlib import Path
-from typing import Dict, Any, List, Union
+from typing import Dict, Any, List, Optional, TextIO, Union, TYPE_CHECKING
+
+from .Serializer import JsonSerializer
+from .StreamingConverter import StreamingConverter, XmlSource
+
+if TYPE_CHECKING:
+    from .BinarySerializer import BinarySerializer
 
 class Converter:
     """
@@ -15,16 +20,23 @@ class Converter:
     Includes special handling for non-standard files like profanity lists.
     """
     
-    def __init__(self):
-        """Initialize the converter with a logger."""
+    def __init__(self, serializer: Optional[JsonSerializer] = None):
+        """
+        Initialize the converter with a logger.
+        
+        Args:
+            serializer: JSON serializer used by write_json (default: pretty)
+        """
         self.logger = logging.getLogger(__name__)
+        self.serializer = serializer or JsonSerializer()
+        self._streaming = StreamingConverter(self.serializer)
     
-    def convert_to_json(self, content: str, file_path: Path) -> Dict[str, Any]:
+    def convert_to_json(self, content: Union[str, bytes], file_path: Path) -> Dict[str, Any]:
         """
         Convert content to JSON, with special handling for certain file types.
         
         Args:
-            content: String content to convert
+            content: Text or raw bytes to convert (bytes are parsed without decoding)
             file_path: Original file path (used to detect special file types)
             
         Returns:
@@ -32,7 +44,10 @@ class Converter:
         """
         # Check if this is a profanity file (which isn't actually XML)
         if self._is_profanity_file(file_path):
-            return self._process_profanity_file(content)
+            return self._process_profanity_file(self._read_text(content))
+        
+        # xmltodict is only loaded when needed, the extraction pipeline uses write_json
+        import xmltodict
         
         # Otherwise, try to parse as XML
         try:
@@ -40,7 +55,93 @@ class Converter:
         except Exception as e:
             self.logger.error(f"Failed to convert {file_path} to JSON: {e}")
             # Return empty dict to prevent further errors
-            return {"error": str(e), "original_content": content}
+            return {"error": str(e), "original_content": self._read_text(content)}
+    
+    def write_json(self, content: XmlSource, file_path: Path, json_path: Path) -> None:
+        """
+        Convert content to JSON and write it straight to a file.
+        
+        In the pretty style this produces the same file as dumping
+        convert_to_json with indent=4, but XML documents are streamed
+        instead of built as a whole dict.
+        
+        Args:
+            content: XML text, raw XML bytes or path to an XML file
+            file_path: Original file path (used to detect special file types)
+            json_path: Destination of the JSON document
+        """
+        with open(json_path, 'w', encoding='utf-8') as f:
+            self.stream_json(content, file_path, f)
+    
+    def stream_json(self, content: XmlSource, file_path: Path, output: TextIO) -> None:
+        """
+        Convert content to JSON and write it to an open text stream.
+        
+        Args:
+            content: XML text, raw XML bytes or path to an XML file
+            file_path: Original file path (used to detect special file types)
+            output: Seekable text stream receiving the JSON document
+        """
+        if self._is_profanity_file(file_path):
+            self.serializer.dump(self._process_profanity_file(self._read_text(content)), output)
+            return
+        
+        try:
+            self._streaming.convert(content, output)
+        except Exception as e:
+            self.logger.error(f"Failed to convert {file_path} to JSON: {e}")
+            # Replace whatever was written before the error
+            output.seek(0)
+            output.truncate()
+            self.serializer.dump({"error": str(e), "original_content": self._read_text(content)}, output)
+    
+    def write_binary(self, content: XmlSource, file_path: Path, output_path: Path, serializer: 'BinarySerializer') -> None:
+        """
+        Convert content and write it as a binary document.
+        
+        Args:
+            content: XML text, raw XML bytes or path to an XML file
+            file_path: Original file path (used to detect special file types)
+            output_path: Destination of the binary document
+            serializer: Binary serializer defining the format
+        """
+        with open(output_path, 'wb') as f:
+            f.write(self.convert_binary(content, file_path, serializer))
+    
+    def convert_binary(self, content: XmlSource, file_path: Path, serializer: 'BinarySerializer') -> bytes:
+        """
+        Convert content to an encoded binary document.
+        
+        Binary formats have no incremental encoder, so the whole document
+        is built with convert_to_json before it is encoded.
+        
+        Args:
+            content: XML text, raw XML bytes or path to an XML file
+            file_path: Original file path (used to detect special file types)
+            serializer: Binary serializer defining the format
+            
+        Returns:
+            bytes: Encoded document
+        """
+        if isinstance(content, Path):
+            content = content.read_bytes()
+        return serializer.dumps(self.convert_to_json(content, file_path))
+    
+    def _read_text(self, content: XmlSource) -> str:
+        """
+        Get the text of a content source.
+        
+        Args:
+            content: Text, raw bytes or path to a file
+            
+        Returns:
+            str: Decoded text without the UTF-8 BOM
+        """
+        if isinstance(content, Path):
+            content = content.read_bytes()
+        if isinstance(content, bytes):
+            return content.decode('utf-8-sig')
+        return content
     
     def _is_profanity_file(self, file_path: Path) -> bool:
         """
@@ -1,5 +1,6 @@
 import logging
 import zlib
+from typing import BinaryIO, Iterator
 from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
 from cryptography.hazmat.primitives.ciphers import Cipher, modes
 from cryptography.hazmat.backends import default_backend
@@ -11,36 +12,144 @@ class BinaryDecryptor:
     Classe responsável por descriptografar arquivos binários do Albion Online.
     Implementa a descriptografia usando TripleDES e descompressão zlib.
     """
-    
+
+    # Tamanho do bloco do TripleDES em bytes
+    BLOCK_SIZE = TripleDES.block_size // 8
+
+    # Tamanho padrão dos blocos lidos no modo streaming
+    CHUNK_SIZE = 1024 * 1024
+
     def __init__(self):
         """
         Inicializa o decriptador com a chave e IV configurados.
         """
         # Configura a chave e o IV
-        self.key = Config.ENCRYPTION_KEY
-        self.iv = Config.ENCRYPTION_IV
+        self._key = Config.ENCRYPTION_KEY
+        self._iv = Config.ENCRYPTION_IV
+
+        # Cipher e buffer reutilizados entre os arquivos
+        self._cipher = None
+        self._buffer = bytearray()
 
         # Configura o logger
         self.logger = logging.getLogger(__name__)
-        
+
+    @property
+    def key(self) -> bytes:
+        """Chave do TripleDES."""
+        return self._key
+
+    @key.setter
+    def key(self, value: bytes) -> None:
+        self._key = value
+        self._cipher = None
+
+    @property
+    def iv(self) -> bytes:
+        """Vetor de inicialização do CBC."""
+        return self._iv
+
+    @iv.setter
+    def iv(self, value: bytes) -> None:
+        self._iv = value
+        self._cipher = None
+
+    def _get_cipher(self) -> Cipher:
+        """
+        Retorna o cipher da instância, criando-o apenas na primeira chamada
+        ou depois de uma troca de chave/IV.
+        """
+        if self._cipher is None:
+            self._cipher = Cipher(
+                TripleDES(self._key),
+                modes.CBC(self._iv),
+                backend=default_backend()
+            )
+        return self._cipher
+
     def decrypt_bin(self, bin_content: bytes) -> bytes:
         """
         Descriptografa o conteudo de um arquivo .bin
+
+        Raises:
+            ValueError: Se o conteúdo estiver vazio, fora do tamanho de bloco ou corrompido
         """
         if not bin_content:
             raise ValueError(f"Bin content is empty")
-            
+
         try:
-            # Inicializa o cipher usando TripleDES
-            cipher = Cipher(
-                TripleDES(self.key),
-                modes.CBC(self.iv),
-                backend=default_backend()
-            )
-            
+            # Um único decryptor por arquivo, usado para update e finalize
+            decryptor = self._get_cipher().decryptor()
+
+            # Reaproveita o buffer da instância, crescendo apenas quando necessário
+            required = len(bin_content) + self.BLOCK_SIZE - 1
+            if len(self._buffer) < required:
+                self._buffer = bytearray(required)
+            buffer = memoryview(self._buffer)
+
+            # Descriptografa direto no buffer, sem cópias intermediárias
+            # (CBC sem padding: finalize apenas valida o tamanho dos blocos)
+            length = decryptor.update_into(bin_content, buffer)
+            decryptor.finalize()
+
             # Descomprime com zlib (wbits=31 para gzip)
             # 15 + 16 para formato gzip
-            return zlib.decompress(cipher.decryptor().update(bin_content) + cipher.decryptor().finalize(), 31)  
-        
+            return zlib.decompress(buffer[:length], 31)
+
+        except Exception as e:
+            raise ValueError(f"Erro na descriptografia: {e}") from e
+
+    def iter_decrypt(self, fileobj: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Descriptografa e descomprime um arquivo .bin em blocos.
+
+        Lê o arquivo em blocos de tamanho fixo e entrega o XML descomprimido
+        aos poucos, sem nunca manter o arquivo inteiro em memória. Cada bloco
+        entregue tem no máximo chunk_size bytes.
+
+        Args:
+            fileobj: Arquivo binário aberto para leitura
+            chunk_size: Tamanho dos blocos lidos e entregues
+
+        Yields:
+            bytes: Blocos do XML descomprimido
+
+        Raises:
+            ValueError: Se o arquivo estiver vazio, truncado ou corrompido
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        try:
+            decryptor = self._get_cipher().decryptor()
+            decompressor = zlib.decompressobj(31)
+            buffer = memoryview(bytearray(chunk_size + self.BLOCK_SIZE - 1))
+            empty = True
+
+            for chunk in iter(lambda: fileobj.read(chunk_size), b""):
+                empty = False
+
+                # Descriptografa o bloco e descomprime limitando o tamanho da saída
+                # (o padding depois do fim do gzip é ignorado)
+                data = buffer[:decryptor.update_into(chunk, buffer)]
+                while data and not decompressor.eof:
+                    output = decompressor.decompress(data, chunk_size)
+                    if output:
+                        yield output
+                    data = decompressor.unconsumed_tail
+
+            if empty:
+                raise ValueError(f"Bin content is empty")
+
+            # Entrega o que ainda estiver pendente no descompressor, também em blocos
+            output = memoryview(decompressor.flush())
+            for start in range(0, len(output), chunk_size):
+                yield bytes(output[start:start + chunk_size])
+
+            # Valida o tamanho dos blocos e a integridade do gzip
+            decryptor.finalize()
+            if not decompressor.eof:
+                raise zlib.error("Compressed data ended before the end-of-stream marker was reached")
+
         except Exception as e:
-            raise Exception(f"Erro na descriptografia: {e}")
\ No newline at end of file
+            raise ValueError(f"Erro na descriptografia: {e}") from e
@@ -0,0 +1,74 @@
+"""
+Document loader for Noki Bin Dumpper.
+Reads back any extracted document (JSON, NDJSON, MessagePack or CBOR)
+as the dict built by the converter.
+"""
+import json
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from .BinarySerializer import BinarySerializer
+
+
+def load_document(file_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load an extracted document, whatever the format it was written in.
+
+    The format is detected from the extension: .json, .ndjson, .msgpack
+    and .cbor, the binary ones optionally followed by .zst.
+
+    Args:
+        file_path: Path of the document
+
+    Returns:
+        Dict: Document as built by the converter (``@attr``, ``#text``...)
+
+    Raises:
+        ValueError: If the extension is not a known document format
+    """
+    file_path = Path(file_path)
+
+    serializer = BinarySerializer.for_path(file_path)
+    if serializer is not None:
+        return serializer.load(file_path)
+
+    if file_path.suffix == '.json':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    if file_path.suffix == '.ndjson':
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return _merge_ndjson([json.loads(line) for line in f if line.strip()])
+
+    raise ValueError(f"Unknown document format: {file_path.name}")
+
+
+def _merge_ndjson(lines: list) -> Dict[str, Any]:
+    """
+    Rebuild a document from its ndjson lines.
+
+    The first line holds the root and its attributes, the next ones one
+    root child each; a document whose root has no children is a single line.
+
+    Args:
+        lines: Decoded lines of the file
+
+    Returns:
+        Dict: Same document as the JSON styles
+    """
+    if len(lines) <= 1:
+        return lines[0] if lines else {}
+
+    (name, attrs), = lines[0].items()
+    root = dict(attrs or {})
+
+    for line in lines[1:]:
+        (key, value), = line.items()
+        if key not in root:
+            root[key] = value
+        elif isinstance(root[key], list):
+            root[key].append(value)
+        else:
+            root[key] = [root[key], value]
+
+    return {name: root}
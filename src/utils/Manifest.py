@@ -0,0 +1,181 @@
+"""
+Extraction manifest for Noki Bin Dumpper.
+Keeps track of the source files already extracted so unchanged files
+can be skipped on the next run.
+"""
+import os
+import json
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional
+
+
+class Manifest:
+    """
+    On-disk record of every extracted .bin file.
+
+    Each entry stores the size, modification time and content hash of the
+    source file plus the hashes of the outputs it produced. Entries are
+    keyed by the source path relative to the GameData directory.
+    """
+
+    FILE_NAME = "manifest.json"
+    FORMAT_VERSION = 1
+
+    # Read size used when hashing files
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, output_path: Path, settings: Optional[Dict[str, Any]] = None):
+        """
+        Initialize the manifest for an output directory.
+
+        Args:
+            output_path: Extraction output directory holding the manifest
+            settings: Extraction settings; entries made with other settings are discarded
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = output_path.joinpath(self.FILE_NAME)
+        self.settings = settings or {}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """
+        Hash a block of bytes.
+
+        Args:
+            data: Content to hash
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        return hashlib.sha256(data).hexdigest()
+
+    @classmethod
+    def hash_file(cls, file_path: Path) -> str:
+        """
+        Hash a file without loading it entirely in memory.
+
+        Args:
+            file_path: File to hash (or archive member)
+
+        Returns:
+            str: Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        with file_path.open('rb') as f:
+            for chunk in iter(lambda: f.read(cls.CHUNK_SIZE), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def load(self) -> 'Manifest':
+        """
+        Load the manifest from disk, ignoring missing or stale files.
+
+        Returns:
+            Manifest: The same manifest instance
+        """
+        self.entries = {}
+        if not self.path.exists():
+            return self
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Can't read manifest {self.path}, starting a new one: {e}")
+            return self
+
+        # Entries created by another format or other settings can't be trusted
+        if data.get("version") != self.FORMAT_VERSION or data.get("settings") != self.settings:
+            self.logger.info("Extraction settings changed, all files will be processed")
+            return self
+
+        self.entries = data.get("files", {})
+        return self
+
+    def dumps(self) -> str:
+        """
+        Serialize the manifest.
+
+        Returns:
+            str: JSON content of the manifest file
+        """
+        return json.dumps({
+            "version": self.FORMAT_VERSION,
+            "settings": self.settings,
+            "files": self.entries
+        }, indent=4, sort_keys=True)
+
+    def save(self) -> None:
+        """Write the manifest to disk atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix('.tmp')
+
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(self.dumps())
+
+        os.replace(temp_path, self.path)
+
+    def is_up_to_date(self, key: str, bin_file: Path, outputs: Iterable[Path]) -> bool:
+        """
+        Check whether a source file is unchanged since its last extraction.
+
+        Size and modification time are checked first; the content hash is
+        only computed when the modification time changed.
+
+        Args:
+            key: Manifest key of the source file
+            bin_file: Source .bin file
+            outputs: Output files that must still exist
+
+        Returns:
+            bool: True if the file can be skipped
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+
+        if not all(output.exists() for output in outputs):
+            return False
+
+        try:
+            stat = bin_file.stat()
+        except OSError:
+            return False
+
+        if stat.st_size != entry.get("size"):
+            return False
+
+        if stat.st_mtime_ns == entry.get("mtime"):
+            return True
+
+        # Touched but maybe not modified, compare the content
+        if self.hash_file(bin_file) != entry.get("sha256"):
+            return False
+
+        entry["mtime"] = stat.st_mtime_ns
+        return True
+
+    def update(self, key: str, record: Dict[str, Any]) -> None:
+        """
+        Store the record of a processed file.
+
+        Args:
+            key: Manifest key of the source file
+            record: Size, mtime, hash and output hashes of the file
+        """
+        self.entries[key] = record
+
+    def prune(self, keys: Iterable[str]) -> None:
+        """
+        Drop entries of source files that no longer exist.
+
+        Args:
+            keys: Keys of the source files that still exist
+        """
+        existing = set(keys)
+        for key in list(self.entries):
+            if key not in existing:
+                del self.entries[key]
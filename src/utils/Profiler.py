@@ -0,0 +1,248 @@
+"""
+Pipeline instrumentation for Noki Bin Dumpper.
+Records the wall time, bytes in/out and memory peak of every stage of
+every processed file, and aggregates them into a report.
+"""
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+class _Stage:
+    """Measurement of a single stage, used as a context manager."""
+
+    __slots__ = ("profiler", "name", "bytes_in", "bytes_out", "_start")
+
+    def __init__(self, profiler: Optional['StageProfiler'], name: str, bytes_in: int):
+        self.profiler = profiler
+        self.name = name
+        self.bytes_in = bytes_in
+        self.bytes_out = 0
+        self._start = 0.0
+
+    def __enter__(self) -> '_Stage':
+        if self.profiler is not None:
+            if self.profiler.trace_memory:
+                tracemalloc.reset_peak()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.profiler is not None:
+            self.profiler._record(self, time.perf_counter() - self._start)
+
+
+class StageProfiler:
+    """
+    Collects the stage measurements of the files processed by one process.
+
+    When disabled every call is a no-op, so the pipeline can always be
+    written with stage blocks.
+    """
+
+    def __init__(self, enabled: bool = False, trace_memory: bool = True):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Whether measurements are recorded
+            trace_memory: Whether tracemalloc peaks are recorded (slower)
+        """
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        self._stages: List[Dict[str, Any]] = []
+        self._tracing = False
+
+    def stage(self, name: str, bytes_in: int = 0) -> _Stage:
+        """
+        Measure a stage of the current file.
+
+        Args:
+            name: Stage name
+            bytes_in: Size of the stage input in bytes
+
+        Returns:
+            _Stage: Context manager; set bytes_out on it inside the block
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        return _Stage(self if self.enabled else None, name, bytes_in)
+
+    def stop(self) -> None:
+        """Stop memory tracing if it was started by this profiler."""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
+
+    def _record(self, stage: _Stage, seconds: float) -> None:
+        """Store a finished stage measurement."""
+        self._stages.append({
+            "stage": stage.name,
+            "seconds": seconds,
+            "bytes_in": stage.bytes_in,
+            "bytes_out": stage.bytes_out,
+            "peak_bytes": tracemalloc.get_traced_memory()[1] if self.trace_memory else None,
+        })
+
+    def collect(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get and reset the measurements of the current file.
+
+        Returns:
+            List: Stage measurements, or None when disabled
+        """
+        if not self.enabled:
+            return None
+        stages, self._stages = self._stages, []
+        return stages
+
+
+class ProfileReport:
+    """Aggregates the stage measurements of a whole extraction."""
+
+    FILE_NAME = "profile.json"
+
+    def __init__(self):
+        """Initialize an empty report."""
+        self.files: Dict[str, List[Dict[str, Any]]] = {}
+        self.started = time.perf_counter()
+        self.wall_seconds: Optional[float] = None
+
+    def add(self, key: str, stages: List[Dict[str, Any]]) -> None:
+        """
+        Add the measurements of a processed file.
+
+        Args:
+            key: File identifier (path relative to GameData)
+            stages: Stage measurements of the file
+        """
+        self.files[key] = stages
+
+    def finish(self) -> None:
+        """Record the total wall time of the extraction."""
+        self.wall_seconds = time.perf_counter() - self.started
+
+    def stage_totals(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Sum the measurements of each stage over all files.
+
+        Returns:
+            Dict: Total seconds, bytes and largest peak of each stage, slowest first
+        """
+        totals: Dict[str, Dict[str, Any]] = {}
+        for stages in self.files.values():
+            for stage in stages:
+                total = totals.setdefault(stage["stage"], {
+                    "seconds": 0.0, "bytes_in": 0, "bytes_out": 0, "peak_bytes": None, "files": 0
+                })
+                total["seconds"] += stage["seconds"]
+                total["bytes_in"] += stage["bytes_in"]
+                total["bytes_out"] += stage["bytes_out"]
+                total["files"] += 1
+                if stage["peak_bytes"] is not None:
+                    total["peak_bytes"] = max(total["peak_bytes"] or 0, stage["peak_bytes"])
+
+        return dict(sorted(totals.items(), key=lambda item: item[1]["seconds"], reverse=True))
+
+    def slowest_files(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the files that took the longest to process.
+
+        Args:
+            limit: Number of files to return
+
+        Returns:
+            List: File, total seconds, input size and slowest stage, slowest first
+        """
+        files = []
+        for key, stages in self.files.items():
+            if not stages:
+                continue
+            slowest = max(stages, key=lambda stage: stage["seconds"])
+            files.append({
+                "file": key,
+                "seconds": sum(stage["seconds"] for stage in stages),
+                "bytes_in": stages[0]["bytes_in"],
+                "slowest_stage": slowest["stage"],
+                "peak_bytes": max((stage["peak_bytes"] or 0 for stage in stages), default=0),
+            })
+
+        return sorted(files, key=lambda item: item["seconds"], reverse=True)[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Build the machine-readable report.
+
+        Returns:
+            Dict: Summary, per-stage totals and per-file measurements
+        """
+        return {
+            "wall_seconds": self.wall_seconds,
+            "files_processed": len(self.files),
+            "stages": self.stage_totals(),
+            "slowest_files": self.slowest_files(),
+            "files": self.files,
+        }
+
+    def write(self, output_path: Path) -> Path:
+        """
+        Write the report as JSON in the output directory.
+
+        Args:
+            output_path: Extraction output directory
+
+        Returns:
+            Path: Path of the written report
+        """
+        report_path = output_path.joinpath(self.FILE_NAME)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=4)
+        return report_path
+
+    def summary_tables(self, limit: int = 10) -> List[Any]:
+        """
+        Build the summary tables printed at the end of a profiled run.
+
+        Args:
+            limit: Number of slowest files to list
+
+        Returns:
+            List: Rich tables of the stages and of the slowest files
+        """
+        from rich.table import Table
+
+        stages = Table(title="Time per stage")
+        for column in ["Stage", "Seconds", "Share", "MB in", "MB out", "MB/s", "Peak MB"]:
+            stages.add_column(column, justify="left" if column == "Stage" else "right")
+
+        totals = self.stage_totals()
+        total_seconds = sum(total["seconds"] for total in totals.values()) or 1
+        for name, total in totals.items():
+            stages.add_row(
+                name,
+                f"{total['seconds']:.3f}",
+                f"{total['seconds'] / total_seconds:.0%}",
+                f"{total['bytes_in'] / 2 ** 20:.1f}",
+                f"{total['bytes_out'] / 2 ** 20:.1f}",
+                f"{total['bytes_in'] / 2 ** 20 / total['seconds']:.1f}" if total['seconds'] else "-",
+                f"{total['peak_bytes'] / 2 ** 20:.1f}" if total['peak_bytes'] is not None else "-",
+            )
+
+        files = Table(title=f"Slowest {limit} files")
+        for column in ["File", "Seconds", "MB in", "Slowest stage", "Peak MB"]:
+            files.add_column(column, justify="left" if column in ("File", "Slowest stage") else "right")
+
+        for item in self.slowest_files(limit):
+            files.add_row(
+                item["file"],
+                f"{item['seconds']:.3f}",
+                f"{item['bytes_in'] / 2 ** 20:.2f}",
+                item["slowest_stage"],
+                f"{item['peak_bytes'] / 2 ** 20:.1f}",
+            )
+
+        return [stages, files]
@@ -0,0 +1,154 @@
+"""
+JSON serialization backends for Noki Bin Dumpper.
+Selects the fastest JSON library available for the requested output style.
+"""
+import json
+import logging
+from typing import Any, Callable, Dict, Optional, TextIO
+
+# Optional fast backends
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - depends on the environment
+    ujson = None
+
+
+def _stdlib_compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _orjson_compact(value: Any) -> str:
+    return orjson.dumps(value).decode('utf-8')
+
+
+def _ujson_compact(value: Any) -> str:
+    return ujson.dumps(value, ensure_ascii=False, escape_forward_slashes=False)
+
+
+class JsonSerializer:
+    """
+    JSON serializer for a given output style.
+
+    Styles:
+        pretty: Indented with 4 spaces, the historical output (always stdlib
+            so files stay byte-identical between releases)
+        compact: Single line without whitespace
+        ndjson: One compact JSON object per line for each root record
+
+    Compact output uses the fastest backend available (orjson, then ujson,
+    then the standard library).
+    """
+
+    STYLES = ("pretty", "compact", "ndjson")
+    BACKENDS = ("orjson", "ujson", "json")
+
+    # Indentation of the pretty style
+    INDENT = 4
+
+    def __init__(self, style: str = "pretty", backend: Optional[str] = None):
+        """
+        Initialize the serializer.
+
+        Args:
+            style: Output style (pretty, compact or ndjson)
+            backend: Backend for compact output; None picks the fastest available
+
+        Raises:
+            ValueError: If the style or backend is unknown or not installed
+        """
+        if style not in self.STYLES:
+            raise ValueError(f"Unknown JSON style '{style}'. Available: {', '.join(self.STYLES)}")
+
+        self.logger = logging.getLogger(__name__)
+        self.style = style
+        self.backend = backend or self.default_backend()
+        self._compact = self._compact_function(self.backend)
+
+    @classmethod
+    def available_backends(cls) -> Dict[str, bool]:
+        """
+        Get which backends are installed.
+
+        Returns:
+            Dict[str, bool]: Availability of each backend
+        """
+        return {"orjson": orjson is not None, "ujson": ujson is not None, "json": True}
+
+    @classmethod
+    def default_backend(cls) -> str:
+        """
+        Get the fastest installed backend.
+
+        Returns:
+            str: Backend name
+        """
+        available = cls.available_backends()
+        return next(name for name in cls.BACKENDS if available[name])
+
+    def _compact_function(self, backend: str) -> Callable[[Any], str]:
+        """Get the compact encoding function of a backend."""
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown JSON backend '{backend}'. Available: {', '.join(self.BACKENDS)}")
+        if not self.available_backends()[backend]:
+            raise ValueError(f"JSON backend '{backend}' is not installed")
+
+        return {
+            "orjson": _orjson_compact,
+            "ujson": _ujson_compact,
+            "json": _stdlib_compact
+        }[backend]
+
+    @property
+    def indent(self) -> Optional[int]:
+        """Indentation of the output, None for single-line styles."""
+        return self.INDENT if self.style == "pretty" else None
+
+    @property
+    def item_separator(self) -> str:
+        """Separator between items of an object or array."""
+        return ','
+
+    @property
+    def key_separator(self) -> str:
+        """Separator between a key and its value."""
+        return ': ' if self.style == "pretty" else ':'
+
+    @property
+    def extension(self) -> str:
+        """File extension of the documents written in this style."""
+        return '.ndjson' if self.style == "ndjson" else '.json'
+
+    def dumps(self, value: Any) -> str:
+        """
+        Serialize a value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            str: JSON text, indented for the pretty style
+        """
+        if self.style == "pretty":
+            return json.dumps(value, indent=self.INDENT, ensure_ascii=False)
+        return self._compact(value)
+
+    def dump(self, value: Any, output: TextIO) -> None:
+        """
+        Write a whole document to an open text file.
+
+        Args:
+            value: Document to write
+            output: Destination text file
+        """
+        if self.style == "pretty":
+            json.dump(value, output, indent=self.INDENT, ensure_ascii=False)
+            return
+
+        output.write(self._compact(value))
+        if self.style == "ndjson":
+            output.write('\n')
@@ -0,0 +1,228 @@
+"""
+SQLite export backend for Noki Bin Dumpper.
+Loads every extracted document into a single database with flattened
+element and attribute tables, indexed for fast lookups.
+"""
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Iterable, List, Optional, Tuple
+from xml.parsers import expat
+
+from .StreamingConverter import StreamingConverter, XmlSource
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    root TEXT
+);
+CREATE TABLE IF NOT EXISTS elements (
+    id INTEGER PRIMARY KEY,
+    document_id INTEGER NOT NULL REFERENCES documents(id),
+    parent_id INTEGER REFERENCES elements(id),
+    depth INTEGER NOT NULL,
+    tag TEXT NOT NULL,
+    text TEXT,
+    uniquename TEXT,
+    ident TEXT
+);
+CREATE TABLE IF NOT EXISTS attributes (
+    element_id INTEGER NOT NULL REFERENCES elements(id),
+    name TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_elements_uniquename ON elements(uniquename);
+CREATE INDEX IF NOT EXISTS idx_elements_ident ON elements(ident);
+CREATE INDEX IF NOT EXISTS idx_elements_document_tag ON elements(document_id, tag);
+CREATE INDEX IF NOT EXISTS idx_elements_parent ON elements(parent_id);
+CREATE INDEX IF NOT EXISTS idx_attributes_element ON attributes(element_id);
+CREATE INDEX IF NOT EXISTS idx_attributes_name_value ON attributes(name, value);
+"""
+
+# Element row before its ids are assigned:
+# (local index, parent local index, depth, tag, text, uniquename, ident)
+ElementRow = Tuple[int, Optional[int], int, str, Optional[str], Optional[str], Optional[str]]
+
+
+class SqliteExporter:
+    """
+    Writes extracted documents into an SQLite database.
+
+    Each XML element becomes a row of ``elements`` (with its ``uniquename``
+    and ``id`` attributes promoted to indexed columns) and each attribute a
+    row of ``attributes``. A document is replaced inside a single
+    transaction, so several worker processes can export concurrently.
+    """
+
+    FILE_NAME = "gamedata.db"
+
+    # Seconds a writer waits for another process to release the database
+    BUSY_TIMEOUT = 300
+
+    # Rows sent to each executemany call
+    BATCH_SIZE = 10000
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize the exporter.
+
+        Args:
+            db_path: Path of the SQLite database
+        """
+        self.logger = logging.getLogger(__name__)
+        self.db_path = Path(db_path)
+        self._connection: Optional[sqlite3.Connection] = None
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Get the connection of this process, opening it on first use."""
+        if self._connection is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.db_path, timeout=self.BUSY_TIMEOUT, isolation_level=None)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+        return self._connection
+
+    def initialize(self) -> None:
+        """Create the tables and indexes if they don't exist."""
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the connection of this process."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def export(self, key: str, source: XmlSource) -> int:
+        """
+        Replace a document in the database.
+
+        Documents that are not valid XML (like profanity lists) are stored
+        without elements.
+
+        Args:
+            key: Document path relative to GameData
+            source: XML text, raw XML bytes or path to an XML file
+
+        Returns:
+            int: Number of elements stored
+        """
+        # Flatten before taking the write lock
+        try:
+            root, elements, attributes = self._flatten(source)
+        except (expat.ExpatError, ValueError) as e:
+            self.logger.debug(f"{key} is not XML, storing it without elements: {e}")
+            root, elements, attributes = None, [], []
+
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            self._delete(connection, [key])
+            document_id = connection.execute(
+                "INSERT INTO documents (path, root) VALUES (?, ?)", (key, root)
+            ).lastrowid
+
+            # Element ids are assigned while holding the lock
+            offset = connection.execute("SELECT COALESCE(MAX(id), 0) FROM elements").fetchone()[0] + 1
+
+            element_rows = (
+                (offset + index, document_id, None if parent is None else offset + parent, depth, tag, text, name, ident)
+                for index, parent, depth, tag, text, name, ident in elements
+            )
+            attribute_rows = ((offset + index, name, value) for index, name, value in attributes)
+
+            self._insert(connection, "INSERT INTO elements VALUES (?, ?, ?, ?, ?, ?, ?, ?)", element_rows)
+            self._insert(connection, "INSERT INTO attributes VALUES (?, ?, ?)", attribute_rows)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        return len(elements)
+
+    def prune(self, keys: Iterable[str]) -> int:
+        """
+        Delete the documents whose source no longer exists.
+
+        Args:
+            keys: Paths of the documents that still exist
+
+        Returns:
+            int: Number of documents deleted
+        """
+        existing = set(keys)
+        connection = self.connection
+        stale = [path for (path,) in connection.execute("SELECT path FROM documents") if path not in existing]
+
+        if stale:
+            connection.execute("BEGIN IMMEDIATE")
+            self._delete(connection, stale)
+            connection.execute("COMMIT")
+        return len(stale)
+
+    def _delete(self, connection: sqlite3.Connection, keys: List[str]) -> None:
+        """Delete documents and their rows inside the current transaction."""
+        for key in keys:
+            row = connection.execute("SELECT id FROM documents WHERE path = ?", (key,)).fetchone()
+            if row is None:
+                continue
+            connection.execute(
+                "DELETE FROM attributes WHERE element_id IN (SELECT id FROM elements WHERE document_id = ?)", row
+            )
+            connection.execute("DELETE FROM elements WHERE document_id = ?", row)
+            connection.execute("DELETE FROM documents WHERE id = ?", row)
+
+    def _insert(self, connection: sqlite3.Connection, sql: str, rows: Iterable[Tuple[Any, ...]]) -> None:
+        """Insert rows in batches."""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.BATCH_SIZE:
+                connection.executemany(sql, batch)
+                batch = []
+        if batch:
+            connection.executemany(sql, batch)
+
+    def _flatten(self, source: XmlSource) -> Tuple[Optional[str], List[ElementRow], List[Tuple[int, str, str]]]:
+        """
+        Flatten an XML document into element and attribute rows.
+
+        Args:
+            source: XML text, raw XML bytes or path to an XML file
+
+        Returns:
+            Tuple: Root tag, element rows and (element index, name, value) attribute rows
+        """
+        elements: List[List[Any]] = []
+        attributes: List[Tuple[int, str, str]] = []
+        stack: List[int] = []
+        texts: List[List[str]] = []
+
+        def start(tag, attrs):
+            index = len(elements)
+            values = dict(zip(attrs[0::2], attrs[1::2]))
+            elements.append([
+                index, stack[-1] if stack else None, len(stack), tag, None,
+                values.get("uniquename"), values.get("id")
+            ])
+            attributes.extend((index, name, value) for name, value in values.items())
+            stack.append(index)
+            texts.append([])
+
+        def end(tag):
+            text = ''.join(texts.pop()).strip()
+            elements[stack.pop()][4] = text or None
+
+        def characters(data):
+            if texts:
+                texts[-1].append(data)
+
+        parser = StreamingConverter().create_parser()
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+        StreamingConverter.feed(parser, source)
+
+        root = elements[0][3] if elements else None
+        return root, [tuple(element) for element in elements], attributes  # type: ignore
@@ -0,0 +1,421 @@
+"""
+Streaming XML to JSON conversion.
+Writes the JSON document while the XML is parsed, producing the same output
+as json.dump(xmltodict.parse(content)) without building the whole tree.
+"""
+import json
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List, Optional, TextIO, Tuple, Union
+from xml.parsers import expat
+
+from .Serializer import JsonSerializer
+
+# Input accepted by the converter: XML text, raw XML bytes or an XML file
+XmlSource = Union[str, bytes, Path]
+
+
+class StreamingConverter:
+    """
+    Event-based XML to JSON converter.
+
+    Only the children of the root element are streamed: each one is built
+    with the same conventions as xmltodict (``@attr``, ``#text``, repeated
+    siblings as lists), serialized and discarded. A first lightweight pass
+    counts the root children so lists can be opened before they are filled.
+    Siblings that are not contiguous are spooled to temporary files so the
+    output keeps xmltodict's key order.
+
+    In the ndjson style no grouping is needed: a header line holds the root
+    element and its attributes, then each child is written on its own line
+    as ``{"name": value}`` in document order, in a single pass.
+    """
+
+    ATTR_PREFIX = "@"
+    CDATA_KEY = "#text"
+
+    # In-memory size of each spooled group before it moves to disk
+    SPOOL_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, serializer: Optional[JsonSerializer] = None):
+        """
+        Initialize the converter.
+
+        Args:
+            serializer: JSON serializer defining the output style (default: pretty)
+        """
+        self.serializer = serializer or JsonSerializer()
+        self.indent = self.serializer.indent
+        self._item_separator = self.serializer.item_separator
+        self._key_separator = self.serializer.key_separator
+
+    def convert(self, source: XmlSource, output: TextIO) -> None:
+        """
+        Convert an XML document and write its JSON to an open text file.
+
+        Outside the ndjson style the document is fully validated by the
+        first pass, so nothing is written if the XML is malformed.
+
+        Args:
+            source: XML text, raw XML bytes or path to an XML file
+            output: Text file the JSON document is written to
+
+        Raises:
+            expat.ExpatError: If the XML is malformed
+            ValueError: If the XML declares entities
+        """
+        if self.serializer.style == "ndjson":
+            _NdjsonStreamHandler(self, output, {}, True).run(source)
+            return
+
+        counts, contiguous = self._scan(source)
+        _JsonStreamHandler(self, output, counts, contiguous).run(source)
+
+    def records(self, source: XmlSource) -> Dict[str, List[Any]]:
+        """
+        Build the children of the root element grouped by name.
+
+        Each child is built like xmltodict does, so this is the same as
+        grouping the values of the root object, without building it.
+
+        Args:
+            source: XML text, raw XML bytes or path to an XML file
+
+        Returns:
+            Dict: Values of the root children of each name, in document order
+
+        Raises:
+            expat.ExpatError: If the XML is malformed
+            ValueError: If the XML declares entities
+        """
+        handler = _RecordHandler(self, None, {}, True)  # type: ignore
+        handler.run(source)
+        return handler.records
+
+    def _scan(self, source: XmlSource) -> Tuple[Dict[str, int], bool]:
+        """
+        Count the children of the root element.
+
+        Args:
+            source: XML text, raw XML bytes or path to an XML file
+
+        Returns:
+            Tuple: Count of each child name (in first-occurrence order) and
+            whether children with the same name are always contiguous
+        """
+        counts: Counter = Counter()
+        state = {"depth": 0, "last": None, "contiguous": True}
+
+        def start(name, attrs):
+            state["depth"] += 1
+            if state["depth"] == 2:
+                if name != state["last"] and name in counts:
+                    state["contiguous"] = False
+                counts[name] += 1
+                state["last"] = name
+
+        def end(name):
+            state["depth"] -= 1
+
+        parser = self.create_parser()
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        self.feed(parser, source)
+
+        return dict(counts), state["contiguous"]
+
+    def create_parser(self) -> Any:
+        """
+        Create an expat parser configured like xmltodict's.
+
+        Returns:
+            xmlparser: Parser with ordered attributes and entities disabled
+        """
+        parser = expat.ParserCreate()
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+
+        def forbid_entities(*args, **kwargs):
+            raise ValueError("entities are disabled")
+
+        parser.EntityDeclHandler = forbid_entities
+        return parser
+
+    @staticmethod
+    def feed(parser: Any, source: XmlSource) -> None:
+        """
+        Feed a whole XML source to an expat parser.
+
+        Args:
+            parser: Expat parser
+            source: XML text, raw XML bytes or path to an XML file
+        """
+        if isinstance(source, Path):
+            with open(source, 'rb') as f:
+                parser.ParseFile(f)
+        elif isinstance(source, str):
+            parser.Parse(source.encode('utf-8'), True)
+        else:
+            parser.Parse(source, True)
+
+    def dumps(self, value: Any, level: int) -> str:
+        """
+        Serialize a value as it appears nested at the given level.
+
+        Args:
+            value: Value to serialize
+            level: Nesting level of the value in the document
+
+        Returns:
+            str: JSON text of the value
+        """
+        text = self.serializer.dumps(value)
+        if self.indent is None or level == 0:
+            return text
+        return text.replace('\n', '\n' + ' ' * (self.indent * level))
+
+    def newline(self, level: int) -> str:
+        """
+        Get the line break and indentation that precede an entry.
+
+        Args:
+            level: Nesting level of the entry
+
+        Returns:
+            str: Line break plus indentation, or empty in compact mode
+        """
+        if self.indent is None:
+            return ''
+        return '\n' + ' ' * (self.indent * level)
+
+
+class _JsonStreamHandler:
+    """Expat handler writing the JSON document of a single conversion."""
+
+    def __init__(self, converter: StreamingConverter, output: TextIO, counts: Dict[str, int], contiguous: bool):
+        self.converter = converter
+        self.output = output
+        self.counts = counts
+        self.contiguous = contiguous
+
+        # Root element state
+        self.depth = 0
+        self.root_name: Optional[str] = None
+        self.root_attrs: List[str] = []
+        self.root_text: List[str] = []
+        self.root_whitespace: List[str] = []
+        self.opened = False
+        self.entries = 0
+
+        # Children written so far and spool of each non-contiguous group
+        self.written: Counter = Counter()
+        self.spools: Dict[str, Any] = {}
+
+        # Subtree under construction, same layout as xmltodict's handler
+        self.stack: List[Tuple[Any, List[str]]] = []
+        self.item: Any = None
+        self.data: List[str] = []
+
+    def run(self, source: XmlSource) -> None:
+        """Parse the source and write the whole JSON document."""
+        parser = self.converter.create_parser()
+        parser.StartElementHandler = self.start_element
+        parser.EndElementHandler = self.end_element
+        parser.CharacterDataHandler = self.characters
+        try:
+            self.converter.feed(parser, source)
+        finally:
+            for spool in self.spools.values():
+                spool.close()
+
+    def start_element(self, name: str, attrs: List[str]) -> None:
+        self.depth += 1
+
+        if self.depth == 1:
+            self.root_name = name
+            self.root_attrs = attrs
+            return
+
+        if self.depth == 2 and not self.opened:
+            self.open_root()
+
+        self.stack.append((self.item, self.data))
+        self.item = self.attributes(attrs) or None
+        self.data = []
+
+    def end_element(self, name: str) -> None:
+        self.depth -= 1
+
+        if self.depth == 0:
+            self.close_root()
+            return
+
+        data = ''.join(self.data) if self.data else None
+        item = self.item
+        self.item, self.data = self.stack.pop()
+        value = self.build_value(item, data)
+
+        if self.depth == 1:
+            self.write_child(name, value)
+        else:
+            self.item = self.push(self.item, name, value)
+
+    def characters(self, data: str) -> None:
+        if self.depth > 1:
+            self.data.append(data)
+            return
+
+        # Root text is only kept once it contains something besides whitespace
+        if data.strip():
+            self.root_text.extend(self.root_whitespace)
+            self.root_whitespace = []
+            self.root_text.append(data)
+        elif self.root_text:
+            self.root_whitespace.append(data)
+
+    def attributes(self, attrs: List[str]) -> Dict[str, str]:
+        """Convert expat's ordered attributes into xmltodict's @ entries."""
+        prefix = self.converter.ATTR_PREFIX
+        return {prefix + key: value for key, value in zip(attrs[0::2], attrs[1::2])}
+
+    def build_value(self, item: Any, data: Optional[str]) -> Any:
+        """Combine an element's children/attributes with its text."""
+        if data:
+            data = data.strip() or None
+        if item is not None:
+            if data:
+                item = self.push(item, self.converter.CDATA_KEY, data)
+            return item
+        return data
+
+    @staticmethod
+    def push(item: Any, key: str, value: Any) -> Dict[str, Any]:
+        """Add a value to a dict, turning repeated keys into lists."""
+        if item is None:
+            item = {}
+        if key in item:
+            current = item[key]
+            if isinstance(current, list):
+                current.append(value)
+            else:
+                item[key] = [current, value]
+        else:
+            item[key] = value
+        return item
+
+    def open_root(self) -> None:
+        """Write the document opening and the root attributes."""
+        converter = self.converter
+        self.output.write('{' + converter.newline(1) + json.dumps(self.root_name, ensure_ascii=False) + converter._key_separator + '{')
+        self.opened = True
+
+        for key, value in self.attributes(self.root_attrs).items():
+            self.write_entry(key, converter.dumps(value, 2))
+
+    def write_entry(self, key: str, text: str) -> None:
+        """Write a complete key/value entry of the root object."""
+        self.begin_entry(key)
+        self.output.write(text)
+
+    def begin_entry(self, key: str) -> None:
+        """Write the separator and the key of a root object entry."""
+        converter = self.converter
+        separator = converter._item_separator if self.entries else ''
+        self.output.write(
+            separator + converter.newline(2) + json.dumps(key, ensure_ascii=False) + converter._key_separator
+        )
+        self.entries += 1
+
+    def write_child(self, name: str, value: Any) -> None:
+        """Write a child of the root, directly or to its group spool."""
+        converter = self.converter
+        count = self.counts[name]
+        index = self.written[name]
+        self.written[name] += 1
+
+        # Pick the destination of this group
+        if self.contiguous:
+            target = self.output
+            if index == 0:
+                self.begin_entry(name)
+        else:
+            if index == 0:
+                self.spools[name] = tempfile.SpooledTemporaryFile(
+                    max_size=converter.SPOOL_SIZE, mode='w+', encoding='utf-8'
+                )
+            target = self.spools[name]
+
+        if count == 1:
+            target.write(converter.dumps(value, 2))
+            return
+
+        separator = converter._item_separator if index else '['
+        target.write(separator + converter.newline(3) + converter.dumps(value, 3))
+        if index == count - 1:
+            target.write(converter.newline(2) + ']')
+
+    def close_root(self) -> None:
+        """Write the spooled groups, the root text and close the document."""
+        converter = self.converter
+        text = ''.join(self.root_text).strip() or None
+
+        # Root without children: small enough to be serialized at once
+        if not self.opened:
+            attrs = self.attributes(self.root_attrs) or None
+            self.output.write(converter.dumps({self.root_name: self.build_value(attrs, text)}, 0))
+            return
+
+        for name, spool in self.spools.items():
+            self.begin_entry(name)
+            spool.seek(0)
+            for chunk in iter(lambda: spool.read(1024 * 1024), ''):
+                self.output.write(chunk)
+
+        if text:
+            self.write_entry(converter.CDATA_KEY, converter.dumps(text, 2))
+
+        self.output.write(converter.newline(1) + '}' + converter.newline(0) + '}')
+
+
+class _NdjsonStreamHandler(_JsonStreamHandler):
+    """Expat handler writing one JSON line per child of the root element."""
+
+    def write_line(self, value: Dict[str, Any]) -> None:
+        self.output.write(self.converter.serializer.dumps(value) + '\n')
+
+    def open_root(self) -> None:
+        """Write the header line with the root element and its attributes."""
+        self.write_line({self.root_name: self.attributes(self.root_attrs) or None})
+        self.opened = True
+
+    def write_child(self, name: str, value: Any) -> None:
+        """Write a child of the root on its own line."""
+        self.write_line({name: value})
+
+    def close_root(self) -> None:
+        """Write the root text, or the whole root if it had no children."""
+        text = ''.join(self.root_text).strip() or None
+
+        if not self.opened:
+            attrs = self.attributes(self.root_attrs) or None
+            self.write_line({self.root_name: self.build_value(attrs, text)})
+        elif text:
+            self.write_line({self.converter.CDATA_KEY: text})
+
+
+class _RecordHandler(_JsonStreamHandler):
+    """Expat handler collecting the children of the root element."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.records: Dict[str, List[Any]] = {}
+
+    def open_root(self) -> None:
+        self.opened = True
+
+    def write_child(self, name: str, value: Any) -> None:
+        self.records.setdefault(name, []).append(value)
+
+    def close_root(self) -> None:
+        pass
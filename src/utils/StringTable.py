@@ -0,0 +1,289 @@
+"""
+Localization string table for Noki Bin Dumpper.
+Compiles localization.bin into a sorted binary table that is read through
+mmap, so lookups by tag and language need neither the XML nor a dict.
+"""
+import os
+import mmap
+import struct
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from .StreamingConverter import StreamingConverter
+
+
+class StringTable:
+    """
+    Memory-mapped table of the localized strings of the game.
+
+    The file is opened with mmap: loading it costs nothing up front, pages
+    are read on demand and shared by every process through the page cache.
+    Lookups are a binary search over the sorted tags, O(log n).
+
+    Layout (little-endian):
+        header: magic, language count, tag count, offsets of the sections
+        languages: one 16-byte ASCII name per language (EN-US, PT-BR...)
+        tags: (offset, length) of each tag name, sorted by tag
+        values: (offset, length) of the string of each tag and language,
+            MISSING when the tag has no translation in that language
+        tag names and strings: UTF-8 blobs, identical strings stored once
+
+    Example:
+        with StringTable(Path("output/localization.strings")) as table:
+            table.get("@ITEMS_T4_BAG", "EN-US")
+    """
+
+    FILE_NAME = "localization.strings"
+
+    # Source file the table is compiled from
+    SOURCE_NAME = "localization.bin"
+
+    MAGIC = b"NOKISTR1"
+    HEADER = struct.Struct("<8sIIQQQQ")
+    LANGUAGE = struct.Struct("<16s")
+    SLOT = struct.Struct("<II")
+
+    # Value of a missing translation
+    MISSING = 0xFFFFFFFF
+
+    def __init__(self, path: Path):
+        """
+        Open a string table.
+
+        Args:
+            path: Compiled table file
+
+        Raises:
+            ValueError: If the file is not a string table
+        """
+        self.logger = logging.getLogger(__name__)
+        self.path = Path(path)
+
+        with open(self.path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        header = self.HEADER.unpack_from(self._map, 0) if len(self._map) >= self.HEADER.size else None
+        if header is None or header[0] != self.MAGIC:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a string table")
+
+        _, language_count, self._count, self._tags_offset, self._values_offset, self._names_offset, self._strings_offset = header
+        self.languages: List[str] = [
+            self.LANGUAGE.unpack_from(self._map, self.HEADER.size + index * self.LANGUAGE.size)[0].rstrip(b"\0").decode("ascii")
+            for index in range(language_count)
+        ]
+        self._language_index = {language: index for index, language in enumerate(self.languages)}
+
+    @classmethod
+    def compile(cls, content: Union[bytes, memoryview], target: Path) -> int:
+        """
+        Compile the localization XML into a string table file.
+
+        The table is written next to the target and renamed over it, so
+        processes still mapping the previous table keep a valid file.
+
+        Args:
+            content: Decrypted localization.bin XML
+            target: Table file to write
+
+        Returns:
+            int: Number of tags in the table
+
+        Raises:
+            xml.parsers.expat.ExpatError: If the XML is malformed
+            ValueError: If the XML declares entities, or a language code is
+                not ASCII or longer than 16 bytes
+        """
+        translations = cls._parse(content)
+        languages = sorted({language for values in translations.values() for language in values})
+        for language in languages:
+            if not language.isascii() or len(language) > cls.LANGUAGE.size:
+                raise ValueError(
+                    f"Language code {language!r} can't be stored: it must be ASCII and at most "
+                    f"{cls.LANGUAGE.size} characters"
+                )
+        tags = sorted(translations, key=lambda tag: tag.encode("utf-8"))
+
+        names = bytearray()
+        strings = bytearray()
+        tag_slots = bytearray()
+        value_slots = bytearray()
+        string_offsets: Dict[bytes, int] = {}
+
+        for tag in tags:
+            name = tag.encode("utf-8")
+            tag_slots += cls.SLOT.pack(len(names), len(name))
+            names += name
+
+            values = translations[tag]
+            for language in languages:
+                text = values.get(language)
+                if text is None:
+                    value_slots += cls.SLOT.pack(cls.MISSING, 0)
+                    continue
+
+                encoded = text.encode("utf-8")
+                offset = string_offsets.get(encoded)
+                if offset is None:
+                    offset = string_offsets[encoded] = len(strings)
+                    strings += encoded
+                value_slots += cls.SLOT.pack(offset, len(encoded))
+
+        tags_offset = cls.HEADER.size + len(languages) * cls.LANGUAGE.size
+        values_offset = tags_offset + len(tag_slots)
+        names_offset = values_offset + len(value_slots)
+        strings_offset = names_offset + len(names)
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_suffix('.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(cls.HEADER.pack(cls.MAGIC, len(languages), len(tags), tags_offset, values_offset,
+                                    names_offset, strings_offset))
+            for language in languages:
+                f.write(cls.LANGUAGE.pack(language.encode("ascii")))
+            f.write(tag_slots)
+            f.write(value_slots)
+            f.write(names)
+            f.write(strings)
+        os.replace(temp_path, target)
+
+        return len(tags)
+
+    @staticmethod
+    def _parse(content: Union[bytes, memoryview]) -> Dict[str, Dict[str, str]]:
+        """
+        Read the translations of the tmx document.
+
+        Args:
+            content: Decrypted localization XML
+
+        Returns:
+            Dict: Text of each tu tuid by upper-case language
+        """
+        translations: Dict[str, Dict[str, str]] = {}
+        state: Dict[str, Optional[str]] = {"tag": None, "language": None}
+        text: List[str] = []
+        in_segment = [False]
+
+        def start(tag, attrs):
+            if tag == "tu":
+                state["tag"] = dict(zip(attrs[0::2], attrs[1::2])).get("tuid")
+            elif tag == "tuv":
+                attributes = dict(zip(attrs[0::2], attrs[1::2]))
+                language = attributes.get("xml:lang") or attributes.get("lang")
+                state["language"] = language.upper() if language else None
+            elif tag == "seg":
+                in_segment[0] = True
+                text.clear()
+
+        def end(tag):
+            if tag == "seg":
+                in_segment[0] = False
+                if state["tag"] is not None and state["language"] is not None:
+                    translations.setdefault(state["tag"], {})[state["language"]] = "".join(text)  # type: ignore
+            elif tag == "tu":
+                state["tag"] = None
+
+        def characters(data):
+            if in_segment[0]:
+                text.append(data)
+
+        parser = StreamingConverter().create_parser()
+        parser.StartElementHandler = start
+        parser.EndElementHandler = end
+        parser.CharacterDataHandler = characters
+        parser.Parse(content, True)
+
+        return translations
+
+    def __len__(self) -> int:
+        """Get the number of tags."""
+        return self._count
+
+    def __contains__(self, tag: str) -> bool:
+        """Check whether a tag is in the table."""
+        return self._find(tag) is not None
+
+    def get(self, tag: str, language: str = "EN-US") -> Optional[str]:
+        """
+        Look up the text of a tag in a language.
+
+        Args:
+            tag: Localization tag (tuid), e.g. @ITEMS_T4_BAG
+            language: Language code, case-insensitive (default: EN-US)
+
+        Returns:
+            str: Localized text, or None if the tag or its translation is missing
+        """
+        language_index = self._language_index.get(language.upper())
+        index = self._find(tag)
+        if language_index is None or index is None:
+            return None
+        return self._value(index, language_index)
+
+    def translations(self, tag: str) -> Dict[str, str]:
+        """
+        Get every translation of a tag.
+
+        Args:
+            tag: Localization tag (tuid)
+
+        Returns:
+            Dict[str, str]: Text by language, empty if the tag is missing
+        """
+        index = self._find(tag)
+        if index is None:
+            return {}
+
+        values = {}
+        for language_index, language in enumerate(self.languages):
+            value = self._value(index, language_index)
+            if value is not None:
+                values[language] = value
+        return values
+
+    def tags(self) -> Iterator[str]:
+        """Iterate over the tags, in sorted order."""
+        for index in range(self._count):
+            yield self._name(index).decode("utf-8")
+
+    def _find(self, tag: str) -> Optional[int]:
+        """Binary search of a tag, returning its index."""
+        name = tag.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            current = self._name(middle)
+            if current < name:
+                low = middle + 1
+            elif current > name:
+                high = middle
+            else:
+                return middle
+        return None
+
+    def _name(self, index: int) -> bytes:
+        """Get the UTF-8 name of the tag at an index."""
+        offset, length = self.SLOT.unpack_from(self._map, self._tags_offset + index * self.SLOT.size)
+        start = self._names_offset + offset
+        return self._map[start:start + length]
+
+    def _value(self, index: int, language_index: int) -> Optional[str]:
+        """Get the text of a tag index in a language index."""
+        slot = self._values_offset + (index * len(self.languages) + language_index) * self.SLOT.size
+        offset, length = self.SLOT.unpack_from(self._map, slot)
+        if offset == self.MISSING:
+            return None
+        start = self._strings_offset + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def close(self) -> None:
+        """Unmap the table."""
+        self._map.close()
+
+    def __enter__(self) -> 'StringTable':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
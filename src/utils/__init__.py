@@ -1,7 +1,21 @@
 """
 Utility modules for Noki Bin Dumpper.
+
+The modules built on optional dependencies (ColumnarExporter on pyarrow,
+BinarySerializer and Loader on msgpack/cbor2/zstandard) are imported
+from their own module where they are enabled.
 """
 from .Crypto import BinaryDecryptor
 from .Converter import Converter
+from .Manifest import Manifest
+from .Serializer import JsonSerializer
+from .Profiler import StageProfiler, ProfileReport
+from .SqliteExporter import SqliteExporter
+from .ContentStore import ContentStore
+from .ArchiveWriter import ArchiveWriter
+from .StringTable import StringTable
 
-__all__ = ["BinaryDecryptor", "Converter"]
+__all__ = [
+    "BinaryDecryptor", "Converter", "Manifest", "JsonSerializer", "StageProfiler", "ProfileReport",
+    "SqliteExporter", "ContentStore", "ArchiveWriter", "StringTable"
+]
@@ -0,0 +1,23 @@
+"""
+Fixtures compartilhadas pelos testes do Noki Bin Dumpper.
+"""
+import gzip
+
+import pytest
+from cryptography.hazmat.decrepit.ciphers.algorithms import TripleDES
+from cryptography.hazmat.primitives.ciphers import Cipher, modes
+
+from src.core.Config import Config
+
+
+@pytest.fixture
+def encrypt():
+    """Criptografa um XML do mesmo jeito que o jogo grava os arquivos .bin."""
+    def encrypt(xml: bytes) -> bytes:
+        compressed = gzip.compress(xml)
+        compressed += b'\x00' * (-len(compressed) % (TripleDES.block_size // 8))
+
+        encryptor = Cipher(TripleDES(Config.ENCRYPTION_KEY), modes.CBC(Config.ENCRYPTION_IV)).encryptor()
+        return encryptor.update(compressed) + encryptor.finalize()
+
+    return encrypt
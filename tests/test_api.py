@@ -0,0 +1,73 @@
+"""
+Testes para a API de documentos em memória do Noki Bin Dumpper.
+Valida a seleção, a ordem e o conteúdo dos documentos sem gravar em disco.
+"""
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from src.api import iter_documents, aiter_documents, find_game_data
+from src.enums import ServerType
+from src.utils.Crypto import BinaryDecryptor
+
+
+def _create_install(root: Path) -> Path:
+    """Cria uma instalação falsa com os servidores Live e Test."""
+    bin_content = (Path(__file__).parent / "data" / "achievements.bin").read_bytes()
+    for folder, files in [("game", ["achievements.bin", "cluster/a.bin", "cluster/b.bin"]), ("staging", ["test.bin"])]:
+        game_data = root / folder / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        for relative in files:
+            (game_data / relative).parent.mkdir(parents=True, exist_ok=True)
+            (game_data / relative).write_bytes(bin_content)
+    return root
+
+
+class TestDocuments:
+    """Testes para iter_documents e aiter_documents."""
+    
+    def test_iter_documents_selects_and_converts(self, tmp_path):
+        """Testa se os documentos filtrados trazem o XML sem BOM e o dict convertido."""
+        install = _create_install(tmp_path)
+        
+        documents = list(iter_documents(install, include=["cluster/*"]))
+        
+        assert [document.path for document in documents] == ["cluster/a.bin", "cluster/b.bin"]
+        decrypted = BinaryDecryptor().decrypt_bin((Path(__file__).parent / "data" / "achievements.bin").read_bytes())
+        assert documents[0].xml == decrypted[len(codecs.BOM_UTF8):]
+        assert "achievements" in documents[0].data
+    
+    def test_server_and_game_data_paths(self, tmp_path):
+        """Testa se a instalação usa a pasta do servidor e se o GameData pode ser passado direto."""
+        install = _create_install(tmp_path)
+        
+        test = list(iter_documents(install, ServerType.TEST, parse=False))
+        assert [(document.path, document.data) for document in test] == [("test.bin", None)]
+        
+        game_data = find_game_data(install)
+        assert [document.path for document in iter_documents(game_data, include=["achievements"], parse=False)] == ["achievements.bin"]
+    
+    def test_workers_match_serial(self, tmp_path):
+        """Testa se o modo com processos devolve os mesmos documentos na mesma ordem."""
+        install = _create_install(tmp_path)
+        
+        serial = list(iter_documents(install, parse=False))
+        parallel = list(iter_documents(install, parse=False, workers=2, buffer=1))
+        
+        assert serial == parallel
+    
+    def test_aiter_documents(self, tmp_path):
+        """Testa se a variante assíncrona devolve os documentos e pode parar no meio."""
+        install = _create_install(tmp_path)
+        
+        async def collect(limit):
+            paths = []
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                async for document in aiter_documents(install, executor=executor, buffer=2):
+                    paths.append(document.path)
+                    if len(paths) == limit:
+                        break
+            return paths
+        
+        assert asyncio.run(collect(10)) == [document.path for document in iter_documents(install, parse=False)]
+        assert asyncio.run(collect(1)) == ["achievements.bin"]
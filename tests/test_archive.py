@@ -0,0 +1,99 @@
+"""
+Testes para a leitura de snapshots compactados do Noki Bin Dumpper.
+Valida a listagem dos membros, a escolha do GameData e a leitura sem extração.
+"""
+import io
+import pickle
+import tarfile
+import zipfile
+
+import pytest
+
+from src.platforms.archive import GameDataArchive
+
+
+def _write_tar(path, members, mode="w:gz"):
+    """Cria um tar com os membros {nome: conteúdo}."""
+    with tarfile.open(path, mode) as archive:
+        for name, content in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = 1700000000
+            archive.addfile(info, io.BytesIO(content))
+
+
+class TestGameDataArchive:
+    """Testes para a classe GameDataArchive."""
+    
+    def test_selects_game_data_of_the_server(self, tmp_path):
+        """Testa se o GameData do servidor escolhido é usado num snapshot da instalação."""
+        data = "Albion-Online_Data/StreamingAssets/GameData"
+        archive_path = tmp_path / "install.zip"
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr(f"game/{data}/items.bin", b"live")
+            archive.writestr(f"staging/{data}/items.bin", b"test")
+            archive.writestr(f"staging/{data}/cluster/a.bin", b"cluster")
+            archive.writestr("staging/readme.txt", b"")
+        
+        live = GameDataArchive(archive_path, "game")
+        test = GameDataArchive(archive_path, "staging")
+        
+        assert [str(member.relative_to(live)) for member in live.find_files()] == ["items.bin"]
+        assert [str(member.relative_to(test)) for member in test.find_files()] == ["items.bin", "cluster/a.bin"]
+        assert test.find_files()[0].read_bytes() == b"test"
+        
+        with pytest.raises(ValueError):
+            live.find_files()[0].relative_to(tmp_path)
+    
+    def test_reads_compressed_tar_members_in_any_order(self, tmp_path):
+        """Testa se os membros de um tar.gz são lidos em qualquer ordem e sobrevivem ao pickle."""
+        archive_path = tmp_path / "GameData.tar.gz"
+        members = {f"file{index}.bin": bytes([index]) * (index * 1000) for index in range(1, 6)}
+        _write_tar(archive_path, members)
+        
+        game_data = GameDataArchive(archive_path)
+        found = game_data.find_files()
+        assert [member.name for member in found] == list(members)
+        assert found[0].stat().st_mtime_ns == 1700000000 * 1_000_000_000
+        
+        # Em ordem, depois voltando para o início do fluxo
+        for member in found + found[::-1]:
+            assert member.read_bytes() == members[member.name]
+        
+        copy = pickle.loads(pickle.dumps(found[2]))
+        assert copy == found[2] and copy.read_bytes() == members["file3.bin"]
+        game_data.close()
+    
+    @pytest.mark.parametrize("suffix", [".zip", ".tar.gz"])
+    def test_skips_members_outside_the_archive_root(self, tmp_path, suffix):
+        """Testa se membros absolutos ou com ".." são ignorados, sem escapar da saída."""
+        members = {
+            "GameData/items.bin": b"items",
+            "GameData/../../../tmp/x/pwned.bin": b"pwned",
+            "/abs/GameData/root.bin": b"absolute",
+            "./GameData/cluster/a.bin": b"cluster",
+        }
+        archive_path = tmp_path / f"snapshot{suffix}"
+        if suffix == ".zip":
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                for name, content in members.items():
+                    archive.writestr(zipfile.ZipInfo(name), content)
+        else:
+            _write_tar(archive_path, members)
+        
+        game_data = GameDataArchive(archive_path)
+        found = game_data.find_files()
+        
+        assert [member.relative.as_posix() for member in found] == ["items.bin", "cluster/a.bin"]
+        assert [member.read_bytes() for member in found] == [b"items", b"cluster"]
+        game_data.close()
+    
+    def test_rejects_unknown_suffix(self, tmp_path):
+        """Testa se arquivos que não são snapshots suportados são recusados."""
+        path = tmp_path / "GameData.rar"
+        path.write_bytes(b"")
+        
+        assert not GameDataArchive.is_archive(path)
+        assert not GameDataArchive.is_archive(tmp_path)
+        with pytest.raises(ValueError):
+            GameDataArchive(path)
@@ -0,0 +1,81 @@
+"""
+Testes para a saída em arquivo compactado do Noki Bin Dumpper.
+Valida os formatos suportados e o descarte de arquivos incompletos.
+"""
+import io
+import sys
+import tarfile
+import zipfile
+import importlib.util
+
+import pytest
+
+from src.utils.ArchiveWriter import ArchiveWriter
+
+
+def _read_members(path):
+    """Lê os membros de um zip, tar ou tar.zst como {nome: conteúdo}."""
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as archive:
+            return {name: archive.read(name) for name in archive.namelist()}
+    
+    if path.name.endswith(".zst"):
+        import zstandard
+        fileobj = io.BytesIO(zstandard.ZstdDecompressor().stream_reader(path.open("rb")).read())
+        archive = tarfile.open(fileobj=fileobj)
+    else:
+        archive = tarfile.open(path)
+    with archive:
+        return {member.name: archive.extractfile(member).read() for member in archive.getmembers()}
+
+
+class TestArchiveWriter:
+    """Testes para a classe ArchiveWriter."""
+    
+    @pytest.mark.parametrize("suffix", [
+        ".zip",
+        ".tar",
+        ".tar.gz",
+        pytest.param(".tar.zst", marks=pytest.mark.skipif(
+            not importlib.util.find_spec("zstandard"), reason="zstandard não instalado")),
+    ])
+    def test_round_trip(self, tmp_path, suffix):
+        """Testa se os arquivos adicionados são lidos de volta com o mesmo caminho e conteúdo."""
+        target = tmp_path / f"dump{suffix}"
+        members = {"xml/items.xml": b"<items/>", "json/cluster/a.json": b"{}"}
+        
+        writer = ArchiveWriter(target).open()
+        for name, data in members.items():
+            writer.add(name, data)
+        
+        # Só o arquivo temporário existe até o fechamento
+        assert not target.exists()
+        writer.close()
+        
+        assert _read_members(target) == members
+        assert [path.name for path in tmp_path.iterdir()] == [target.name]
+    
+    def test_discard_removes_unfinished_archive(self, tmp_path):
+        """Testa se um arquivo interrompido não deixa nada no disco."""
+        writer = ArchiveWriter(tmp_path / "dump.zip").open()
+        writer.add("xml/items.xml", b"<items/>")
+        writer.discard()
+        
+        assert list(tmp_path.iterdir()) == []
+    
+    def test_stdout_writes_tar_stream(self, monkeypatch):
+        """Testa se "-" grava um tar na saída padrão."""
+        buffer = io.BytesIO()
+        monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(buffer))
+        
+        writer = ArchiveWriter(ArchiveWriter.STDOUT).open()
+        writer.add("manifest.json", b"{}")
+        writer.close()
+        
+        with tarfile.open(fileobj=io.BytesIO(buffer.getvalue())) as archive:
+            assert archive.extractfile("manifest.json").read() == b"{}"
+    
+    def test_rejects_unknown_suffix(self, tmp_path):
+        """Testa se formatos desconhecidos são recusados."""
+        with pytest.raises(ValueError):
+            ArchiveWriter(tmp_path / "dump.rar")
@@ -0,0 +1,84 @@
+"""
+Testes para os formatos binários e o carregador de documentos do Noki Bin Dumpper.
+Valida que todos os formatos guardam a mesma estrutura do JSON.
+"""
+import json
+import pytest
+from pathlib import Path
+
+from src.utils.BinarySerializer import BinarySerializer
+from src.utils.Converter import Converter
+from src.utils.Crypto import BinaryDecryptor
+from src.utils.Loader import load_document
+from src.utils.Serializer import JsonSerializer
+
+pytest.importorskip("msgpack")
+pytest.importorskip("cbor2")
+pytest.importorskip("zstandard")
+
+
+class TestBinarySerializer:
+    """Testes para a classe BinarySerializer e a função load_document."""
+    
+    def setup_method(self):
+        """Setup para os testes, decripta o arquivo de exemplo."""
+        test_data_dir = Path(__file__).parent / "data"
+        self.source = test_data_dir / "achievements.bin"
+        self.xml = BinaryDecryptor().decrypt_bin(self.source.read_bytes())
+    
+    @pytest.mark.parametrize("file_format", ["msgpack", "cbor"])
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip(self, file_format, compress):
+        """Testa se o valor lido é igual ao escrito."""
+        serializer = BinarySerializer(file_format, compress)
+        value = {"items": {"@version": "1", "weapon": [{"@tier": "4"}, {"#text": "Espada"}]}}
+        
+        assert serializer.loads(serializer.dumps(value)) == value
+    
+    def test_extension_and_detection(self):
+        """Testa se o formato é detectado pela extensão do arquivo."""
+        assert BinarySerializer("cbor", True).extension == ".cbor.zst"
+        
+        serializer = BinarySerializer.for_path(Path("json/items.msgpack.zst"))
+        assert (serializer.file_format, serializer.compress) == ("msgpack", True)
+        assert BinarySerializer.for_path(Path("json/items.json")) is None
+    
+    def test_rejects_unknown_format(self):
+        """Testa se um formato desconhecido é rejeitado."""
+        with pytest.raises(ValueError):
+            BinarySerializer("bson")
+    
+    def test_load_document_matches_every_format(self, tmp_path):
+        """Testa se load_document devolve o mesmo documento em todos os formatos."""
+        converter = Converter()
+        expected = converter.convert_to_json(self.xml.decode("utf-8-sig"), self.source)
+        
+        # Documentos JSON nos três estilos
+        paths = []
+        for style in JsonSerializer.STYLES:
+            serializer = JsonSerializer(style)
+            path = tmp_path / f"{style}{serializer.extension}"
+            Converter(serializer).write_json(self.xml, self.source, path)
+            paths.append(path)
+        
+        # Documentos binários, com e sem compressão
+        for file_format in BinarySerializer.FORMATS:
+            for compress in (False, True):
+                serializer = BinarySerializer(file_format, compress)
+                path = tmp_path / f"achievements{serializer.extension}"
+                converter.write_binary(self.xml, self.source, path, serializer)
+                paths.append(path)
+        
+        for path in paths:
+            assert load_document(path) == expected, path.name
+        
+        # O documento compactado é bem menor que o JSON indentado
+        assert (tmp_path / "achievements.msgpack.zst").stat().st_size < (tmp_path / "pretty.json").stat().st_size / 10
+    
+    def test_load_document_rejects_unknown_extension(self, tmp_path):
+        """Testa se extensões desconhecidas são rejeitadas."""
+        path = tmp_path / "achievements.xml"
+        path.write_bytes(self.xml)
+        
+        with pytest.raises(ValueError):
+            load_document(path)
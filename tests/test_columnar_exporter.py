@@ -0,0 +1,96 @@
+"""
+Testes para a exportação colunar do Noki Bin Dumpper.
+Valida as tabelas tipadas geradas por tipo de elemento.
+"""
+import json
+import pytest
+
+pyarrow = pytest.importorskip("pyarrow")
+import pyarrow.ipc
+import pyarrow.parquet
+
+from src.utils.ColumnarExporter import ColumnarExporter
+
+ITEMS_XML = b"""\xef\xbb\xbf<?xml version="1.0" encoding="utf-8"?>
+<items version="1">
+  <weapon uniquename="T4_MAIN_SWORD" tier="4" weight="1.5">
+    <craftingrequirements silver="0">
+      <craftresource uniquename="T4_METALBAR" count="16" />
+    </craftingrequirements>
+  </weapon>
+  <mount uniquename="T3_MOUNT_HORSE" tier="3">Cavalo</mount>
+  <weapon uniquename="T5_MAIN_SWORD" tier="5" weight="heavy" />
+</items>
+"""
+
+
+class TestColumnarExporter:
+    """Testes para a classe ColumnarExporter."""
+    
+    def test_parquet_tables_per_element_type(self, tmp_path):
+        """Testa se cada tipo de elemento vira uma tabela Parquet tipada."""
+        exporter = ColumnarExporter(tmp_path, "parquet")
+        
+        assert exporter.export("items.bin", ITEMS_XML) == {"weapon": 2, "mount": 1}
+        
+        weapons = pyarrow.parquet.read_table(tmp_path / "items" / "weapon.parquet")
+        assert weapons.column_names == ["uniquename", "tier", "weight", "craftingrequirements"]
+        
+        # Colunas numéricas são tipadas, as mistas ficam como texto
+        assert weapons.schema.field("tier").type == pyarrow.int64()
+        assert weapons.schema.field("weight").type == pyarrow.string()
+        assert weapons.column("uniquename").to_pylist() == ["T4_MAIN_SWORD", "T5_MAIN_SWORD"]
+        
+        # Filhos aninhados são guardados como JSON
+        requirements = weapons.column("craftingrequirements").to_pylist()
+        assert json.loads(requirements[0])["craftresource"]["@count"] == "16"
+        assert requirements[1] is None
+    
+    def test_numbers_are_only_typed_when_they_round_trip(self):
+        """Testa se IDs com zeros à esquerda, sublinhados, inf e nan continuam como texto."""
+        build = ColumnarExporter.build_column
+        
+        assert build(["007", "1_000", "12"]).to_pylist() == ["007", "1_000", "12"]
+        assert build(["inf", "nan"]).type == pyarrow.string()
+        assert build([" 1", "+2"]).type == pyarrow.string()
+        assert build(["99999999999999999999"]).to_pylist() == ["99999999999999999999"]
+        
+        assert build(["-3", None, "0"]).to_pylist() == [-3, None, 0]
+        assert build(["1.5", "2", "1e3"]).to_pylist() == [1.5, 2.0, 1000.0]
+    
+    def test_columns_named_alike_are_not_overwritten(self, tmp_path):
+        """Testa se atributos, texto e filhos com o mesmo nome ficam em colunas separadas."""
+        xml = b"""<items>
+  <item text="atributo" tier="4"><tier>5</tier>texto</item>
+  <item tier="6"><text>filho</text></item>
+</items>"""
+        ColumnarExporter(tmp_path).export("items.bin", xml)
+        
+        rows = pyarrow.parquet.read_table(tmp_path / "items" / "item.parquet").to_pylist()
+        assert rows[0]["text"] == "atributo"
+        assert rows[0]["#text"] == "texto"
+        assert rows[0]["tier"] == 4 and rows[0]["tier_children"] == '"5"'
+        assert rows[1]["tier"] == 6 and rows[1]["text_children"] == '"filho"'
+    
+    def test_arrow_tables_can_be_memory_mapped(self, tmp_path):
+        """Testa se as tabelas Arrow IPC podem ser mapeadas em memória."""
+        exporter = ColumnarExporter(tmp_path, "arrow")
+        exporter.export("items.bin", ITEMS_XML)
+        
+        with pyarrow.memory_map(str(tmp_path / "items" / "mount.arrow")) as source:
+            mounts = pyarrow.ipc.open_file(source).read_all()
+        
+        assert mounts.to_pylist() == [{"uniquename": "T3_MOUNT_HORSE", "tier": 3, "text": "Cavalo"}]
+    
+    def test_export_replaces_previous_tables(self, tmp_path):
+        """Testa se reexportar remove as tabelas antigas e ignora arquivos que não são XML."""
+        exporter = ColumnarExporter(tmp_path)
+        exporter.export("items.bin", ITEMS_XML)
+        
+        assert exporter.export("items.bin", b"palavra1\npalavra2") == {}
+        assert list((tmp_path / "items").iterdir()) == []
+    
+    def test_rejects_unknown_format(self, tmp_path):
+        """Testa se um formato desconhecido é rejeitado."""
+        with pytest.raises(ValueError):
+            ColumnarExporter(tmp_path, "csv")
@@ -0,0 +1,58 @@
+"""
+Testes para o módulo de configuração do Noki Bin Dumpper.
+Valida a verificação de atualizações e o seu cache em disco.
+"""
+import json
+import time
+import pytest
+from unittest.mock import patch, PropertyMock, MagicMock
+
+import requests
+
+from src.core.Config import Config, Settings
+
+
+class TestUpdateCheck:
+    """Testes para a verificação de atualizações."""
+    
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        """Redireciona o diretório de cache para um diretório temporário."""
+        with patch.object(Settings, 'CACHE_DIR', new_callable=PropertyMock, return_value=tmp_path):
+            yield tmp_path
+    
+    def test_offline_failure_is_cached(self, cache_dir):
+        """Testa se uma falha de rede é cacheada para não repetir o timeout."""
+        with patch.object(requests, 'get', side_effect=requests.ConnectionError("offline")) as get:
+            assert Config.check_for_updates() is None
+            assert Config.check_for_updates() is None
+            assert get.call_count == 1
+        
+        cached = json.loads((cache_dir / Config.UPDATE_CACHE_FILE).read_text())
+        assert cached["ok"] is False
+    
+    def test_update_is_cached(self, cache_dir):
+        """Testa se uma nova versão encontrada é reaproveitada do cache."""
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"tag_name": "v99.0.0", "html_url": "url", "body": "notas"}
+        
+        with patch.object(requests, 'get', return_value=response) as get:
+            first = Config.check_for_updates()
+            second = Config.check_for_updates()
+            assert get.call_count == 1
+        
+        assert first["latest_version"] == "99.0.0"
+        assert second == first
+    
+    def test_stale_cache_is_ignored(self, cache_dir):
+        """Testa se um cache expirado gera uma nova consulta."""
+        (cache_dir / Config.UPDATE_CACHE_FILE).write_text(json.dumps({
+            "version": Config.VERSION,
+            "checked_at": time.time() - Config.UPDATE_CHECK_TTL - 1,
+            "ok": True,
+            "update": None
+        }))
+        
+        with patch.object(requests, 'get', side_effect=requests.ConnectionError("offline")) as get:
+            Config.check_for_updates()
+            assert get.call_count == 1
@@ -0,0 +1,52 @@
+"""
+Testes para o armazenamento por conteúdo do Noki Bin Dumpper.
+Valida a gravação única dos blobs, os hard links e a limpeza.
+"""
+import os
+
+from src.utils.ContentStore import ContentStore
+from src.utils.Manifest import Manifest
+
+
+class TestContentStore:
+    """Testes para a classe ContentStore."""
+    
+    def test_put_writes_each_content_once(self, tmp_path):
+        """Testa se conteúdos iguais viram um único blob ligado às saídas."""
+        store = ContentStore(tmp_path / "store")
+        store.check(tmp_path / "dump1")
+        
+        first = tmp_path / "dump1" / "xml" / "items.xml"
+        second = tmp_path / "dump2" / "xml" / "items.xml"
+        assert store.put(first, b"<items/>") == Manifest.hash_bytes(b"<items/>")
+        store.put(second, memoryview(b"<items/>"))
+        
+        assert os.path.samefile(first, second)
+        assert os.path.samefile(first, store.object_path(Manifest.hash_bytes(b"<items/>")))
+        assert store.size() == len(b"<items/>")
+    
+    def test_put_replaces_link_without_touching_other_trees(self, tmp_path):
+        """Testa se regravar uma saída não altera o arquivo das outras árvores."""
+        store = ContentStore(tmp_path / "store")
+        old = tmp_path / "dump1" / "items.xml"
+        new = tmp_path / "dump2" / "items.xml"
+        store.put(old, b"v1")
+        store.put(new, b"v1")
+        
+        store.put(new, b"v2")
+        
+        assert old.read_bytes() == b"v1"
+        assert new.read_bytes() == b"v2"
+        assert not os.path.samefile(old, new)
+    
+    def test_prune_removes_unlinked_blobs(self, tmp_path):
+        """Testa se prune apaga só os blobs que nenhuma árvore usa."""
+        store = ContentStore(tmp_path / "store")
+        store.put(tmp_path / "dump1" / "a.xml", b"antigo")
+        store.put(tmp_path / "dump2" / "a.xml", b"atual")
+        
+        (tmp_path / "dump1" / "a.xml").unlink()
+        
+        assert store.prune() == 1
+        assert not store.object_path(Manifest.hash_bytes(b"antigo")).exists()
+        assert store.object_path(Manifest.hash_bytes(b"atual")).exists()
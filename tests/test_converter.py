@@ -65,4 +65,45 @@ class TestConverter:
         # A conversão deve retornar um dicionário com um erro
         result = self.converter.convert_to_json(invalid_xml, Path("test.xml"))
         
-        assert "error" in result, "Erro não detectado no XML inválido" 
\ No newline at end of file
+        assert "error" in result, "Erro não detectado no XML inválido"
+    
+    @pytest.mark.parametrize("xml", [
+        '<a/>',
+        '<a x="1">texto</a>',
+        '<a><b>1</b><b>2</b></a>',
+        '<a p="x"><b>1</b><c/><b>2</b> resto <d q="é">ü<e/><e>t</e></d></a>',
+        '<a>\n  <b>\n  </b>\n  <c><c><c/></c></c>\n</a>',
+    ])
+    def test_write_json_matches_xmltodict(self, xml, tmp_path):
+        """Testa se a conversão em streaming gera o mesmo JSON que xmltodict + json.dump."""
+        expected = json.dumps(self.converter.convert_to_json(xml, Path("test.xml")), indent=4, ensure_ascii=False)
+        
+        json_path = tmp_path / "test.json"
+        self.converter.write_json(xml, Path("test.xml"), json_path)
+        
+        assert json_path.read_text(encoding="utf-8") == expected
+    
+    def test_write_json_from_bin(self, tmp_path):
+        """Testa a conversão em streaming a partir dos bytes descriptografados."""
+        bin_file = self.test_data_dir / "achievements.bin"
+        decrypted_content = self.decryptor.decrypt_bin(bin_file.read_bytes())
+        
+        expected = json.dumps(
+            self.converter.convert_to_json(decrypted_content.decode('utf-8-sig'), bin_file),
+            indent=4, ensure_ascii=False
+        )
+        
+        json_path = tmp_path / "achievements.json"
+        self.converter.write_json(decrypted_content, bin_file, json_path)
+        
+        assert json_path.read_text(encoding="utf-8") == expected
+    
+    def test_write_json_invalid_xml(self, tmp_path):
+        """Testa se XML inválido gera o mesmo JSON de erro que convert_to_json."""
+        invalid_xml = "<root><item>Conteúdo sem fechamento</root>"
+        json_path = tmp_path / "invalid.json"
+        
+        self.converter.write_json(invalid_xml, Path("test.xml"), json_path)
+        result = json.loads(json_path.read_text(encoding="utf-8"))
+        
+        assert result == self.converter.convert_to_json(invalid_xml, Path("test.xml"))
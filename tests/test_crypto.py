@@ -2,7 +2,9 @@
 Testes para o módulo de criptografia do Noki Bin Dumpper.
 Valida a funcionalidade de descriptografia de arquivos .bin do Albion Online.
 """
+import io
 import os
+import zlib
 import pytest
 from pathlib import Path
 
@@ -79,4 +81,79 @@ class TestBinaryDecryptor:
                 
         finally:
             # Restaura a chave original
-            self.decryptor.key = original_key 
\ No newline at end of file
+            self.decryptor.key = original_key
+    
+    def test_decryptor_reuses_cipher(self):
+        """Testa se o cipher é reutilizado entre arquivos e recriado ao trocar a chave."""
+        bin_content = (self.test_data_dir / "achievements.bin").read_bytes()
+        
+        first = self.decryptor.decrypt_bin(bin_content)
+        cipher = self.decryptor._cipher
+        second = self.decryptor.decrypt_bin(bin_content)
+        
+        # O mesmo cipher deve ser usado e o resultado deve ser idêntico
+        assert self.decryptor._cipher is cipher
+        assert first == second
+        
+        # Trocar a chave invalida o cipher em cache
+        self.decryptor.key = Config.ENCRYPTION_KEY
+        assert self.decryptor._cipher is None
+    
+    def test_decryption_with_invalid_length(self):
+        """Testa se conteúdo com tamanho fora do bloco do TripleDES é rejeitado."""
+        bin_content = (self.test_data_dir / "achievements.bin").read_bytes()
+        
+        with pytest.raises(ValueError, match="Erro na descriptografia"):
+            self.decryptor.decrypt_bin(bin_content[:-3])
+    
+    def test_iter_decrypt_matches_decrypt_bin(self):
+        """Testa se a descriptografia em blocos gera o mesmo conteúdo que decrypt_bin."""
+        bin_file = self.test_data_dir / "achievements.bin"
+        expected = self.decryptor.decrypt_bin(bin_file.read_bytes())
+        
+        # Blocos pequenos e fora do alinhamento do TripleDES
+        for chunk_size in [13, 1024, 1024 * 1024]:
+            with open(bin_file, "rb") as f:
+                chunks = list(self.decryptor.iter_decrypt(f, chunk_size))
+            
+            assert b"".join(chunks) == expected
+            assert all(len(chunk) <= chunk_size for chunk in chunks)
+    
+    def test_iter_decrypt_splits_pending_output(self, monkeypatch):
+        """Testa se a saída que só sai no flush também é entregue em blocos de até chunk_size."""
+        bin_file = self.test_data_dir / "achievements.bin"
+        expected = self.decryptor.decrypt_bin(bin_file.read_bytes())
+        decompressobj = zlib.decompressobj
+        
+        class HeldBack:
+            """Descompressor que guarda toda a saída até o flush."""
+            def __init__(self, wbits):
+                self._decompressor = decompressobj(wbits)
+                self._held = b""
+            
+            def decompress(self, data, max_length):
+                self._held += self._decompressor.decompress(data, max_length)
+                return b""
+            
+            def flush(self):
+                return self._held + self._decompressor.flush()
+            
+            def __getattr__(self, name):
+                return getattr(self._decompressor, name)
+        
+        monkeypatch.setattr(zlib, "decompressobj", HeldBack)
+        with open(bin_file, "rb") as f:
+            chunks = list(self.decryptor.iter_decrypt(f, 1024))
+        
+        assert b"".join(chunks) == expected
+        assert len(chunks) > 1 and all(len(chunk) <= 1024 for chunk in chunks)
+    
+    def test_iter_decrypt_truncated_file(self):
+        """Testa se um arquivo truncado gera erro no modo streaming."""
+        bin_content = (self.test_data_dir / "achievements.bin").read_bytes()
+        
+        with pytest.raises(Exception):
+            list(self.decryptor.iter_decrypt(io.BytesIO(bin_content[:len(bin_content) // 2 // 8 * 8])))
+        
+        with pytest.raises(Exception):
+            list(self.decryptor.iter_decrypt(io.BytesIO(b"")))
@@ -0,0 +1,124 @@
+"""
+Testes para a comparação entre versões do Noki Bin Dumpper.
+Valida o diff estrutural por chave e a detecção de arquivos alterados.
+"""
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from src.diff import BuildDiff, diff_documents
+
+OLD_ITEMS = {"items": {
+    "@version": "1",
+    "weapon": [
+        {"@uniquename": "T4_MAIN_SWORD", "@tier": "4", "craftingrequirements": {"@silver": "0"}},
+        {"@uniquename": "T5_MAIN_SWORD", "@tier": "5"}
+    ],
+    "mount": {"@id": "42", "#text": "Cavalo"}
+}}
+
+NEW_ITEMS = {"items": {
+    "@version": "2",
+    "weapon": [
+        {"@uniquename": "T3_MAIN_SWORD", "@tier": "3"},
+        {"@uniquename": "T4_MAIN_SWORD", "@tier": "4", "craftingrequirements": {"@silver": "10"}},
+        {"@uniquename": "T5_MAIN_SWORD", "@tier": "5"}
+    ]
+}}
+
+
+def _write_output(output_path: Path, documents: dict) -> None:
+    """Grava uma saída de extração com manifesto e documentos JSON."""
+    files = {}
+    for key, (sha256, document) in documents.items():
+        files[key] = {"size": 100, "mtime": 0, "sha256": sha256, "outputs": {}}
+        if document is not None:
+            json_file = output_path.joinpath("json", key).with_suffix(".json")
+            json_file.parent.mkdir(parents=True, exist_ok=True)
+            json_file.write_text(json.dumps(document), encoding="utf-8")
+
+    output_path.joinpath("manifest.json").write_text(json.dumps({
+        "version": 1,
+        "settings": {"json_style": "pretty", "output_format": "json", "outputs": ["xml", "json"]},
+        "files": files
+    }), encoding="utf-8")
+
+
+class TestDiffDocuments:
+    """Testes para a função diff_documents."""
+
+    def test_keyed_changes(self):
+        """Testa se os elementos são casados por uniquename/id e não pela posição."""
+        changes = diff_documents(OLD_ITEMS, NEW_ITEMS)
+
+        # Inserir T3 antes das outras espadas não altera T4 nem T5
+        assert changes == {
+            "items/@version": ["1", "2"],
+            "items/weapon[T4_MAIN_SWORD]/craftingrequirements/@silver": ["0", "10"],
+            "items/weapon[T3_MAIN_SWORD]": [None, {"@uniquename": "T3_MAIN_SWORD", "@tier": "3"}],
+            "items/mount": [{"@id": "42", "#text": "Cavalo"}, None]
+        }
+        assert diff_documents(OLD_ITEMS, OLD_ITEMS) == {}
+
+    def test_single_element_becomes_list(self):
+        """Testa se um elemento único e uma lista de irmãos são comparados pela chave."""
+        old = {"mobs": {"mob": {"@uniquename": "T4_WOLF", "@hp": "100"}}}
+        new = {"mobs": {"mob": [{"@uniquename": "T4_WOLF", "@hp": "120"}, {"@uniquename": "T5_BEAR"}]}}
+
+        assert diff_documents(old, new) == {
+            "mobs/mob[T4_WOLF]/@hp": ["100", "120"],
+            "mobs/mob[T5_BEAR]": [None, {"@uniquename": "T5_BEAR"}]
+        }
+
+
+class TestBuildDiff:
+    """Testes para a classe BuildDiff."""
+
+    def test_outputs_diff_skips_identical_files(self, tmp_path):
+        """Testa se só os documentos com hash diferente são lidos e comparados."""
+        # Documentos idênticos nem existem no disco: o manifesto basta
+        _write_output(tmp_path / "old", {
+            "items.bin": ("a", OLD_ITEMS),
+            "mobs.bin": ("b", None),
+            "removed.bin": ("c", None),
+            "spells.bin": ("d", {"spells": {"@v": "1"}})
+        })
+        _write_output(tmp_path / "new", {
+            "items.bin": ("e", NEW_ITEMS),
+            "mobs.bin": ("b", None),
+            "cluster/added.bin": ("f", None),
+            "spells.bin": ("g", {"spells": {"@v": "1"}})
+        })
+
+        changeset = BuildDiff(tmp_path / "old", tmp_path / "new").run()
+
+        assert changeset["added"] == ["cluster/added.bin"]
+        assert changeset["removed"] == ["removed.bin"]
+        assert list(changeset["changed"]) == ["items.bin"]
+        assert changeset["changed"]["items.bin"] == diff_documents(OLD_ITEMS, NEW_ITEMS)
+        # spells.bin mudou no binário mas não no documento
+        assert changeset["summary"] == {
+            "identical": 2, "added": 1, "removed": 1, "changed": 1,
+            "values": {"added": 1, "removed": 1, "modified": 2}
+        }
+
+    def test_game_data_diff(self, tmp_path):
+        """Testa a comparação de dois diretórios GameData com arquivos criptografados."""
+        bin_file = Path(__file__).parent / "data" / "achievements.bin"
+        for name in ("old", "new"):
+            (tmp_path / name / "cluster").mkdir(parents=True)
+            shutil.copy(bin_file, tmp_path / name / "achievements.bin")
+        shutil.copy(bin_file, tmp_path / "new" / "cluster" / "achievements.bin")
+
+        changeset = BuildDiff(tmp_path / "old", tmp_path / "new").run()
+
+        assert changeset["added"] == ["cluster/achievements.bin"]
+        assert changeset["changed"] == {}
+        assert changeset["summary"]["identical"] == 1
+
+    def test_invalid_source(self, tmp_path):
+        """Testa se um diretório sem manifesto nem .bin é rejeitado."""
+        with pytest.raises(ValueError):
+            BuildDiff(tmp_path, tmp_path)
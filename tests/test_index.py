@@ -0,0 +1,112 @@
+"""
+Testes para o índice de consulta do Noki Bin Dumpper.
+Valida as posições gravadas, as consultas e o endpoint HTTP.
+"""
+import json
+import threading
+import urllib.request
+
+from src.index import GameIndex, Indexer
+from src.index.Server import create_server
+
+ITEMS_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<items version="1">
+  <weapon uniquename="T4_MAIN_SWORD" tier="4">
+    <craftingrequirements silver="0">
+      <craftresource uniquename="T4_METALBAR" count="16" />
+    </craftingrequirements>
+  </weapon>
+  <!-- montarias -->
+  <mount uniquename="T3_MOUNT_HORSE" id="42" tier="3">Cavalo</mount><mount uniquename="T5_MOUNT_OX" tier="5"/>
+</items>
+"""
+
+
+def _write_output(output_path):
+    """Grava o XML e o índice como a extração faria."""
+    xml_file = output_path / "xml" / "items.xml"
+    xml_file.parent.mkdir(parents=True)
+    xml_file.write_bytes(ITEMS_XML)
+    Indexer(output_path / "index").write("items.bin", "xml/items.xml", ITEMS_XML)
+
+
+class TestIndexer:
+    """Testes para a classe Indexer."""
+
+    def test_build_locates_root_children(self):
+        """Testa se cada filho da raiz aponta exatamente para seus bytes."""
+        entries = Indexer("index").build(ITEMS_XML)
+
+        assert [entry[0] for entry in entries] == ["weapon", "mount", "mount"]
+        slices = [ITEMS_XML[offset:offset + length] for _, offset, length, _ in entries]
+        assert slices[0].startswith(b"<weapon") and slices[0].endswith(b"</weapon>")
+        assert slices[1] == b'<mount uniquename="T3_MOUNT_HORSE" id="42" tier="3">Cavalo</mount>'
+        assert slices[2] == b'<mount uniquename="T5_MOUNT_OX" tier="5"/>'
+        assert entries[1][3] == {"uniquename": "T3_MOUNT_HORSE", "id": "42", "tier": "3"}
+
+    def test_write_and_prune_shards(self, tmp_path):
+        """Testa se documentos que não são XML geram shards vazios e se prune os remove."""
+        indexer = Indexer(tmp_path / "index")
+
+        assert indexer.write("items.bin", "xml/items.xml", ITEMS_XML) == 3
+        assert indexer.write("localization/profanity_en.bin", "xml/localization/profanity_en.xml", b"palavra1\npalavra2") == 0
+
+        assert indexer.read_shard(indexer.shard_path("items.bin"))["entries"][2][0] == "mount"
+        assert indexer.prune(["items.bin"]) == 1
+        assert [path.name for path in indexer.shards()] == ["items.bin.json"]
+
+
+class TestGameIndex:
+    """Testes para a classe GameIndex."""
+
+    def test_get_and_query(self, tmp_path):
+        """Testa a busca por uniquename/id e a consulta por atributos."""
+        _write_output(tmp_path)
+        index = GameIndex(tmp_path)
+
+        assert len(index) == 3
+        assert index.get("42") == {"mount": {"@uniquename": "T3_MOUNT_HORSE", "@id": "42", "@tier": "3", "#text": "Cavalo"}}
+        assert index.get("T4_MAIN_SWORD")["weapon"]["craftingrequirements"]["@silver"] == "0"
+        assert index.get("T4_METALBAR") is None
+
+        assert [entry.attributes["uniquename"] for entry in index.query(tag="mount")] == ["T3_MOUNT_HORSE", "T5_MOUNT_OX"]
+        assert [entry.tag for entry in index.query(tier=4)] == ["weapon"]
+        assert len(index.query(document="items.bin", limit=2)) == 2
+        assert index.query(document="mobs.bin") == []
+
+    def test_http_endpoint(self, tmp_path):
+        """Testa as respostas JSON do servidor local."""
+        _write_output(tmp_path)
+        server = create_server(GameIndex(tmp_path), port=0)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+
+        def fetch(path):
+            url = f"http://127.0.0.1:{server.server_port}{path}"
+            try:
+                with urllib.request.urlopen(url) as response:
+                    return response.status, json.loads(response.read())
+            except urllib.error.HTTPError as e:
+                return e.code, json.loads(e.read())
+
+        try:
+            assert fetch("/get/T5_MOUNT_OX") == (200, {"mount": {"@uniquename": "T5_MOUNT_OX", "@tier": "5"}})
+            assert fetch("/get/T9_NADA")[0] == 404
+
+            status, located = fetch("/locate/T4_MAIN_SWORD")
+            assert status == 200 and located[0]["document"] == "items.bin"
+
+            status, results = fetch("/query?tag=mount&tier=3&load=1")
+            assert status == 200 and results[0]["element"]["mount"]["#text"] == "Cavalo"
+            assert fetch("/query?limit=x")[0] == 400
+
+            # Saídas XML removidas depois da indexação viram erros JSON
+            for xml_file in (tmp_path / "xml").rglob("*.xml"):
+                xml_file.unlink()
+            status, error = fetch("/query?tag=mount&load=1")
+            assert status == 500 and "error" in error
+            assert fetch("/get/T5_MOUNT_OX")[0] == 500
+            assert fetch("/query?tag=mount")[0] == 200
+        finally:
+            server.shutdown()
+            server.server_close()
@@ -0,0 +1,91 @@
+"""
+Testes para a execução em pipeline do Noki Bin Dumpper.
+Valida a leitura antecipada, as gravações em segundo plano e o limite de memória.
+"""
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.core.Pipeline import ByteBudget, OutputWriter, PipelinedExecutor
+from src.core.Processor import FileProcessor
+from src.utils.Manifest import Manifest
+
+
+class TestPipeline:
+    """Testes para as classes ByteBudget, OutputWriter e PipelinedExecutor."""
+    
+    def setup_method(self):
+        """Setup para os testes, localiza o arquivo de exemplo."""
+        self.bin_content = (Path(__file__).parent / "data" / "achievements.bin").read_bytes()
+    
+    def test_byte_budget_blocks_until_released(self):
+        """Testa se o orçamento bloqueia o produtor até os bytes serem liberados."""
+        budget = ByteBudget(100)
+        budget.acquire(80)
+        acquired = threading.Event()
+        
+        thread = threading.Thread(target=lambda: (budget.acquire(50), acquired.set()))
+        thread.start()
+        time.sleep(0.05)
+        assert not acquired.is_set()
+        
+        budget.release(80)
+        thread.join(1)
+        assert acquired.is_set()
+        
+        # Um item maior que o limite passa quando o orçamento está vazio
+        budget.release(50)
+        budget.acquire(500)
+        assert budget.used == 500
+    
+    def test_output_writer_returns_hash(self, tmp_path):
+        """Testa se o escritor grava o arquivo e devolve o mesmo hash do manifesto."""
+        writer = OutputWriter(2, ByteBudget(1024))
+        future = writer.write(tmp_path / "saida.xml", memoryview(b"<a>1</a>")[3:])
+        writer.close()
+        
+        assert (tmp_path / "saida.xml").read_bytes() == b"1</a>"
+        assert future.result() == Manifest.hash_file(tmp_path / "saida.xml")
+    
+    def test_executor_matches_inline_processing(self, tmp_path):
+        """Testa se o pipeline gera os mesmos arquivos e registros que o processamento direto."""
+        tasks = {}
+        for mode in ("inline", "pipeline"):
+            tasks[mode] = []
+            for name in ("a", "b", "c"):
+                bin_file = tmp_path / "GameData" / f"{name}.bin"
+                bin_file.parent.mkdir(parents=True, exist_ok=True)
+                bin_file.write_bytes(self.bin_content)
+                tasks[mode].append((bin_file, tmp_path / mode / f"{name}.xml", tmp_path / mode / f"{name}.json", f"{name}.bin"))
+        
+        # Um arquivo removido vira um erro no resultado, sem interromper o pipeline
+        tasks["pipeline"].append((tmp_path / "GameData" / "missing.bin", tmp_path / "x.xml", tmp_path / "x.json", "missing.bin"))
+        
+        processor = FileProcessor()
+        inline = [processor.run_task(task) for task in tasks["inline"]]
+        pipelined = list(PipelinedExecutor(processor, io_threads=2, read_ahead=1, max_buffered_bytes=1).run(tasks["pipeline"]))
+        
+        assert [result[0].name for result in pipelined] == ["a.bin", "b.bin", "c.bin", "missing.bin"]
+        assert pipelined[-1][1] is None and pipelined[-1][2]
+        for expected, result in zip(inline, pipelined):
+            assert result[1] == expected[1]
+        for name in ("a.xml", "a.json", "c.json"):
+            assert (tmp_path / "pipeline" / name).read_bytes() == (tmp_path / "inline" / name).read_bytes()
+    
+    def test_executor_consumes_generators(self, tmp_path):
+        """Testa se o pipeline aceita tarefas geradas aos poucos e repassa erros do gerador."""
+        bin_file = tmp_path / "a.bin"
+        bin_file.write_bytes(self.bin_content)
+        
+        def tasks(fail):
+            yield bin_file, tmp_path / "a.xml", tmp_path / "a.json", "a.bin"
+            if fail:
+                raise RuntimeError("falha ao listar")
+        
+        results = list(PipelinedExecutor(FileProcessor(), 2).run(tasks(False)))
+        assert [(result[0], result[2]) for result in results] == [(bin_file, None)]
+        
+        with pytest.raises(RuntimeError, match="falha ao listar"):
+            list(PipelinedExecutor(FileProcessor(), 2).run(tasks(True)))
@@ -3,11 +3,19 @@ Testes para o módulo de plataforma do Noki Bin Dumpper.
 Valida a funcionalidade de detecção e manipulação de diferentes plataformas.
 """
 import os
+import codecs
+import importlib.util
+import json
+import sqlite3
 import pytest
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from src.core.Platform import Platform
+from src.core.Processor import FileProcessor
+from src.utils.Converter import Converter
+from src.utils.Crypto import BinaryDecryptor
+from src.utils.Manifest import Manifest
 from src.enums import ServerType
 
 class TestPlatform:
@@ -121,4 +129,485 @@ class TestPlatform:
                 
                 # Verifica se os métodos corretos foram chamados
                 self.platform.get_game_data_path.assert_called_once()
-                mock_handler.find_files.assert_called_once_with(mock_game_data_path, "*.bin") 
\ No newline at end of file
+                mock_handler.find_files.assert_called_once_with(mock_game_data_path, "*.bin") 
+    
+    def _create_game_data(self, root: Path) -> Path:
+        """Cria uma instalação falsa do Albion com alguns arquivos .bin."""
+        game_data = root / "albion" / "game" / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        bin_content = (self.test_data_dir / "achievements.bin").read_bytes()
+        
+        for relative in ["achievements.bin", "cluster/achievements_copy.bin", "profanity_en.bin"]:
+            target = game_data / relative
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(bin_content)
+        
+        return root / "albion"
+    
+    def _run_extraction(self, albion_path: Path, output_path: Path, workers: int = 1, force: bool = False,
+                        io_threads: int = 2) -> None:
+        """Executa o processamento completo com o número de workers informado."""
+        self.platform._initialize()
+        self.platform.set_albion_path(albion_path)
+        self.platform.set_server_type(ServerType.LIVE)
+        self.platform.set_output_path(output_path)
+        self.platform.set_workers(workers)
+        self.platform.set_io_threads(io_threads)
+        self.platform.set_force(force)
+        self.platform.process_bin_files()
+    
+    def test_parallel_output_matches_serial(self, tmp_path):
+        """Testa se o modo paralelo e o serial sem pipeline geram arquivos idênticos ao modo serial."""
+        albion_path = self._create_game_data(tmp_path)
+        serial_output = tmp_path / "serial"
+        
+        self._run_extraction(albion_path, serial_output, workers=1)
+        serial_files = sorted(p.relative_to(serial_output) for p in serial_output.rglob("*") if p.is_file())
+        # 3 arquivos XML, 3 arquivos JSON e o manifesto
+        assert len(serial_files) == 7
+        
+        for name, workers, io_threads in [("parallel", 2, 2), ("inline", 1, 0)]:
+            other_output = tmp_path / name
+            self._run_extraction(albion_path, other_output, workers=workers, io_threads=io_threads)
+            other_files = sorted(p.relative_to(other_output) for p in other_output.rglob("*") if p.is_file())
+            
+            # Verifica se os mesmos arquivos foram gerados com o mesmo conteúdo
+            assert serial_files == other_files
+            for relative in serial_files:
+                assert (serial_output / relative).read_bytes() == (other_output / relative).read_bytes()
+    
+    def test_set_workers_rejects_negative(self):
+        """Testa se um número negativo de workers é rejeitado."""
+        with pytest.raises(ValueError):
+            self.platform.set_workers(-1)
+
+    def test_incremental_extraction_skips_unchanged_files(self, tmp_path):
+        """Testa se arquivos inalterados são ignorados na segunda extração."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        game_data = albion_path / "game" / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        
+        self._run_extraction(albion_path, output_path)
+        assert (output_path / "manifest.json").exists(), "O manifesto não foi criado"
+        
+        # Remove uma saída e roda novamente: apenas ela deve ser recriada
+        xml_file = output_path / "xml" / "achievements.xml"
+        json_file = output_path / "json" / "cluster" / "achievements_copy.json"
+        xml_file.unlink()
+        json_mtime = json_file.stat().st_mtime_ns
+        
+        with patch.object(FileProcessor, 'process', autospec=True, side_effect=FileProcessor.process) as process:
+            self._run_extraction(albion_path, output_path)
+            processed = [call.args[1].name for call in process.call_args_list]
+        
+        assert processed == ["achievements.bin"]
+        assert xml_file.exists()
+        assert json_file.stat().st_mtime_ns == json_mtime
+        
+        # Com force, todos os arquivos são processados novamente
+        with patch.object(FileProcessor, 'process', autospec=True, side_effect=FileProcessor.process) as process:
+            self._run_extraction(albion_path, output_path, force=True)
+            assert process.call_count == 3
+        
+        # Arquivos apenas tocados, sem mudança de conteúdo, continuam ignorados
+        os.utime(game_data / "achievements.bin", ns=(0, 0))
+        with patch.object(FileProcessor, 'process', autospec=True, side_effect=FileProcessor.process) as process:
+            self._run_extraction(albion_path, output_path)
+            assert process.call_count == 0
+    
+    def test_listing_cache_follows_added_and_removed_files(self, tmp_path):
+        """Testa se a listagem em cache percebe arquivos novos e removidos entre execuções."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        game_data = albion_path / "game" / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        cache_path = tmp_path / "cache" / "listing.json"
+
+        def run():
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(output_path)
+            self.platform.set_listing_cache(True)
+            with patch.object(Platform, '_listing_cache_path', return_value=cache_path):
+                self.platform.process_bin_files()
+            return json.loads((output_path / "manifest.json").read_text(encoding="utf-8"))["files"]
+
+        assert sorted(run()) == ["achievements.bin", "cluster/achievements_copy.bin", "profanity_en.bin"]
+        assert cache_path.exists()
+
+        (game_data / "cluster" / "achievements_copy.bin").rename(game_data / "cluster" / "renamed.bin")
+        assert sorted(run()) == ["achievements.bin", "cluster/renamed.bin", "profanity_en.bin"]
+        assert (output_path / "xml" / "cluster" / "renamed.xml").exists()
+
+    def test_profile_report(self, tmp_path):
+        """Testa se o modo de perfil gera o relatório por arquivo e por etapa."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        
+        self.platform._initialize()
+        self.platform.set_albion_path(albion_path)
+        self.platform.set_output_path(output_path)
+        # Sem threads de I/O a leitura também é medida como etapa
+        self.platform.set_io_threads(0)
+        self.platform.set_profile(True)
+        self.platform.process_bin_files()
+        
+        report = json.loads((output_path / "profile.json").read_text(encoding="utf-8"))
+        
+        # Todos os arquivos e etapas devem estar no relatório
+        assert report["files_processed"] == 3
+        assert set(report["stages"]) == {"read", "decrypt", "write_xml", "convert_json", "hash"}
+        assert report["slowest_files"][0]["seconds"] > 0
+        assert all(stage["peak_bytes"] > 0 for stage in report["files"]["achievements.bin"])
+        
+        self.platform.set_profile(False)
+    
+    def test_sqlite_export(self, tmp_path):
+        """Testa se a exportação SQLite funciona igual nos modos serial e paralelo."""
+        albion_path = self._create_game_data(tmp_path)
+        counts = {}
+        
+        for workers in (1, 2):
+            output_path = tmp_path / f"output-{workers}"
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(output_path)
+            self.platform.set_workers(workers)
+            self.platform.set_sqlite(True)
+            self.platform.process_bin_files()
+            
+            with sqlite3.connect(output_path / "gamedata.db") as connection:
+                counts[workers] = [
+                    connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                    for table in ("documents", "elements", "attributes")
+                ]
+        
+        # Os 3 documentos são exportados com as mesmas linhas
+        assert counts[1] == counts[2]
+        assert counts[1][0] == 3
+        assert counts[1][1] > 3
+        
+        self.platform.set_sqlite(False)
+    
+    def test_plan_files_hands_manifest_changes_to_the_caller(self, tmp_path, encrypt):
+        """Testa se o planejamento só lê o manifesto anterior e entrega as alterações nos registros."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        self._run_extraction(albion_path, output_path)
+        game_data = self.platform.get_game_data_path()
+        
+        # Mesmo conteúdo com mtime novo e um arquivo alterado
+        touched = game_data / "achievements.bin"
+        stat = touched.stat()
+        os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (game_data / "profanity_en.bin").write_bytes(encrypt(b"<words><word>alterado</word></words>"))
+        
+        previous = Manifest(output_path, self.platform._manifest_settings()).load()
+        plan = self.platform._plan_files(sorted(game_data.rglob("*.bin")), game_data, previous, False, {}, None)
+        planned = {item.key: item for item in plan}
+        
+        assert {key: item.action for key, item in planned.items()} == {
+            "achievements.bin": "unchanged", "cluster/achievements_copy.bin": "unchanged", "profanity_en.bin": "process"
+        }
+        assert planned["achievements.bin"].record["mtime"] == touched.stat().st_mtime_ns
+        assert planned["profanity_en.bin"].task[3] == "profanity_en.bin"
+        
+        # Com o pipeline, o mtime atualizado chega ao manifesto salvo
+        self.platform.process_bin_files()
+        manifest = json.loads((output_path / "manifest.json").read_text(encoding="utf-8"))
+        assert manifest["files"]["achievements.bin"]["mtime"] == touched.stat().st_mtime_ns
+        assert set(manifest["files"]) == set(planned)
+    
+    def test_watch_processes_only_changed_files(self, tmp_path):
+        """Testa se o modo watch reprocessa só os arquivos alterados e esquece os removidos."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        self._run_extraction(albion_path, output_path, io_threads=0)
+        self.platform.set_sqlite(True)
+        self.platform.process_bin_files()
+        game_data = self.platform.get_game_data_path()
+        
+        # Um arquivo alterado e um removido durante a atualização; force garante
+        # o reprocessamento mesmo com o conteúdo igual
+        changed_file = game_data / "cluster" / "achievements_copy.bin"
+        (game_data / "profanity_en.bin").unlink()
+        self.platform.set_force(True)
+        
+        watcher = MagicMock(game_data_path=game_data, backend="polling")
+        watcher.batches.return_value = iter([{changed_file, game_data / "profanity_en.bin", game_data / "notes.txt"}])
+        
+        with patch.object(self.platform._handler, "find_files") as find_files, \
+                patch.object(FileProcessor, "run_task", autospec=True, side_effect=FileProcessor.run_task) as run_task:
+            self.platform.watch_bin_files(watcher)
+        
+        # Sem varrer o GameData e sem tocar em achievements.bin
+        find_files.assert_not_called()
+        assert [call.args[1][3] for call in run_task.call_args_list] == ["cluster/achievements_copy.bin"]
+        watcher.close.assert_called_once()
+        
+        manifest = json.loads((output_path / "manifest.json").read_text(encoding="utf-8"))
+        assert sorted(manifest["files"]) == ["achievements.bin", "cluster/achievements_copy.bin"]
+        with sqlite3.connect(output_path / "gamedata.db") as connection:
+            paths = [row[0] for row in connection.execute("SELECT path FROM documents ORDER BY path")]
+        assert paths == ["achievements.bin", "cluster/achievements_copy.bin"]
+        
+        self.platform.set_force(False)
+        self.platform.set_sqlite(False)
+    
+    def test_both_servers_share_identical_files(self, tmp_path):
+        """Testa se os arquivos iguais entre Live e Test são processados uma vez só e ligados."""
+        albion_path = self._create_game_data(tmp_path)
+        staging = albion_path / "staging" / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        staging.mkdir(parents=True)
+        bin_content = (self.test_data_dir / "achievements.bin").read_bytes()
+        for relative in ["achievements.bin", "staging_only.bin"]:
+            (staging / relative).write_bytes(bin_content)
+        
+        output_path = tmp_path / "output"
+        self.platform._initialize()
+        self.platform.set_albion_path(albion_path)
+        self.platform.set_output_path(output_path)
+        self.platform.set_index(True)
+        self.platform.set_both_servers(True)
+        
+        with patch.object(FileProcessor, "run_task", autospec=True, side_effect=FileProcessor.run_task) as run_task:
+            self.platform.run_extraction()
+        
+        # 3 arquivos do Live e só o exclusivo do Test
+        processed = [call.args[1][3] for call in run_task.call_args_list]
+        assert sorted(processed) == ["achievements.bin", "cluster/achievements_copy.bin", "profanity_en.bin", "staging_only.bin"]
+        assert self.platform._output_path == output_path
+        
+        live_xml = output_path / "live" / "xml" / "achievements.xml"
+        test_xml = output_path / "test" / "xml" / "achievements.xml"
+        assert os.path.samefile(live_xml, test_xml)
+        assert (output_path / "test" / "index" / "achievements.bin.json").stat().st_nlink == 2
+        manifest = json.loads((output_path / "test" / "manifest.json").read_text(encoding="utf-8"))
+        assert sorted(manifest["files"]) == ["achievements.bin", "staging_only.bin"]
+        
+        # Reprocessar o Live não altera os arquivos já ligados no Test
+        self.platform.set_force(True)
+        self.platform.set_both_servers(False)
+        self.platform.set_output_path(output_path / "live")
+        self.platform.process_bin_files()
+        assert not os.path.samefile(live_xml, test_xml)
+        assert live_xml.read_bytes() == test_xml.read_bytes()
+        
+        self.platform.set_force(False)
+        self.platform.set_index(False)
+    
+    def test_store_deduplicates_outputs(self, tmp_path):
+        """Testa se extrações em diretórios diferentes compartilham os blobs do store."""
+        albion_path = self._create_game_data(tmp_path)
+        store_path = tmp_path / "store"
+        
+        for name, workers, io_threads in [("serial", 1, 2), ("inline", 1, 0), ("parallel", 2, 2)]:
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(tmp_path / name)
+            self.platform.set_workers(workers)
+            self.platform.set_io_threads(io_threads)
+            self.platform.set_store(store_path)
+            self.platform.process_bin_files()
+        
+        # Os 3 arquivos têm o mesmo XML; só o JSON de profanity é diferente
+        blobs = [blob for blob in (store_path / "objects").glob("*/*")]
+        assert len(blobs) == 3
+        for relative in ["xml/achievements.xml", "json/cluster/achievements_copy.json", "xml/profanity_en.xml"]:
+            assert os.path.samefile(tmp_path / "serial" / relative, tmp_path / "inline" / relative)
+            assert os.path.samefile(tmp_path / "serial" / relative, tmp_path / "parallel" / relative)
+        
+        # O manifesto guarda o hash de cada saída
+        manifest = json.loads((tmp_path / "serial" / "manifest.json").read_text(encoding="utf-8"))
+        digest = manifest["files"]["achievements.bin"]["outputs"]["xml"]
+        assert os.path.samefile(store_path / "objects" / digest[:2] / digest[2:], tmp_path / "serial" / "xml" / "achievements.xml")
+        
+        self.platform.set_store(None)
+    
+    def test_index_export(self, tmp_path):
+        """Testa se o índice aponta para os elementos dos XML extraídos nos modos serial e paralelo."""
+        from src.index import GameIndex
+        albion_path = self._create_game_data(tmp_path)
+        sizes = {}
+        
+        for workers in (1, 2):
+            output_path = tmp_path / f"output-{workers}"
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(output_path)
+            self.platform.set_workers(workers)
+            self.platform.set_index(True)
+            self.platform.process_bin_files()
+            
+            index = GameIndex(output_path)
+            sizes[workers] = len(index)
+            for entry in index.entries:
+                assert entry.xml_file.exists()
+                assert index.read(entry)
+        
+        assert sizes[1] == sizes[2] > 0
+        
+        # O índice depende da saída XML
+        with pytest.raises(ValueError):
+            self.platform.set_outputs(["json"])
+        self.platform.set_index(False)
+        self.platform.set_outputs(["json"])
+        with pytest.raises(ValueError):
+            self.platform.set_index(True)
+        self.platform.set_outputs(["xml", "json"])
+    
+    def test_outputs_selection_skips_unneeded_work(self, tmp_path):
+        """Testa se cada seleção de saídas grava só os arquivos e etapas necessários."""
+        albion_path = self._create_game_data(tmp_path)
+        stages = {}
+        
+        for outputs in (["xml"], ["json"]):
+            output_path = tmp_path / "-".join(outputs)
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(output_path)
+            self.platform.set_outputs(outputs)
+            self.platform.set_profile(True)
+            
+            with patch("src.utils.Converter.Converter.stream_json", autospec=True, side_effect=Converter.stream_json) as stream_json:
+                self.platform.process_bin_files()
+            
+            # Apenas o diretório da saída selecionada é criado
+            assert sorted(path.name for path in output_path.iterdir() if path.is_dir()) == outputs
+            assert stream_json.call_count == (3 if outputs == ["json"] else 0)
+            stages[outputs[0]] = set(json.loads((output_path / "profile.json").read_text(encoding="utf-8"))["stages"])
+        
+        # XML sem conversão e JSON sem gravação de XML (com perfil a leitura é feita sem threads de E/S)
+        assert stages["xml"] == {"read", "decrypt", "write_xml", "hash"}
+        assert stages["json"] == {"read", "decrypt", "convert_json", "hash"}
+        
+        self.platform.set_profile(False)
+    
+    def test_set_outputs_rejects_invalid(self):
+        """Testa se saídas desconhecidas ou vazias são rejeitadas."""
+        with pytest.raises(ValueError):
+            self.platform.set_outputs(["yaml"])
+        with pytest.raises(ValueError):
+            self.platform.set_outputs([])
+    
+    def test_xml_output_is_decrypted_bytes_without_bom(self, tmp_path):
+        """Testa se o XML gravado é o conteúdo decriptado sem o BOM, idêntico ao texto decodificado."""
+        albion_path = self._create_game_data(tmp_path)
+        output_path = tmp_path / "output"
+        self._run_extraction(albion_path, output_path)
+        
+        decrypted = BinaryDecryptor().decrypt_bin((self.test_data_dir / "achievements.bin").read_bytes())
+        xml = (output_path / "xml" / "achievements.xml").read_bytes()
+        
+        assert decrypted.startswith(codecs.BOM_UTF8)
+        assert xml == decrypted.decode("utf-8-sig").encode("utf-8")
+    
+    @pytest.mark.parametrize("suffix", [
+        ".zip",
+        ".tar.gz",
+        pytest.param(".tar.zst", marks=pytest.mark.skipif(
+            not importlib.util.find_spec("zstandard"), reason="zstandard não instalado")),
+    ])
+    def test_archive_extraction_matches_directory(self, tmp_path, suffix):
+        """Testa se extrair de um snapshot compactado gera a mesma árvore que o diretório."""
+        import tarfile
+        import zipfile
+        
+        albion_path = self._create_game_data(tmp_path)
+        self._run_extraction(albion_path, tmp_path / "directory")
+        expected = sorted(p.relative_to(tmp_path / "directory") for p in (tmp_path / "directory").rglob("*.*ml"))
+        
+        # Snapshot da instalação inteira, com a pasta do servidor
+        archive_path = tmp_path / f"snapshot{suffix}"
+        files = [p for p in albion_path.rglob("*") if p.is_file()]
+        if suffix == ".zip":
+            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for path in files:
+                    archive.write(path, path.relative_to(albion_path).as_posix())
+        elif suffix == ".tar.gz":
+            with tarfile.open(archive_path, "w:gz") as archive:
+                archive.add(albion_path, arcname=".")
+        else:
+            import zstandard
+            with open(archive_path, "wb") as f, zstandard.ZstdCompressor().stream_writer(f) as stream:
+                with tarfile.open(fileobj=stream, mode="w|") as archive:
+                    archive.add(albion_path, arcname=".")
+        
+        for name, workers, io_threads in [("serial", 1, 2), ("inline", 1, 0), ("parallel", 2, 2)]:
+            output_path = tmp_path / name
+            self._run_extraction(archive_path, output_path, workers=workers, io_threads=io_threads)
+            
+            files = sorted(p.relative_to(output_path) for p in output_path.rglob("*.*ml"))
+            assert files == expected
+            for relative in files:
+                assert (output_path / relative).read_bytes() == (tmp_path / "directory" / relative).read_bytes()
+            
+            # A segunda execução usa o manifesto e não lê o arquivo de novo
+            with patch.object(FileProcessor, 'process', autospec=True) as process:
+                self._run_extraction(archive_path, output_path, workers=workers, io_threads=io_threads)
+            assert process.call_count == 0
+    
+    def test_output_archive_matches_directory(self, tmp_path):
+        """Testa se a saída em arquivo compactado tem a mesma árvore da extração em diretório."""
+        import zipfile
+        
+        albion_path = self._create_game_data(tmp_path)
+        self._run_extraction(albion_path, tmp_path / "directory")
+        expected = {
+            p.relative_to(tmp_path / "directory").as_posix(): p.read_bytes()
+            for p in (tmp_path / "directory").rglob("*") if p.is_file() and p.name != "manifest.json"
+        }
+        
+        for name, workers, io_threads in [("serial", 1, 2), ("inline", 1, 0), ("parallel", 2, 2)]:
+            archive_path = tmp_path / f"{name}.zip"
+            self.platform._initialize()
+            self.platform.set_albion_path(albion_path)
+            self.platform.set_output_path(tmp_path / name)
+            self.platform.set_workers(workers)
+            self.platform.set_io_threads(io_threads)
+            self.platform.set_archive_output(str(archive_path))
+            self.platform.process_bin_files()
+            
+            # Nada é gravado no diretório de saída
+            assert not (tmp_path / name).exists()
+            with zipfile.ZipFile(archive_path) as archive:
+                members = {member: archive.read(member) for member in archive.namelist()}
+            
+            manifest = json.loads(members.pop("manifest.json"))
+            assert members == expected
+            assert set(manifest["files"]) == {"achievements.bin", "cluster/achievements_copy.bin", "profanity_en.bin"}
+        
+        # Opções que gravam fora da árvore de saída são recusadas
+        self.platform.set_sqlite(True)
+        with pytest.raises(ValueError):
+            self.platform.process_bin_files()
+        self.platform.set_sqlite(False)
+        self.platform.set_archive_output(None)
+    
+    def test_strings_table_export(self, tmp_path, encrypt):
+        """Testa se localization.bin gera a tabela de textos e se ela entra no manifesto."""
+        from src.utils.StringTable import StringTable
+        
+        albion_path = self._create_game_data(tmp_path)
+        game_data = albion_path / "game" / "Albion-Online_Data" / "StreamingAssets" / "GameData"
+        (game_data / "localization.bin").write_bytes(encrypt(
+            b'<tmx><body><tu tuid="@A"><tuv xml:lang="EN-US"><seg>Bag</seg></tuv></tu></body></tmx>'
+        ))
+        output_path = tmp_path / "output"
+        
+        self.platform._initialize()
+        self.platform.set_albion_path(albion_path)
+        self.platform.set_output_path(output_path)
+        self.platform.set_outputs(["xml"])
+        self.platform.set_strings(True)
+        self.platform.process_bin_files()
+        
+        with StringTable(output_path / StringTable.FILE_NAME) as table:
+            assert table.get("@A", "EN-US") == "Bag"
+        
+        # Sem a tabela, localization.bin é processado de novo
+        (output_path / StringTable.FILE_NAME).unlink()
+        with patch.object(FileProcessor, 'process', autospec=True, side_effect=FileProcessor.process) as process:
+            self.platform.process_bin_files()
+        assert [call.args[1].name for call in process.call_args_list] == ["localization.bin"]
+        assert (output_path / StringTable.FILE_NAME).exists()
+        
+        self.platform.set_strings(False)
@@ -0,0 +1,98 @@
+"""
+Testes para a descoberta de arquivos do GameData no Noki Bin Dumpper.
+Valida a ordem da varredura, o stat carregado pelos caminhos e o cache de listagem.
+"""
+import json
+import os
+import pickle
+
+from src.platforms.scanner import GameDataScanner, ScannedPath
+
+
+def _make_tree(root):
+    """Cria uma árvore pequena com arquivos .bin e de outros tipos."""
+    for relative in ("items.bin", "cluster/b.bin", "cluster/a.bin", "cluster/notes.txt", "zone/deep/c.bin"):
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(relative.encode())
+
+
+def _relative(paths, root):
+    """Converte os caminhos encontrados em caminhos relativos com barras normais."""
+    return [path.relative_to(root).as_posix() for path in paths]
+
+
+class TestGameDataScanner:
+    """Testes para a classe GameDataScanner."""
+
+    def test_scan_yields_matching_files_in_order(self, tmp_path):
+        """Testa se os arquivos são encontrados recursivamente e em ordem de nome."""
+        _make_tree(tmp_path)
+
+        found = list(GameDataScanner().scan(tmp_path, "*.bin"))
+
+        assert _relative(found, tmp_path) == ["items.bin", "cluster/a.bin", "cluster/b.bin", "zone/deep/c.bin"]
+        assert all(isinstance(path, ScannedPath) for path in found)
+
+    def test_scan_is_lazy(self, tmp_path):
+        """Testa se o primeiro arquivo é entregue antes da varredura terminar."""
+        _make_tree(tmp_path)
+
+        files = GameDataScanner().scan(tmp_path)
+        first = next(files)
+        (tmp_path / "zone" / "deep" / "late.bin").write_bytes(b"")
+
+        assert first.name == "items.bin"
+        assert "late.bin" in [path.name for path in files]
+
+    def test_scanned_path_carries_the_walk_stat(self, tmp_path):
+        """Testa se o stat da varredura é reutilizado e descartado ao serializar o caminho."""
+        _make_tree(tmp_path)
+        found = next(GameDataScanner().scan(tmp_path))
+
+        # Alterado depois da varredura: o stat guardado continua o mesmo
+        found.write_bytes(b"changed content")
+        assert found.stat().st_size == len(b"items.bin")
+
+        # Processos de trabalho recebem o caminho sem o stat guardado
+        restored = pickle.loads(pickle.dumps(found))
+        assert restored == found
+        assert restored.stat().st_size == len(b"changed content")
+
+    def test_cached_listing_reuses_unchanged_directories(self, tmp_path):
+        """Testa se diretórios sem alteração vêm do cache e os alterados são relidos."""
+        game_data = tmp_path / "GameData"
+        cache_path = tmp_path / "cache" / "listing.json"
+        _make_tree(game_data)
+        scanner = GameDataScanner(cache_path)
+
+        expected = _relative(scanner.scan(game_data), game_data)
+        assert cache_path.exists()
+
+        # Diretórios reaproveitados não são lidos de novo
+        cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        cache["directories"]["cluster"]["files"].append("ghost.bin")
+        cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+        cached = list(scanner.scan(game_data))
+        assert _relative(cached, game_data) == expected[:3] + ["cluster/ghost.bin"] + expected[3:]
+        assert cached[0].stat().st_size == len(b"items.bin")
+
+        # Um arquivo novo muda o mtime do diretório, que é lido de novo
+        (game_data / "cluster" / "new.bin").write_bytes(b"")
+        stat = os.stat(game_data / "cluster")
+        os.utime(game_data / "cluster", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert _relative(scanner.scan(game_data), game_data) == [
+            "items.bin", "cluster/a.bin", "cluster/b.bin", "cluster/new.bin", "zone/deep/c.bin"
+        ]
+
+    def test_cache_of_another_pattern_is_ignored(self, tmp_path):
+        """Testa se um cache gerado para outro padrão não é usado."""
+        cache_path = tmp_path / "listing.json"
+        game_data = tmp_path / "GameData"
+        _make_tree(game_data)
+
+        list(GameDataScanner(cache_path).scan(game_data, "*.txt"))
+
+        assert _relative(GameDataScanner(cache_path).scan(game_data, "*.bin"), game_data)[0] == "items.bin"
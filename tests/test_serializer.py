@@ -0,0 +1,57 @@
+"""
+Testes para os serializadores JSON do Noki Bin Dumpper.
+Valida os estilos de saída e a equivalência entre os backends.
+"""
+import json
+import pytest
+from pathlib import Path
+
+from src.utils.Converter import Converter
+from src.utils.Serializer import JsonSerializer
+
+XML = '<items version="2"><item id="1">A</item><group/><item id="2"><tag>é</tag></item> fim </items>'
+
+
+class TestJsonSerializer:
+    """Testes para a classe JsonSerializer."""
+    
+    def test_invalid_style(self):
+        """Testa se um estilo desconhecido é rejeitado."""
+        with pytest.raises(ValueError):
+            JsonSerializer("yaml")
+    
+    @pytest.mark.parametrize("backend", [
+        name for name, available in JsonSerializer.available_backends().items() if available
+    ])
+    def test_compact_backends_match(self, backend):
+        """Testa se todos os backends instalados geram a mesma saída compacta."""
+        value = {"a": [1, None, {"b": "ç/\"\n"}], "@c": "x"}
+        
+        assert JsonSerializer("compact", backend).dumps(value) == \
+            json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+    
+    def test_compact_style(self, tmp_path):
+        """Testa se o estilo compacto gera o mesmo documento em uma única linha."""
+        expected = Converter().convert_to_json(XML, Path("items.xml"))
+        json_path = tmp_path / "items.json"
+        
+        Converter(JsonSerializer("compact")).write_json(XML, Path("items.xml"), json_path)
+        content = json_path.read_text(encoding="utf-8")
+        
+        assert "\n" not in content
+        assert content == json.dumps(expected, ensure_ascii=False, separators=(',', ':'))
+    
+    def test_ndjson_style(self, tmp_path):
+        """Testa se o estilo ndjson gera uma linha por registro da raiz."""
+        json_path = tmp_path / "items.ndjson"
+        
+        Converter(JsonSerializer("ndjson")).write_json(XML, Path("items.xml"), json_path)
+        lines = [json.loads(line) for line in json_path.read_text(encoding="utf-8").splitlines()]
+        
+        assert lines == [
+            {"items": {"@version": "2"}},
+            {"item": {"@id": "1", "#text": "A"}},
+            {"group": None},
+            {"item": {"@id": "2", "tag": "é"}},
+            {"#text": "fim"},
+        ]
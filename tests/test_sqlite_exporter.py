@@ -0,0 +1,74 @@
+"""
+Testes para a exportação SQLite do Noki Bin Dumpper.
+Valida as tabelas de elementos e atributos e a substituição de documentos.
+"""
+import sqlite3
+from pathlib import Path
+
+from src.utils.SqliteExporter import SqliteExporter
+
+ITEMS_XML = b"""\xef\xbb\xbf<?xml version="1.0" encoding="utf-8"?>
+<items version="1">
+  <weapon uniquename="T4_MAIN_SWORD" tier="4">
+    <craftingrequirements silver="0">
+      <craftresource uniquename="T4_METALBAR" count="16" />
+    </craftingrequirements>
+  </weapon>
+  <mount uniquename="T3_MOUNT_HORSE" id="42">Cavalo</mount>
+</items>
+"""
+
+
+class TestSqliteExporter:
+    """Testes para a classe SqliteExporter."""
+    
+    def _query(self, db_path: Path, sql: str, *params):
+        """Executa uma consulta em uma conexão separada."""
+        with sqlite3.connect(db_path) as connection:
+            return connection.execute(sql, params).fetchall()
+    
+    def test_export_flattens_elements_and_attributes(self, tmp_path):
+        """Testa se cada elemento e atributo vira uma linha indexada."""
+        db_path = tmp_path / "gamedata.db"
+        exporter = SqliteExporter(db_path)
+        exporter.initialize()
+        
+        assert exporter.export("items.bin", ITEMS_XML) == 5
+        exporter.close()
+        
+        # Busca pelas colunas indexadas de uniquename e id
+        sword = self._query(db_path, "SELECT id, tag, depth FROM elements WHERE uniquename = ?", "T4_MAIN_SWORD")
+        assert [row[1:] for row in sword] == [("weapon", 1)]
+        assert self._query(db_path, "SELECT tag, text FROM elements WHERE ident = ?", "42") == [("mount", "Cavalo")]
+        
+        # Atributos e hierarquia são preservados
+        attributes = self._query(db_path, "SELECT name, value FROM attributes WHERE element_id = ?", sword[0][0])
+        assert attributes == [("uniquename", "T4_MAIN_SWORD"), ("tier", "4")]
+        resource = self._query(
+            db_path,
+            "SELECT p.tag FROM elements e JOIN elements p ON p.id = e.parent_id WHERE e.uniquename = ?",
+            "T4_METALBAR"
+        )
+        assert resource == [("craftingrequirements",)]
+        assert self._query(db_path, "SELECT path, root FROM documents") == [("items.bin", "items")]
+    
+    def test_export_replaces_and_prunes_documents(self, tmp_path):
+        """Testa se reexportar substitui o documento e se prune remove os antigos."""
+        db_path = tmp_path / "gamedata.db"
+        exporter = SqliteExporter(db_path)
+        exporter.initialize()
+        
+        exporter.export("items.bin", ITEMS_XML)
+        exporter.export("items.bin", ITEMS_XML)
+        exporter.export("other.bin", ITEMS_XML)
+        
+        # Documentos que não são XML são guardados sem elementos
+        assert exporter.export("profanity_en.bin", b"palavra1\npalavra2") == 0
+        
+        assert self._query(db_path, "SELECT COUNT(*) FROM elements") == [(10,)]
+        assert exporter.prune(["items.bin", "profanity_en.bin"]) == 1
+        exporter.close()
+        
+        assert self._query(db_path, "SELECT COUNT(*) FROM elements") == [(5,)]
+        assert self._query(db_path, "SELECT COUNT(*) FROM attributes") == [(8,)]
+        assert self._query(db_path, "SELECT path FROM documents ORDER BY path") == [("items.bin",), ("profanity_en.bin",)]
@@ -0,0 +1,78 @@
+"""
+Testes para a tabela de textos de localização do Noki Bin Dumpper.
+Valida a compilação do tmx e as buscas por tag e idioma.
+"""
+import codecs
+
+import pytest
+
+from src.utils.StringTable import StringTable
+
+TMX = codecs.BOM_UTF8 + """<?xml version="1.0" encoding="utf-8"?>
+<tmx version="1.4">
+  <body>
+    <tu tuid="@ITEMS_T4_BAG">
+      <tuv xml:lang="EN-US"><seg>Adept's Bag</seg></tuv>
+      <tuv xml:lang="PT-BR"><seg>Bolsa do Adepto</seg></tuv>
+    </tu>
+    <tu tuid="@ITEMS_T4_BAG_DESC">
+      <tuv xml:lang="EN-US"><seg>Carry &amp; store</seg></tuv>
+    </tu>
+    <tu tuid="@MOB_ÁGUIA">
+      <tuv xml:lang="en-us"><seg>Eagle</seg></tuv>
+      <tuv xml:lang="PT-BR"><seg>Águia</seg></tuv>
+    </tu>
+  </body>
+</tmx>
+""".encode("utf-8")
+
+
+class TestStringTable:
+    """Testes para a classe StringTable."""
+    
+    def test_lookup_by_tag_and_language(self, tmp_path):
+        """Testa se as buscas devolvem o texto de cada idioma e None para o que falta."""
+        path = tmp_path / StringTable.FILE_NAME
+        assert StringTable.compile(memoryview(TMX)[len(codecs.BOM_UTF8):], path) == 3
+        
+        with StringTable(path) as table:
+            assert len(table) == 3
+            assert table.languages == ["EN-US", "PT-BR"]
+            assert table.get("@ITEMS_T4_BAG", "pt-br") == "Bolsa do Adepto"
+            assert table.get("@ITEMS_T4_BAG_DESC") == "Carry & store"
+            assert table.get("@MOB_ÁGUIA", "EN-US") == "Eagle"
+            assert table.get("@ITEMS_T4_BAG_DESC", "PT-BR") is None
+            assert table.get("@ITEMS_T4_BAG", "DE-DE") is None
+            assert table.get("@ITEMS_T5_BAG") is None
+            assert "@ITEMS_T4_BAG" in table and "@ITEMS" not in table
+            assert table.translations("@MOB_ÁGUIA") == {"EN-US": "Eagle", "PT-BR": "Águia"}
+            assert list(table.tags()) == sorted(table.tags(), key=lambda tag: tag.encode("utf-8"))
+    
+    def test_recompile_keeps_open_table_valid(self, tmp_path):
+        """Testa se recompilar não afeta uma tabela já aberta."""
+        path = tmp_path / StringTable.FILE_NAME
+        StringTable.compile(TMX, path)
+        
+        with StringTable(path) as old:
+            StringTable.compile(TMX.replace(b"Eagle", b"Hawk"), path)
+            with StringTable(path) as new:
+                assert old.get("@MOB_ÁGUIA") == "Eagle"
+                assert new.get("@MOB_ÁGUIA") == "Hawk"
+    
+    def test_rejects_other_files(self, tmp_path):
+        """Testa se um arquivo que não é tabela é recusado."""
+        path = tmp_path / "items.xml"
+        path.write_bytes(b"<items/>" * 10)
+        
+        with pytest.raises(ValueError):
+            StringTable(path)
+    
+    @pytest.mark.parametrize("language", ["x-portuguese-brazil", "português"])
+    def test_rejects_unstorable_language_codes(self, tmp_path, language):
+        """Testa se códigos de idioma longos demais ou fora do ASCII são recusados sem gerar a tabela."""
+        path = tmp_path / StringTable.FILE_NAME
+        content = TMX.replace(b'xml:lang="PT-BR"', f'xml:lang="{language}"'.encode("utf-8"))
+        
+        with pytest.raises(ValueError, match="Language code"):
+            StringTable.compile(content, path)
+        assert not path.exists()
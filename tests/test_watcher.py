@@ -0,0 +1,130 @@
+"""
+Testes para o monitoramento do GameData do Noki Bin Dumpper.
+Valida a detecção de arquivos alterados e o agrupamento das escritas.
+"""
+import os
+import sys
+import shutil
+import threading
+
+import pytest
+
+from src.core.Watcher import GameDataWatcher
+
+
+def _collect(watcher, batches, count):
+    """Coleta lotes em uma thread até receber a quantidade esperada."""
+    for batch in watcher.batches():
+        batches.append(batch)
+        if len(batches) == count:
+            watcher.stop()
+
+
+@pytest.mark.parametrize("use_inotify", [
+    pytest.param(True, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify só existe no Linux")),
+    False
+])
+def test_watcher_batches_changes(tmp_path, use_inotify):
+    """Testa se uma rajada de escritas vira um único lote com os .bin alterados e removidos."""
+    (tmp_path / "old.bin").write_bytes(b"antigo")
+    (tmp_path / "keep.bin").write_bytes(b"mantido")
+    watcher = GameDataWatcher(tmp_path, debounce=0.3, poll_interval=0.1, use_inotify=use_inotify)
+    assert watcher.backend == ("inotify" if use_inotify else "polling")
+
+    batches = []
+    thread = threading.Thread(target=_collect, args=(watcher, batches, 1), daemon=True)
+    thread.start()
+
+    # Atualização: arquivo alterado, novo diretório, remoção e arquivo que não é .bin
+    (tmp_path / "old.bin").write_bytes(b"novo conteudo")
+    (tmp_path / "cluster").mkdir()
+    (tmp_path / "cluster" / "new.bin").write_bytes(b"novo")
+    os.remove(tmp_path / "keep.bin")
+    (tmp_path / "readme.txt").write_text("ignorado")
+
+    thread.join(10)
+    watcher.close()
+
+    assert not thread.is_alive()
+    assert batches == [{tmp_path / "old.bin", tmp_path / "cluster" / "new.bin", tmp_path / "keep.bin"}]
+
+
+@pytest.mark.parametrize("use_inotify", [
+    False,
+    pytest.param(True, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify só existe no Linux")),
+])
+def test_watcher_reports_files_of_removed_directories(tmp_path, use_inotify):
+    """Testa se apagar um diretório ou movê-lo para fora da árvore informa os .bin que ele tinha."""
+    game_data = tmp_path / "GameData"
+    for relative in ("cluster/a.bin", "cluster/deep/b.bin", "moved/c.bin", "keep.bin"):
+        (game_data / relative).parent.mkdir(parents=True, exist_ok=True)
+        (game_data / relative).write_bytes(b"conteudo")
+    watcher = GameDataWatcher(game_data, debounce=0.3, poll_interval=0.1, use_inotify=use_inotify)
+
+    batches = []
+    thread = threading.Thread(target=_collect, args=(watcher, batches, 1), daemon=True)
+    thread.start()
+
+    shutil.rmtree(game_data / "cluster")
+    os.rename(game_data / "moved", tmp_path / "outside")
+
+    thread.join(10)
+    watcher.close()
+
+    assert not thread.is_alive()
+    assert batches == [{game_data / "cluster" / "a.bin", game_data / "cluster" / "deep" / "b.bin", game_data / "moved" / "c.bin"}]
+
+
+def test_watcher_stops_without_changes(tmp_path):
+    """Testa se stop encerra a espera mesmo sem nenhuma alteração."""
+    watcher = GameDataWatcher(tmp_path, use_inotify=False, poll_interval=0.1)
+    threading.Timer(0.2, watcher.stop).start()
+
+    assert list(watcher.batches()) == []
+    watcher.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify só existe no Linux")
+def test_watcher_recovers_from_event_overflow(tmp_path):
+    """Testa se a perda de eventos informa os .bin removidos e volta a monitorar diretórios novos."""
+    game_data = tmp_path / "GameData"
+    game_data.mkdir()
+    for name in ("keep.bin", "gone.bin"):
+        (game_data / name).write_bytes(b"conteudo")
+    # Arquivos da extração anterior, como o manifesto os conhece
+    known = {game_data / "keep.bin", game_data / "gone.bin"}
+    watcher = GameDataWatcher(game_data, debounce=0.3, known_files=lambda: known)
+    backend = watcher._backend
+
+    # Alterações cujos eventos se perdem, inclusive a criação do diretório
+    os.remove(game_data / "gone.bin")
+    (game_data / "cluster").mkdir()
+    (game_data / "cluster" / "new.bin").write_bytes(b"novo")
+
+    # A fila do inotify transborda: os eventos pendentes são descartados
+    read = backend.read
+    def overflow(timeout):
+        backend.read = read
+        os.read(backend._fd, backend.READ_SIZE)
+        return backend._parse(backend.EVENT.pack(-1, backend.IN_Q_OVERFLOW, 0, 0))
+    backend.read = overflow
+
+    batches = []
+    thread = threading.Thread(target=_collect, args=(watcher, batches, 2), daemon=True)
+    thread.start()
+
+    for _ in range(100):
+        if batches:
+            break
+        threading.Event().wait(0.1)
+    # O diretório criado durante a perda de eventos também é monitorado
+    (game_data / "cluster" / "later.bin").write_bytes(b"depois")
+
+    thread.join(10)
+    watcher.close()
+
+    assert not thread.is_alive()
+    assert batches == [
+        {game_data / "keep.bin", game_data / "gone.bin", game_data / "cluster" / "new.bin"},
+        {game_data / "cluster" / "later.bin"}
+    ]